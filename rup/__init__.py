@@ -0,0 +1,15 @@
+"""
+Paket dashboard RUP 2026 — dipecah dari app.py supaya setup mahal (compile rule
+ICT, impor pandas/streamlit, cache_resource) hanya berjalan sekali per proses.
+
+  profiling       catatan fase per rerun (ContextVar) untuk panel admin / log / bench
+  helpers         format angka, metric card, export CSV
+  classification  rule ICT (JSON) + engine regex / automaton + store hasil
+  loading         RUP.db → frame ter-enrich, snapshot Parquet, worker
+  sql_backend     backend sqlite / duckdb (SqlView)
+  aggregation     cube, indeks filter, query agregasi
+  search          pencarian FTS5
+  charts          hbar + cache PNG (matplotlib/seaborn diimpor saat perlu)
+  bundle          bundle siap-saji hasil tools/precompute.py
+  ui              halaman Streamlit (main)
+"""
@@ -0,0 +1,299 @@
+"""Cube agregat, indeks filter per nilai, dan query agregasi (pandas / SqlView)."""
+
+import streamlit as st
+import pandas as pd
+import numpy as np
+import os
+import sys
+import hashlib
+import time
+
+from .profiling import phase, record_phase
+from .helpers import LRUCache, is_sql_view
+from .loading import _q
+
+# ═══════════════════════════════════════════════════════════════════════════
+# AGREGASI — OLAP CUBE
+# ═══════════════════════════════════════════════════════════════════════════
+
+CUBE_DIMS = ["Provinsi", "Daerah", "Tipe_Daerah", "KLPD", "Satuan_Kerja",
+             "Jenis_Pengadaan", "Metode", "Pemilihan", "Sektor", "Kategori_ICT"]
+
+
+@st.cache_resource(max_entries=2, show_spinner=False)
+def build_rup_cube(_df, version):
+    """
+    Cube agregat sekali per versi data: Total_Pagu + Jumlah_Paket per kombinasi
+    dimensi. Distinct satker = nunique Satuan_Kerja atas baris cube (satker = dimensi).
+    Dipakai bersama semua sesi (cache_resource) → read-only.
+    """
+    dims = [c for c in CUBE_DIMS if c in _df.columns]
+    with phase("cube.build", len(_df)):
+        return (_df.groupby(dims, observed=True, dropna=False)
+                .agg(Total_Pagu=("Pagu_Rp", "sum"), Jumlah_Paket=("Pagu_Rp", "size"))
+                .reset_index())
+
+
+def cube_top(cube, by, n=None, satker=False):
+    """Total_Pagu + Jumlah_Paket (+ Jumlah_Satker) per `by`, urut Pagu terbesar."""
+    if is_sql_view(cube):
+        by_cols = [by] if isinstance(by, str) else list(by)
+        return cube.group(by, n, satker,
+                          order="Total_Pagu DESC, " + ", ".join(_q(c) for c in by_cols))
+    agg = {"Total_Pagu": ("Total_Pagu", "sum"), "Jumlah_Paket": ("Jumlah_Paket", "sum")}
+    if satker:
+        agg["Jumlah_Satker"] = ("Satuan_Kerja", "nunique")
+    cube = frame_cols(cube, ([by] if isinstance(by, str) else list(by))
+                      + ["Total_Pagu", "Jumlah_Paket"] + (["Satuan_Kerja"] if satker else []))
+    out = (cube.groupby(by, observed=True).agg(**agg)
+           .sort_values("Total_Pagu", ascending=False))
+    if n:
+        out = out.head(n)
+    return out.reset_index()
+
+
+def cube_top_by(cube, parent, child, keys, n=5):
+    """
+    Top-n `child` per nilai `parent` (hanya `keys`) dalam satu groupby dua level
+    + nlargest per grup → {parent: DataFrame[child, Total_Pagu, Jumlah_Paket]}.
+    """
+    if is_sql_view(cube):
+        cube = cube.narrow(parent, keys).group([parent, child])
+    sub = frame_cols(rows_isin(cube, parent, keys), [parent, child, "Total_Pagu", "Jumlah_Paket"])
+    g = (sub.groupby([parent, child], observed=True)
+         .agg(Total_Pagu=("Total_Pagu", "sum"), Jumlah_Paket=("Jumlah_Paket", "sum")))
+    top = g.sort_values("Total_Pagu", ascending=False, kind="stable")
+    top = top.groupby(level=0, observed=True, sort=False).head(n)
+    return {k: d.droplevel(0).reset_index()
+            for k, d in top.groupby(level=0, observed=True, sort=False)}
+
+
+PAKET_COLS = ["Nama_Paket", "Pagu_Rp", "Jenis_Pengadaan", "Metode"]
+
+
+def top_paket_by(df, by, keys, n=10):
+    """Top-n paket (Pagu terbesar) per nilai `by` untuk `keys` — satu pass atas baris mentah."""
+    if is_sql_view(df):
+        df = df.narrow(by, keys).top_rows(by, PAKET_COLS, n)
+    sub = frame_cols(rows_isin(df, by, keys), [by] + PAKET_COLS)
+    top = sub.sort_values("Pagu_Rp", ascending=False, kind="stable")
+    top = top.groupby(by, observed=True, sort=False).head(n)
+    return {k: d[PAKET_COLS] for k, d in top.groupby(by, observed=True, sort=False)}
+
+
+def cube_group(cube, by):
+    """Total_Pagu + Jumlah_Paket per `by`, urut nilai `by`."""
+    if is_sql_view(cube):
+        return cube.group(by)
+    cube = frame_cols(cube, [by, "Total_Pagu", "Jumlah_Paket"])
+    return (cube.groupby(by, observed=True)
+            .agg(Total_Pagu=("Total_Pagu", "sum"), Jumlah_Paket=("Jumlah_Paket", "sum"))
+            .reset_index())
+
+
+def cube_nunique(cube, col):
+    """Jumlah nilai unik (non-null) `col`."""
+    if is_sql_view(cube):
+        return int(cube.read(f"COUNT(DISTINCT {_q(col)}) AS n")["n"].iloc[0])
+    return cube[col].nunique()
+
+
+def rows_isin(frame, col, values):
+    """Baris dengan `col` ∈ `values` (SqlView / RowView; DataFrame → RowView tanpa salinan)."""
+    if is_sql_view(frame) or isinstance(frame, RowView):
+        return frame.narrow(col, values)
+    return RowView(frame, np.flatnonzero(frame[col].isin(values).to_numpy()))
+
+
+def distinct_values(frame, col):
+    """Daftar nilai unik terurut untuk pilihan filter sidebar."""
+    if is_sql_view(frame):
+        vals = frame.domains.get(col) or (set(), False)
+        return sorted(vals[0])
+    return sorted(frame[col].dropna().unique().tolist())
+
+
+def cube_totals(cube):
+    """Angka metric card dari cube: pagu, paket, jumlah satker/KLPD/provinsi."""
+    if is_sql_view(cube):
+        return cube.totals()
+    return {
+        "pagu": cube["Total_Pagu"].sum(),
+        "paket": int(cube["Jumlah_Paket"].sum()),
+        "satker": cube["Satuan_Kerja"].nunique() if "Satuan_Kerja" in cube.columns else 0,
+        "klpd": cube["KLPD"].nunique() if "KLPD" in cube.columns else 0,
+        "provinsi": cube["Provinsi"].nunique(),
+    }
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# FILTER ENGINE — indeks posisi per nilai dimensi
+# ═══════════════════════════════════════════════════════════════════════════
+
+FILTER_DIMS = ["Provinsi", "Tipe_Daerah", "Jenis_Pengadaan", "Metode", "Satuan_Kerja", "Sektor"]
+
+
+@st.cache_resource(max_entries=4, show_spinner=False)
+def build_filter_index(_frame, version, name):
+    """
+    Inverted index sekali per versi data (`name` = "rows" / "cube"):
+    {dimensi: {nilai: posisi baris terurut}}. cache_resource → tidak di-pickle per rerun.
+    """
+    dtype = np.int32 if len(_frame) < 2**31 else np.int64
+    index = {}
+    with phase(f"filter.index.{name}", len(_frame)):
+        for dim in FILTER_DIMS:
+            if dim in _frame.columns:
+                groups = _frame.groupby(dim, observed=True, sort=False).indices
+                index[dim] = {k: v.astype(dtype, copy=False) for k, v in groups.items()}
+    return index
+
+
+def filter_positions(index, n_rows, prov, tipe, jenis, metode, satker, sektor=None):
+    """
+    Posisi baris yang lolos filter sidebar (+ sektor), disusun dari indeks:
+    OR antar nilai terpilih, AND antar dimensi. None = semua baris.
+    Dimensi yang pilihannya mencakup seluruh baris dilewati, sehingga biaya
+    sebanding dengan jumlah baris dari nilai terpilih, bukan ukuran tabel.
+    """
+    sel = [("Provinsi", prov), ("Tipe_Daerah", tipe)]
+    if jenis:
+        sel.append(("Jenis_Pengadaan", jenis))
+    if metode:
+        sel.append(("Metode", metode))
+    if satker:  # Jika user memilih satker spesifik
+        sel.append(("Satuan_Kerja", satker))
+    if sektor:
+        sel.append(("Sektor", [sektor]))
+
+    hits = []
+    for dim, values in sel:
+        if dim not in index:
+            continue
+        arrs = [index[dim][v] for v in set(values) if v in index[dim]]
+        n_hit = sum(len(a) for a in arrs)
+        if n_hit == n_rows:
+            continue
+        if len(arrs) == 1:
+            hits.append(arrs[0])
+        elif arrs:
+            hits.append(np.sort(np.concatenate(arrs)))
+        else:
+            return np.empty(0, dtype=np.int32)
+
+    pos = None
+    for hit in sorted(hits, key=len):
+        pos = hit if pos is None else np.intersect1d(pos, hit, assume_unique=True)
+    return pos
+
+
+class RowView:
+    """
+    Subset baris read-only di atas frame dasar yang dipakai bersama semua sesi
+    (hasil cache) — hanya menyimpan array posisi. Kolom diambil saat dibutuhkan
+    (hanya kolom yang dipakai query itu, hanya baris subset) dan langsung
+    dilepas, jadi yang tertahan per sesi hanya posisi. Padanan SqlView.narrow
+    untuk backend pandas.
+    """
+
+    def __init__(self, base, pos):
+        self.base = base
+        self.pos = pos
+
+    @property
+    def columns(self):
+        return self.base.columns
+
+    @property
+    def empty(self):
+        return len(self.pos) == 0
+
+    def __len__(self):
+        return len(self.pos)
+
+    def __getitem__(self, col):
+        return self.base[col].take(self.pos)
+
+    def frame(self, cols):
+        """DataFrame berisi kolom `cols` saja untuk baris subset (groupby / tabel kecil)."""
+        return pd.DataFrame({c: self[c] for c in cols})
+
+    def narrow(self, col, values):
+        """Subset lanjutan `col` ∈ `values` — tetap posisi atas frame dasar."""
+        return RowView(self.base, self.pos[self[col].isin(values).to_numpy()])
+
+    def iter_rows(self, chunk_rows):
+        """Chunk DataFrame semua kolom (tanpa Row_Hash) untuk export CSV streaming."""
+        idx = [i for i, c in enumerate(self.base.columns) if c != "Row_Hash"]
+        for i in range(0, max(len(self.pos), 1), chunk_rows):
+            yield self.base.iloc[self.pos[i:i + chunk_rows], idx]
+
+
+def take_rows(frame, pos):
+    """Baris `frame` pada posisi `pos` sebagai RowView (None = frame apa adanya); tanpa salinan."""
+    return frame if pos is None else RowView(frame, pos)
+
+
+def frame_cols(frame, cols):
+    """Frame untuk groupby atas `cols`: DataFrame apa adanya, RowView → hanya kolom itu."""
+    return frame.frame(cols) if isinstance(frame, RowView) else frame
+
+
+def apply_filters(frame, index, filters, sektor=None):
+    """Subset filter sidebar (+ sektor): DataFrame via indeks posisi, SqlView via WHERE."""
+    if is_sql_view(frame):
+        return frame.where_filters(*filters, sektor=sektor)
+    return take_rows(frame, filter_positions(index, len(frame), *filters, sektor=sektor))
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# CACHE AGREGASI LINTAS SESI
+# Hasil agregasi per section render (top-10, distribusi, totals, ...) dipakai
+# bersama semua sesi: key = (versi data, state filter ternormalisasi,
+# sektor/tampilan, section). Kombinasi filter populer (semua provinsi, DKI
+# saja, ICT saja) cukup dihitung sekali per proses — hit tidak menyentuh
+# baris maupun cube. Nilai di cache dipakai bersama: jangan dimutasi.
+# ═══════════════════════════════════════════════════════════════════════════
+
+# Batas memori cache agregasi (MB); entri paling lama tidak dipakai dibuang dulu
+RUP_AGG_CACHE_MB = float(os.environ.get("RUP_AGG_CACHE_MB", "64"))
+
+
+def agg_nbytes(obj):
+    """Perkiraan ukuran hasil agregasi (DataFrame / Series / dict / tuple bertingkat)."""
+    if isinstance(obj, pd.DataFrame):
+        return int(obj.memory_usage(index=True, deep=True).sum())
+    if isinstance(obj, pd.Series):
+        return int(obj.memory_usage(index=True, deep=True))
+    if isinstance(obj, dict):
+        return sys.getsizeof(obj) + sum(agg_nbytes(k) + agg_nbytes(v) for k, v in obj.items())
+    if isinstance(obj, (list, tuple)):
+        return sys.getsizeof(obj) + sum(agg_nbytes(v) for v in obj)
+    return sys.getsizeof(obj)
+
+
+@st.cache_resource
+def agg_cache():
+    """Satu LRU per proses (cache_resource → bertahan lintas rerun & sesi)."""
+    return LRUCache(max_bytes=int(RUP_AGG_CACHE_MB * 2**20), sizeof=agg_nbytes)
+
+
+def agg_context(export_ctx, view):
+    """Bagian key cache dari export_ctx (versi data + filter terurut) dan sektor/tampilan."""
+    _, version, filters = export_ctx
+    return version, filters, view
+
+
+def cached_agg(ctx, section, compute):
+    """Hasil `compute()` untuk (ctx, section) lewat agg_cache(); dihitung hanya saat miss."""
+    key = hashlib.sha1(repr((ctx, section)).encode("utf-8")).hexdigest()
+    cache = agg_cache()
+    out = cache.get(key)
+    if out is None:
+        t0 = time.perf_counter()
+        out = compute()
+        record_phase("agg.compute", time.perf_counter() - t0)
+        cache.put(key, out)
+    else:
+        record_phase("agg.cached", 0.0)
+    return out
@@ -0,0 +1,139 @@
+"""Bundle siap-saji per versi data (tools/precompute.py) dan loader-nya untuk boot app."""
+
+import streamlit as st
+import pandas as pd
+import numpy as np
+import os
+import shutil
+import json
+import tempfile
+from datetime import datetime
+
+from . import classification
+from .profiling import phase
+from .charts import chart_cache
+from .loading import SNAPSHOT_ROW_GROUP, bundle_path, remove_old_bundles, snapshot_path
+
+# ═══════════════════════════════════════════════════════════════════════════
+# BUNDLE SIAP-SAJI — HASIL tools/precompute.py
+# Satu folder per versi data (.rup_cache/<db>.<versi>.bundle): frame hasil
+# enrichment, cube, indeks filter, PNG chart tampilan default + manifest.json.
+# Ada bundle → app boot tanpa regex / groupby / matplotlib untuk tampilan awal.
+# ═══════════════════════════════════════════════════════════════════════════
+
+# 2: key PNG chart dari spesifikasi palette ("Reds_r", n), bukan list warna
+# 3: nilai indeks filter disimpan bersama dtype-nya (index_layout)
+BUNDLE_FORMAT = 3
+
+
+def write_rup_bundle(db_path, version, df, cube, indexes, charts):
+    """
+    Tulis bundle versi `version` (indexes = {"rows": ..., "cube": ...} dari
+    build_filter_index). Disusun di folder sementara lalu di-rename → app tidak
+    pernah membaca bundle setengah jadi. Snapshot Parquet versi ini diganti
+    frame di bundle; bundle versi lain dihapus. Return path bundle.
+    """
+    path = bundle_path(db_path, version)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = tempfile.mkdtemp(dir=os.path.dirname(path), prefix=".bundle-")
+    try:
+        os.chmod(tmp, 0o755)  # mkdtemp → 0700; bundle dibaca proses app (user lain)
+        df.to_parquet(os.path.join(tmp, "frame.parquet"), index=False, row_group_size=SNAPSHOT_ROW_GROUP)
+        cube.to_parquet(os.path.join(tmp, "cube.parquet"), index=False)
+        layout = {}
+        for name, index in indexes.items():
+            np.savez(os.path.join(tmp, f"filter_{name}.npz"),
+                     *[arr for groups in index.values() for arr in groups.values()])
+            layout[name] = index_layout(index)
+        os.makedirs(os.path.join(tmp, "charts"))
+        for key, png in charts:
+            with open(os.path.join(tmp, "charts", f"{key}.png"), "wb") as f:
+                f.write(png)
+        manifest = {"format": BUNDLE_FORMAT, "version": version, "rule_hash": classification.ICT_RULE_HASH,
+                    "created": datetime.now().isoformat(timespec="seconds"),
+                    "rows": len(df), "cube_rows": len(cube), "charts": len(charts),
+                    "filter_index": layout}
+        with open(os.path.join(tmp, "manifest.json"), "w", encoding="utf-8") as f:
+            json.dump(manifest, f, ensure_ascii=False)
+        shutil.rmtree(path, ignore_errors=True)
+        os.replace(tmp, path)
+    except BaseException:
+        shutil.rmtree(tmp, ignore_errors=True)
+        raise
+    try:
+        os.remove(snapshot_path(db_path, version))
+    except OSError:
+        pass
+    remove_old_bundles(db_path, version)
+    return path
+
+
+def index_layout(index):
+    """
+    Indeks filter → [{"dim", "dtype", "values"}] untuk manifest (urutan = urutan
+    array di .npz). Nilai dibuat JSON-native; dtype-nya disimpan supaya
+    index_values bisa mengembalikan tipe aslinya (mis. kode satker numerik).
+    """
+    layout = []
+    for dim, groups in index.items():
+        values = pd.Index(list(groups))
+        plain = [v.item() if isinstance(v, np.generic) else v for v in values]
+        plain = [v if v is None or isinstance(v, (str, int, float, bool)) else str(v) for v in plain]
+        layout.append({"dim": dim, "dtype": str(values.dtype), "values": plain})
+    return layout
+
+
+def index_values(spec):
+    """Nilai satu dimensi dari manifest, di-cast kembali ke dtype aslinya."""
+    return list(pd.Index(spec["values"], dtype=object).astype(spec["dtype"]))
+
+
+def load_rup_bundle(db_path, version):
+    """
+    Bundle versi `version` → (frame, cube, {"rows": indeks, "cube": indeks});
+    None jika belum ada / format lain / rusak. Bundle yang belum ada tidak
+    di-cache: begitu tools/precompute.py menulisnya, rerun berikutnya langsung
+    memakainya (key cache ikut mtime manifest, jadi bundle yang ditulis ulang
+    juga terbaca ulang).
+    """
+    try:
+        stamp = os.stat(os.path.join(bundle_path(db_path, version), "manifest.json")).st_mtime_ns
+    except OSError:
+        return None
+    return read_rup_bundle(db_path, version, stamp)
+
+
+@st.cache_resource(max_entries=2, show_spinner=False)
+def read_rup_bundle(db_path, version, stamp):
+    """
+    load_rup_bundle untuk manifest dengan mtime `stamp`; PNG chart langsung
+    mengisi chart_cache(). cache_resource: frame dipakai bersama semua sesi
+    tanpa salinan per rerun.
+    """
+    path = bundle_path(db_path, version)
+    try:
+        with open(os.path.join(path, "manifest.json"), encoding="utf-8") as f:
+            manifest = json.load(f)
+        if manifest.get("format") != BUNDLE_FORMAT or manifest.get("version") != version:
+            return None
+        with phase("load.bundle_read", manifest.get("rows")):
+            df = pd.read_parquet(os.path.join(path, "frame.parquet"))
+            cube = pd.read_parquet(os.path.join(path, "cube.parquet"))
+            indexes = {}
+            for name, layout in manifest["filter_index"].items():
+                with np.load(os.path.join(path, f"filter_{name}.npz")) as arrays:
+                    index = indexes[name] = {}
+                    i = 0
+                    for spec in layout:
+                        groups = index[spec["dim"]] = {}
+                        for value in index_values(spec):
+                            groups[value] = arrays[f"arr_{i}"]
+                            i += 1
+            cache = chart_cache()
+            charts = os.path.join(path, "charts")
+            for name in os.listdir(charts):
+                with open(os.path.join(charts, name), "rb") as f:
+                    cache.put(os.path.splitext(name)[0], f.read())
+    except (ImportError, OSError, ValueError, KeyError, TypeError):
+        return None
+    return df, cube, indexes
@@ -0,0 +1,239 @@
+"""Chart hbar: PNG matplotlib/seaborn (LRU cache lintas sesi) atau spec Vega-Lite di browser."""
+
+import streamlit as st
+import pandas as pd
+import textwrap
+import os
+import hashlib
+import io
+import functools
+
+from .profiling import phase, record_phase
+from .helpers import LRUCache, fmt_rp, fmt_s
+
+# ═══════════════════════════════════════════════════════════════════════════
+# CHART FUNCTION — COMPATIBLE SEABORN 0.12.x
+# ═══════════════════════════════════════════════════════════════════════════
+
+# matplotlib + seaborn (~0,6 dtk impor) baru dimuat saat chart pertama di-render —
+# boot dari bundle / chart yang sudah di cache PNG tidak pernah membutuhkannya.
+# `colors` boleh list warna atau spesifikasi palette ("Reds_r", n) supaya
+# pemanggil tidak perlu seaborn untuk membuat palette.
+
+def palette_colors(colors):
+    """Spesifikasi ("nama palette", n) → list warna seaborn; list warna dikembalikan apa adanya."""
+    if isinstance(colors, tuple) and len(colors) == 2 and isinstance(colors[0], str):
+        import seaborn as sns
+        return sns.color_palette(*colors)
+    return colors
+
+
+def hbar(data, x_col, y_col, title, subtitle, colors, total_universe=None,
+         figsize=(14, 7.5)):
+    """
+    Horizontal bar chart — C-Level standard.
+    TANPA hue dan legend (kompatibel seaborn lama).
+    Teks hitam tebal, angka exact, total semesta.
+    """
+    import matplotlib.pyplot as plt
+    import matplotlib.ticker as mticker
+    import seaborn as sns
+
+    colors = palette_colors(colors)
+    sns.set_theme(style="white")
+    fig, ax = plt.subplots(figsize=figsize)
+    fig.patch.set_facecolor("#FFFFFF")
+    ax.set_facecolor("#FFFFFF")
+
+    d = data.copy()
+    n = len(d)
+    if n == 0:
+        ax.text(0.5, 0.5, "Tidak ada data", ha="center", va="center",
+                fontsize=18, color="#999")
+        return fig
+
+    # Wrap label panjang supaya tidak overlap (astype(str): label kategori → teks biasa)
+    d[y_col] = d[y_col].astype(str).apply(lambda t: "\n".join(textwrap.wrap(t, 40)))
+
+    # Barplot TANPA hue (kompatibel seaborn 0.12.x)
+    sns.barplot(
+        data=d, x=x_col, y=y_col,
+        palette=colors[:n], ax=ax, edgecolor="none",
+    )
+
+    # Title
+    ax.set_title(title, fontsize=22, fontweight="bold", color="#111111",
+                 loc="left", pad=24)
+    if subtitle:
+        ax.text(0, 1.03, subtitle, transform=ax.transAxes,
+                fontsize=13, color="#555555", ha="left", va="bottom")
+
+    # Exact values pada setiap bar
+    mx = d[x_col].max() if n > 0 else 1
+    for i, val in enumerate(d[x_col]):
+        lb = fmt_s(val)
+        if total_universe and total_universe > 0:
+            lb += f"  ({val/total_universe*100:.1f}%)"
+        ax.text(val + mx * 0.012, i, lb,
+                va="center", ha="left",
+                fontsize=13, fontweight="bold", color="#111111")
+
+    # Total semesta annotation
+    if total_universe:
+        ax.text(1.0, -0.07,
+                f"TOTAL SEMESTA: {fmt_rp(total_universe)}",
+                transform=ax.transAxes, fontsize=13, fontweight="bold",
+                color="#ED1C24", ha="right", va="top")
+
+    # Styling
+    ax.set_xlabel("")
+    ax.set_ylabel("")
+    ax.tick_params(axis="y", labelsize=13, labelcolor="#111111", width=0)
+    ax.tick_params(axis="x", labelsize=11, labelcolor="#777777")
+    ax.xaxis.set_major_formatter(mticker.FuncFormatter(lambda x, _: fmt_s(x)))
+    for spine in ["top", "right"]:
+        ax.spines[spine].set_visible(False)
+    ax.spines["bottom"].set_color("#DDD")
+    ax.spines["left"].set_color("#DDD")
+
+    # Extend x-axis supaya label tidak terpotong
+    if mx > 0:
+        ax.set_xlim(0, mx * 1.45)
+
+    plt.tight_layout()
+    return fig
+
+
+# Cache PNG hasil hbar — chart yang sama antar rerun/sesi cukup di-render sekali
+CHART_CACHE_MAX = int(os.environ.get("RUP_CHART_CACHE_MAX", "256"))
+
+
+@st.cache_resource
+def chart_cache():
+    """Satu LRU per proses (cache_resource → bertahan lintas rerun & sesi)."""
+    return LRUCache(CHART_CACHE_MAX)
+
+
+def chart_key(data, x_col, y_col, title, subtitle, colors, total_universe=None,
+              figsize=(14, 7.5)):
+    """Hash isi data agregat + semua parameter tampilan hbar."""
+    h = hashlib.sha1()
+    h.update(pd.util.hash_pandas_object(data[[x_col, y_col]].astype({y_col: str}),
+                                        index=False).values.tobytes())
+    params = (x_col, y_col, title, subtitle,
+              colors if isinstance(colors, tuple) else [tuple(float(v) for v in c) for c in colors],
+              None if total_universe is None else float(total_universe),
+              tuple(figsize))
+    h.update(repr(params).encode("utf-8"))
+    return h.hexdigest()
+
+
+def hbar_png(data, x_col, y_col, title, subtitle, colors, total_universe=None,
+             figsize=(14, 7.5)):
+    """PNG bytes dari hbar (setting savefig sama dengan st.pyplot), via LRU cache."""
+    key = chart_key(data, x_col, y_col, title, subtitle, colors, total_universe, figsize)
+    cache = chart_cache()
+    png = cache.get(key)
+    if png is None:
+        import matplotlib.pyplot as plt
+        with phase("hbar", len(data)):
+            fig = hbar(data, x_col, y_col, title, subtitle, colors, total_universe, figsize)
+            buf = io.BytesIO()
+            fig.savefig(buf, format="png", dpi=200, bbox_inches="tight")
+            plt.close(fig)
+            png = buf.getvalue()
+        cache.put(key, png)
+    else:
+        record_phase("hbar.cached", 0.0, len(data))
+    return png
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# MODE CHART — RUP_CHART_MODE
+# png  : hbar di server (matplotlib → PNG, di-cache) — default, tampilan acuan
+# vega : hanya baris agregat (≤ puluhan) + spec Vega-Lite dikirim ke browser;
+#        browser yang menggambar, server tidak menjalankan matplotlib sama sekali.
+#        Label, angka + persentase, TOTAL SEMESTA & palette sama dengan hbar.
+# ═══════════════════════════════════════════════════════════════════════════
+
+RUP_CHART_MODE = os.environ.get("RUP_CHART_MODE", "png")
+
+# Format sumbu/label = fmt_s (T / M / Jt), sebagai ekspresi Vega
+_VEGA_FMT_S = ("abs({v}) >= 1e12 ? format({v} / 1e12, '.2f') + ' T' : "
+               "abs({v}) >= 1e9 ? format({v} / 1e9, '.1f') + ' M' : "
+               "abs({v}) >= 1e6 ? format({v} / 1e6, '.0f') + ' Jt' : format({v}, ',.0f')")
+
+
+@functools.lru_cache(maxsize=64)
+def palette_hex(spec):
+    """Spesifikasi palette ("Reds_r", n) → tuple warna hex (warna yang sama dengan hbar)."""
+    return tuple(_bar_hex(palette_colors(spec)))
+
+
+def _bar_hex(colors):
+    # sns.barplot men-desaturasi palette (saturation=0.75) — diterapkan juga di sini
+    import seaborn as sns
+    from matplotlib.colors import to_hex
+    return [to_hex(sns.desaturate(c, 0.75)) for c in colors]
+
+
+def hex_colors(colors):
+    """`colors` hbar (spesifikasi palette atau list warna) → warna hex untuk Vega-Lite."""
+    return palette_hex(colors) if isinstance(colors, tuple) else _bar_hex(colors)
+
+
+def hbar_spec(data, x_col, y_col, title, subtitle, colors, total_universe=None,
+              figsize=(14, 7.5)):
+    """Padanan hbar sebagai spec Vega-Lite (dict, data inline)."""
+    n = len(data)
+    height = int(figsize[1] * 60)
+    if n == 0:
+        return {"data": {"values": [{}]}, "height": height,
+                "mark": {"type": "text", "fontSize": 18, "color": "#999"},
+                "encoding": {"text": {"value": "Tidak ada data"}}}
+    colors = hex_colors(colors)
+    values = data[x_col].astype(float).tolist()
+    labels = ["\n".join(textwrap.wrap(t, 40)) for t in data[y_col].astype(str)]
+    texts = [fmt_s(v) + (f"  ({v/total_universe*100:.1f}%)" if total_universe and total_universe > 0 else "")
+             for v in values]
+    mx = max(values)
+    x = {"field": "value", "type": "quantitative", "title": None,
+         "axis": {"labelExpr": _VEGA_FMT_S.format(v="datum.value"), "labelFontSize": 11,
+                  "labelColor": "#777777", "tickCount": 8, "grid": False, "domainColor": "#DDD", "tickColor": "#DDD"}}
+    if mx > 0:
+        x["scale"] = {"domain": [0, mx * 1.45]}
+    if total_universe:
+        x["title"] = f"TOTAL SEMESTA: {fmt_rp(total_universe)}"
+        x["axis"].update(titleColor="#ED1C24", titleFontSize=13, titleFontWeight="bold",
+                         titleAnchor="end", titleAlign="right")
+    y = {"field": "label", "type": "nominal", "sort": None, "title": None,
+         "scale": {"paddingInner": 0.2, "paddingOuter": 0.1},  # lebar bar seaborn = 0.8
+         "axis": {"labelExpr": "split(datum.label, '\\n')", "labelFontSize": 13, "labelColor": "#111111",
+                  "labelLimit": 400, "ticks": False, "domainColor": "#DDD"}}
+    return {
+        "data": {"values": [{"label": lb, "value": v, "text": t} for lb, v, t in zip(labels, values, texts)]},
+        "title": {"text": title, "subtitle": subtitle or "", "anchor": "start", "fontSize": 22,
+                  "fontWeight": "bold", "color": "#111111", "subtitleFontSize": 13,
+                  "subtitleColor": "#555555", "offset": 16},
+        "height": height,
+        "encoding": {"x": x, "y": y},
+        "layer": [
+            {"mark": {"type": "bar"},
+             "encoding": {"color": {"field": "label", "type": "nominal", "legend": None,
+                                    "scale": {"domain": labels, "range": list(colors[:n])}}}},
+            {"mark": {"type": "text", "align": "left", "baseline": "middle", "dx": 6,
+                      "fontSize": 13, "fontWeight": "bold", "color": "#111111"},
+             "encoding": {"text": {"field": "text"}}},
+        ],
+        "config": {"view": {"stroke": None}, "background": "#FFFFFF"},
+    }
+
+
+def show_hbar(*args, **kwargs):
+    """Tampilkan hbar di Streamlit (argumen sama dengan hbar) sesuai RUP_CHART_MODE."""
+    if RUP_CHART_MODE == "vega":
+        with phase("hbar.vega", len(args[0])):
+            spec = hbar_spec(*args, **kwargs)
+        st.vega_lite_chart(spec, use_container_width=True, theme=None)
+    else:
+        st.image(hbar_png(*args, **kwargs), use_container_width=True)
@@ -0,0 +1,412 @@
+"""Klasifikasi ICT: rule JSON, engine regex / automaton token, dan store hasil per rule hash."""
+
+import pandas as pd
+import sqlite3
+import re
+import os
+import hashlib
+import json
+import time
+
+from .profiling import record_phase
+
+# ═══════════════════════════════════════════════════════════════════════════
+# ICT CLASSIFICATION — WHITELIST + BLACKLIST
+# ═══════════════════════════════════════════════════════════════════════════
+
+# Rule di file JSON (default ict_rules.json di root repo, samping app.py, atau RUP_ICT_RULES):
+# {"whitelist": {kategori: [regex, ...]}, "blacklist": [regex, ...]}.
+# Urutan kategori = prioritas. ICT_RULE_HASH (hash isi rule) ikut di versi data,
+# jadi mengubah rule cukup edit file — snapshot & hasil klasifikasi lama tidak dipakai.
+RUP_ICT_RULES = os.environ.get("RUP_ICT_RULES") or os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "ict_rules.json")
+
+
+def load_ict_rules(path):
+    """(whitelist, blacklist, rule_hash) dari file JSON; ValueError jika format / regex salah."""
+    with open(path, encoding="utf-8") as f:
+        raw = json.load(f)
+    whitelist, blacklist = raw.get("whitelist"), raw.get("blacklist", [])
+    if not isinstance(whitelist, dict) or not whitelist or not isinstance(blacklist, list):
+        raise ValueError(f"{path}: butuh 'whitelist' (objek kategori → daftar regex) dan 'blacklist' (daftar)")
+    for pat in [p for pats in whitelist.values() for p in pats] + blacklist:
+        try:
+            re.compile(pat)
+        except (re.error, TypeError) as e:
+            raise ValueError(f"{path}: regex tidak valid {pat!r}: {e}") from None
+    return whitelist, blacklist, rule_set_hash(whitelist, blacklist)
+
+
+def rule_set_hash(whitelist, blacklist):
+    """Hash isi rule (urutan kategori ikut, format file tidak)."""
+    text = json.dumps({"whitelist": whitelist, "blacklist": blacklist}, separators=(",", ":"))
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()[:12]
+
+
+# ICT_WHITELIST, BLACKLIST_PATTERNS, ICT_RULE_HASH dan regex/automaton hasil
+# compile-nya di-set oleh reload_ict_rules() (sekali saat import, lalu dicek
+# ulang setiap rerun) — baca lewat modul (classification.ICT_RULE_HASH), jangan
+# `from ... import`, supaya rule baru langsung terlihat.
+
+
+def classify_ict(nama_paket):
+    """True = ICT, False = Non-ICT."""
+    if pd.isna(nama_paket):
+        return False
+    text = str(nama_paket)
+    return bool(_ict_re.search(text) and not _bl_re.search(text))
+
+
+def get_ict_category(nama_paket):
+    """Return ICT category name or None."""
+    if pd.isna(nama_paket):
+        return None
+    text = str(nama_paket)
+    if _bl_re.search(text):
+        return None
+    for cat, regex in _cat_re.items():
+        if regex.search(text):
+            return cat
+    return None
+
+
+# Engine satu pass: blacklist + tiap kategori jadi named group dalam satu regex.
+# Dicoba di setiap awal kata (semua rule diawali \b) — match yang overlap
+# (mis. "MAINTENANCE NETWORK SECURITY") tetap terlihat per kategori.
+# (_engine_re, _engine_starts, _ict_cats: lihat reload_ict_rules)
+
+
+def classify_ict_text(text):
+    """(Is_ICT, Kategori_ICT) sekaligus — hasil identik classify_ict + get_ict_category."""
+    best = None
+    match = _engine_re.match
+    for w in _engine_starts.finditer(text):
+        m = match(text, w.start())
+        if m is None:
+            continue
+        g = m.lastgroup
+        if g == "bl":
+            return False, None
+        i = int(g[1:])
+        if best is None or i < best:
+            best = i
+    if best is None:
+        return False, None
+    return True, _ict_cats[best]
+
+
+# ── Backend automaton kata (RUP_ICT_ENGINE=automaton, default) ──
+# Semua rule diawali \b, jadi rule literal (\bCCTV\b, \bIP\s+PHONE\b, varian
+# OPTI[CK] / TRACK(ER|ING) / [S]?) cukup dicocokkan per token \w+ lewat trie
+# token: satu lookup dict per token, tidak tergantung jumlah rule. Rule yang
+# butuh lookahead / \s* / kelas karakter lain tetap regex, dan hanya dijalankan
+# jika ada token berawalan literal depannya. Nama non-ASCII → engine regex
+# (IGNORECASE Unicode tidak selalu sama dengan str.upper()).
+RUP_ICT_ENGINE = os.environ.get("RUP_ICT_ENGINE", "automaton")
+
+
+def _expand_word(piece):
+    """'OPTI[CK]' → ['OPTIC', 'OPTIK']; None jika bukan literal sederhana."""
+    out, i = [""], 0
+    while i < len(piece):
+        c = piece[i]
+        if c.isalnum():
+            alts, i = [c], i + 1
+        elif c in "[(":
+            j = piece.find("]" if c == "[" else ")", i)
+            if j < 0:
+                return None
+            body = piece[i + 1:j]
+            alts = list(body) if c == "[" else body.split("|")
+            if not all(a.isalnum() for a in alts):
+                return None
+            i = j + 1
+        else:
+            return None
+        if piece[i:i + 1] == "?":
+            alts, i = alts + [""], i + 1
+        out = [o + a for o in out for a in alts]
+    return [o.upper() for o in out if o]
+
+
+def _expand_literal(pattern):
+    r"""r'\bGPS\s+TRACK(ER|ING)\b' → [('GPS', 'TRACKER'), ('GPS', 'TRACKING')]; None → regex."""
+    if not (pattern.startswith(r"\b") and pattern.endswith(r"\b")):
+        return None
+    seqs = [()]
+    for piece in pattern[2:-2].split(r"\s+"):
+        words = _expand_word(piece)
+        if not words:
+            return None
+        seqs = [s + (w,) for s in seqs for w in words]
+    return seqs
+
+
+def build_ict_automaton(whitelist, blacklist):
+    """
+    (trie, fallback): trie = {token pertama: [(token lanjutan, target)]},
+    fallback = {huruf awal: [(awalan literal, regex, target)]};
+    target "bl" = blacklist, selain itu indeks kategori di `whitelist`.
+    """
+    trie, fallback = {}, {}
+    for target, pats in [("bl", blacklist)] + list(enumerate(whitelist.values())):
+        for pat in pats:
+            seqs = _expand_literal(pat)
+            if seqs is not None:
+                for seq in seqs:
+                    trie.setdefault(seq[0], []).append((seq[1:], target))
+                continue
+            prefix = re.match(r"\\b(\w*)", pat)
+            prefix = prefix.group(1).upper() if prefix else ""
+            # Tanpa awalan literal → dicek di setiap token (key "")
+            fallback.setdefault(prefix[:1], []).append((prefix, re.compile(pat, re.IGNORECASE), target))
+    return trie, fallback
+
+
+_token_split = re.compile(r"(\w+)")
+_rules_stamp = None  # (mtime_ns, size) file rule yang sedang dipakai
+
+
+def reload_ict_rules():
+    """
+    Muat & compile ulang rule jika file RUP_ICT_RULES berubah (cukup satu
+    os.stat per rerun). Return pesan error jika file baru tidak valid — rule
+    lama tetap dipakai; None jika rule terkini sudah aktif.
+    """
+    global ICT_WHITELIST, BLACKLIST_PATTERNS, ICT_RULE_HASH, _rules_stamp
+    global _ict_re, _bl_re, _cat_re, _ict_cats, _engine_re, _engine_starts, _ict_trie, _ict_fallback
+    try:
+        stat = os.stat(RUP_ICT_RULES)
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        if stamp == _rules_stamp:
+            return None
+        whitelist, blacklist, rule_hash = load_ict_rules(RUP_ICT_RULES)
+    except (OSError, ValueError) as e:
+        if _rules_stamp is None:
+            raise  # belum ada rule sama sekali
+        return str(e)
+
+    # Compile regex sekali (performa)
+    all_ict = [p for pats in whitelist.values() for p in pats]
+    _ict_re = re.compile("|".join(all_ict), re.IGNORECASE)
+    _bl_re = re.compile("|".join(blacklist), re.IGNORECASE)
+    # Per-category compiled regex
+    _cat_re = {cat: re.compile("|".join(pats), re.IGNORECASE) for cat, pats in whitelist.items()}
+    _ict_cats = list(whitelist)
+    _engine_re = re.compile(
+        "(?P<bl>" + "|".join(blacklist) + ")|"
+        + "|".join(f"(?P<c{i}>{'|'.join(pats)})" for i, pats in enumerate(whitelist.values())),
+        re.IGNORECASE,
+    )
+    _engine_starts = re.compile(
+        r"\b\w" if all(p.startswith(r"\b") for p in all_ict + blacklist) else r"(?s)."
+    )
+    _ict_trie, _ict_fallback = build_ict_automaton(whitelist, blacklist)
+    ICT_WHITELIST, BLACKLIST_PATTERNS, ICT_RULE_HASH = whitelist, blacklist, rule_hash
+    _rules_stamp = stamp
+    return None
+
+
+reload_ict_rules()
+
+
+def classify_ict_tokens(text):
+    """Padanan classify_ict_text lewat trie token (+ regex hanya untuk rule non-literal)."""
+    trie, fallback, cats = _ict_trie, _ict_fallback, _ict_cats
+    if not text.isascii():
+        return classify_ict_text(text)
+    parts = _token_split.split(text.upper())
+    toks, gaps = parts[1::2], parts[2::2]  # gaps[i] = pemisah setelah token i
+    n = len(toks)
+    best = None
+    pending = set(fallback.get("", ()))  # rule tanpa awalan literal: selalu dicek
+    for i, tok in enumerate(toks):
+        for rest, target in trie.get(tok, ()):
+            if rest:
+                if i + len(rest) >= n:
+                    continue
+                if any(toks[i + j] != w or not gaps[i + j - 1].isspace()
+                       for j, w in enumerate(rest, 1)):
+                    continue
+            if target == "bl":
+                return False, None
+            if best is None or target < best:
+                best = target
+        for rule in fallback.get(tok[0], ()):
+            if tok.startswith(rule[0]):
+                pending.add(rule)
+    if pending:
+        for prefix, regex, target in sorted((r for r in pending if r[2] != "bl"), key=lambda r: r[2]):
+            if best is not None and target >= best:
+                break
+            if regex.search(text):
+                best = target
+        if best is not None and any(r[2] == "bl" and r[1].search(text) for r in pending):
+            return False, None
+    if best is None:
+        return False, None
+    return True, cats[best]
+
+
+def classify_ict_name(text):
+    """(Is_ICT, Kategori_ICT) untuk satu nama, lewat engine RUP_ICT_ENGINE."""
+    if RUP_ICT_ENGINE == "regex":
+        return classify_ict_text(text)
+    return classify_ict_tokens(text)
+
+
+def classify_ict_series(nama_paket, memo=None):
+    """
+    Klasifikasi satu kolom Nama_Paket. Hanya nilai unik yang di-scan
+    (mis. "Belanja Internet" berulang ribuan kali), hasil di-broadcast ke baris.
+    `memo` (dict, opsional) menyimpan hasil antar panggilan — dipakai saat load per chunk.
+    Return (Is_ICT: bool Series, Kategori_ICT: object Series berisi nama/NaN).
+    """
+    uniq = nama_paket.dropna().unique()
+    if memo is None:
+        res = [classify_ict_name(str(v)) for v in uniq]
+    else:
+        missing = [v for v in uniq if v not in memo]
+        resolve = getattr(memo, "resolve", None)  # IctMemo: lewat store persisten
+        if missing and resolve is not None:
+            resolve(missing)
+        else:
+            for v in missing:
+                memo[v] = classify_ict_name(str(v))
+        res = [memo[v] for v in uniq]
+    is_ict = nama_paket.map(pd.Series([r[0] for r in res], index=uniq, dtype=object)).eq(True)
+    kat = nama_paket.map(pd.Series([r[1] for r in res], index=uniq, dtype=object)).astype(object)
+    return is_ict, kat.where(kat.notna())
+
+# ── Hasil klasifikasi persisten per (rule hash, Nama_Paket) ──
+# SQLite di cache_dir (ict_results.sqlite, WAL): dipakai ulang antar restart,
+# worker enrichment & backend. Rule berubah → hasil rule set sebelumnya disalin
+# untuk nama yang tidak cocok dengan satu pun pattern yang ditambah / dihapus /
+# pindah kategori (hasilnya pasti sama); hanya sisanya diklasifikasi ulang.
+ICT_STORE_KEEP = 3  # jumlah rule set terakhir yang hasilnya disimpan
+
+
+class IctMemo(dict):
+    """
+    Memo classify_ict_series yang diisi dari store SQLite `path`: hasil rule aktif
+    + hasil rule set sebelumnya yang masih berlaku dimuat sekali (satu scan per
+    rule set); nama yang belum ada diklasifikasi lalu disimpan.
+    """
+
+    def __init__(self, path):
+        super().__init__()
+        self.path = path
+        self.previous = None
+
+    def load(self):
+        self.previous = {}
+        try:
+            conn = open_ict_store(self.path)
+            try:
+                t0 = time.perf_counter()
+                register_ict_rules(conn)
+                self.update(ict_store_load(conn, ICT_RULE_HASH))
+                self.previous = previous_ict_results(conn, self)
+                record_phase("enrich.ict_store", time.perf_counter() - t0,
+                             len(self) + len(self.previous))
+            finally:
+                conn.close()
+        except (sqlite3.Error, OSError, ValueError):
+            pass  # store hanya akselerasi
+
+    def resolve(self, names):
+        if self.previous is None:
+            self.load()
+        new = {}
+        for v in names:
+            text = str(v)
+            res = self.get(text)
+            if res is None:
+                res = new[text] = self.previous.get(text) or classify_ict_name(text)
+            self[v] = res
+        if new:
+            try:
+                conn = open_ict_store(self.path)
+                try:
+                    ict_store_save(conn, new)
+                finally:
+                    conn.close()
+            except (sqlite3.Error, OSError):
+                pass
+
+
+def open_ict_store(path):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    conn = sqlite3.connect(path, timeout=30)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.executescript("""
+        CREATE TABLE IF NOT EXISTS ict_rules (
+            rule_hash TEXT PRIMARY KEY, rules TEXT NOT NULL, used REAL NOT NULL);
+        CREATE TABLE IF NOT EXISTS ict_result (
+            rule_hash TEXT NOT NULL, nama TEXT NOT NULL,
+            is_ict INTEGER NOT NULL, kategori TEXT,
+            PRIMARY KEY (rule_hash, nama)) WITHOUT ROWID;
+    """)
+    return conn
+
+
+def ict_store_load(conn, rule_hash):
+    """Semua hasil tersimpan untuk `rule_hash` — satu range scan primary key."""
+    rows = conn.execute("SELECT nama, is_ict, kategori FROM ict_result WHERE rule_hash = ?",
+                        (rule_hash,))
+    return {n: (bool(i), k) for n, i, k in rows}
+
+
+def changed_ict_patterns(old_wl, old_bl, new_wl, new_bl):
+    """
+    Pattern yang ditambah / dihapus / pindah target antara dua rule set, atau
+    None jika urutan kategori yang ada di keduanya berubah (prioritas lain).
+    """
+    if [c for c in old_wl if c in new_wl] != [c for c in new_wl if c in old_wl]:
+        return None
+
+    def pairs(wl, bl):
+        return {(None, p) for p in bl} | {(c, p) for c, pats in wl.items() for p in pats}
+    return sorted({p for _, p in pairs(old_wl, old_bl) ^ pairs(new_wl, new_bl)})
+
+
+def previous_ict_results(conn, current=()):
+    """
+    Hasil rule set tersimpan lain yang paling dekat (pattern berubah paling
+    sedikit) untuk nama di luar `current` yang tidak cocok dengan pattern mana
+    pun yang berubah — hasilnya pasti sama di rule aktif.
+    """
+    best = None
+    for rule_hash, rules in conn.execute("SELECT rule_hash, rules FROM ict_rules WHERE rule_hash != ? "
+                                         "ORDER BY used DESC", (ICT_RULE_HASH,)):
+        old = json.loads(rules)
+        changed = changed_ict_patterns(old["whitelist"], old["blacklist"], ICT_WHITELIST, BLACKLIST_PATTERNS)
+        if changed is not None and (best is None or len(changed) < len(best[1])):
+            best = rule_hash, changed
+    if best is None:
+        return {}
+    rule_hash, changed = best
+    touched = re.compile("|".join(changed), re.IGNORECASE).search if changed else None
+    return {t: r for t, r in ict_store_load(conn, rule_hash).items()
+            if t not in current and not (touched and touched(t))}
+
+
+def register_ict_rules(conn):
+    """Catat rule aktif (+ waktu dipakai); hasil rule set di luar ICT_STORE_KEEP terakhir dihapus."""
+    rules = json.dumps({"whitelist": ICT_WHITELIST, "blacklist": BLACKLIST_PATTERNS})
+    with conn:
+        conn.execute("INSERT INTO ict_rules VALUES (?, ?, ?) "
+                     "ON CONFLICT(rule_hash) DO UPDATE SET used = excluded.used",
+                     (ICT_RULE_HASH, rules, time.time()))
+        stale = [h for (h,) in conn.execute(
+            "SELECT rule_hash FROM ict_rules ORDER BY used DESC LIMIT -1 OFFSET ?", (ICT_STORE_KEEP,))]
+        for h in stale:
+            conn.execute("DELETE FROM ict_result WHERE rule_hash = ?", (h,))
+            conn.execute("DELETE FROM ict_rules WHERE rule_hash = ?", (h,))
+
+
+def ict_store_save(conn, results):
+    """Simpan hasil klasifikasi di bawah rule aktif (nama yang sudah ada dibiarkan)."""
+    with conn:
+        conn.executemany("INSERT OR IGNORE INTO ict_result VALUES (?, ?, ?, ?)",
+                         ((ICT_RULE_HASH, t, int(i), k) for t, (i, k) in results.items()))
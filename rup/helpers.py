@@ -0,0 +1,220 @@
+"""Format angka/Rupiah, metric card, export CSV, dan helper kecil lintas modul."""
+
+import pandas as pd
+import os
+import glob
+import hashlib
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+
+from .profiling import RUP_PROFILE_LOG, export_timings, profile_records, record_phase, write_profile_log
+
+# ═══════════════════════════════════════════════════════════════════════════
+# HELPER FUNCTIONS
+# ═══════════════════════════════════════════════════════════════════════════
+
+def fmt_rp(v):
+    """Format Rupiah."""
+    if pd.isna(v) or v == 0:
+        return "Rp 0"
+    a = abs(v)
+    if a >= 1e12: return f"Rp {v/1e12:,.2f} T"
+    if a >= 1e9:  return f"Rp {v/1e9:,.2f} M"
+    if a >= 1e6:  return f"Rp {v/1e6:,.1f} Jt"
+    return f"Rp {v:,.0f}"
+
+
+def fmt_s(v):
+    """Format singkat chart."""
+    if pd.isna(v) or v == 0:
+        return "0"
+    a = abs(v)
+    if a >= 1e12: return f"{v/1e12:.2f} T"
+    if a >= 1e9:  return f"{v/1e9:.1f} M"
+    if a >= 1e6:  return f"{v/1e6:.0f} Jt"
+    return f"{v:,.0f}"
+
+
+def fmt_n(v):
+    """Format angka ribuan."""
+    if pd.isna(v):
+        return "0"
+    return f"{int(v):,}".replace(",", ".")
+
+
+def mc_html(lb, vl, sb=""):
+    """Render metric card HTML."""
+    s = f'<div class="sb">{sb}</div>' if sb else ""
+    return f'<div class="mc"><div class="lb">{lb}</div><div class="vl">{vl}</div>{s}</div>'
+
+
+def is_sql_view(obj):
+    """
+    True untuk SqlView (backend sqlite/duckdb). Dicek lewat nama class supaya
+    modul ini tidak perlu mengimpor sql_backend.
+    """
+    return type(obj).__name__ == "SqlView"
+
+
+def profile_rows(frame):
+    """Jumlah baris untuk catatan fase — dihitung hanya saat profiling aktif (SqlView: tanpa query)."""
+    if profile_records() is None:
+        return None
+    return frame.n_rows if is_sql_view(frame) else len(frame)
+
+
+class LRUCache:
+    """
+    LRU thread-safe sederhana, dipakai bersama oleh semua sesi di proses ini.
+    Dibatasi jumlah entri dan/atau total ukuran (`max_bytes`, ukuran tiap nilai
+    dari `sizeof`); hit / miss / eviction dihitung untuk panel profiling.
+    """
+
+    def __init__(self, max_entries=None, max_bytes=None, sizeof=len):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.sizeof = sizeof
+        self.nbytes = 0
+        self.hits = self.misses = self.evictions = 0
+        self._data = OrderedDict()  # key → (nilai, ukuran)
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            if key not in self._data:
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return self._data[key][0]
+
+    def put(self, key, value):
+        size = self.sizeof(value)
+        with self._lock:
+            if self.max_bytes is not None and size > self.max_bytes:
+                return  # lebih besar dari seluruh batas — tidak disimpan
+            old = self._data.pop(key, None)
+            if old is not None:
+                self.nbytes -= old[1]
+            self._data[key] = (value, size)
+            self.nbytes += size
+            while ((self.max_entries is not None and len(self._data) > self.max_entries)
+                   or (self.max_bytes is not None and self.nbytes > self.max_bytes)):
+                _, (_, old_size) = self._data.popitem(last=False)
+                self.nbytes -= old_size
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self.nbytes = 0
+
+    def items(self):
+        with self._lock:
+            return [(k, v) for k, (v, _) in self._data.items()]
+
+    def stats(self):
+        """Angka pemantauan: entri, ukuran, batas, hit / miss / eviction sejak proses mulai."""
+        with self._lock:
+            return {"entries": len(self._data), "bytes": self.nbytes, "max_bytes": self.max_bytes,
+                    "hits": self.hits, "misses": self.misses, "evictions": self.evictions}
+
+
+def write_csv(df, path, chunk_rows=100_000):
+    """
+    Tulis CSV ke disk per chunk (tidak pernah satu string/bytes besar di memori).
+    `df` boleh SqlView (baris di-stream dari SQLite) atau RowView (chunk diambil
+    dari frame dasar per posisi) — keduanya punya iter_rows.
+    """
+    if hasattr(df, "iter_rows"):
+        chunks = df.iter_rows(chunk_rows)
+    else:
+        df = df.drop(columns=["Row_Hash"], errors="ignore")
+        chunks = (df.iloc[i:i + chunk_rows] for i in range(0, max(len(df), 1), chunk_rows))
+    t0, n = time.perf_counter(), 0
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8", newline="") as f:
+            for i, chunk in enumerate(chunks):
+                chunk.to_csv(f, header=(i == 0), index=False)
+                n += len(chunk)
+        os.replace(tmp, path)
+    except BaseException:
+        # Gagal di tengah → jangan tinggalkan *.tmp (evict_exports hanya mengurus *.csv)
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+    record_phase("to_csv", time.perf_counter() - t0, n)
+    return n
+
+
+# Jumlah file CSV export yang disimpan (LRU — paling lama tidak dipakai dihapus)
+EXPORT_CACHE_MAX = int(os.environ.get("RUP_EXPORT_CACHE_MAX", "16"))
+# File yang dibuat / dipakai dalam rentang ini (detik) tidak di-evict: sesi lain
+# mungkin baru saja menemukannya dan sedang akan membacanya
+EXPORT_GRACE_S = 60
+
+
+def csv_export(export_ctx, kind, make_frame):
+    """
+    Callable untuk st.download_button(data=...): CSV baru dibuat saat tombol
+    diklik, lalu di-cache di disk per (versi data, state filter, jenis export).
+    export_ctx = (folder export, versi data, state filter);
+    make_frame = fungsi tanpa argumen yang mengembalikan DataFrame yang diekspor.
+    CSV ditulis ke disk per chunk (pembuatan tidak pernah memegang seluruh CSV),
+    tapi callable mengembalikan bytes isinya: Streamlit membaca data download
+    apa pun (termasuk file object) utuh ke memori media file manager, dan file
+    object hasil callable tidak pernah ditutupnya — jadi bytes + file langsung ditutup.
+    """
+    export_dir, version, filters = export_ctx
+    key = hashlib.sha1(repr((version, filters, kind)).encode("utf-8")).hexdigest()
+    path = os.path.join(export_dir, f"{key}.csv")
+    # Callable dijalankan saat klik, di luar rerun → deque sesi ini diambil sekarang
+    timings = export_timings() if profile_records() is not None else None
+
+    def build():
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+        except FileNotFoundError:
+            pass  # belum ada, atau baru saja di-evict sesi lain → dibuat ulang
+        else:
+            try:
+                os.utime(path)  # tandai baru dipakai (LRU)
+            except OSError:
+                pass
+            return data
+        os.makedirs(export_dir, exist_ok=True)
+        t0 = time.perf_counter()
+        n = write_csv(make_frame(), path)
+        if timings is not None:
+            rec = {"phase": f"to_csv.{kind}", "seconds": time.perf_counter() - t0, "rows": n}
+            timings.append(rec)
+            if RUP_PROFILE_LOG:
+                write_profile_log(RUP_PROFILE_LOG, [rec], rec["seconds"], {"deferred": "download"})
+        evict_exports(export_dir)
+        with open(path, "rb") as f:  # baru ditulis → masih dalam masa tenggang
+            return f.read()
+
+    return build
+
+
+def evict_exports(export_dir):
+    """Hapus CSV export paling lama tidak dipakai di luar EXPORT_CACHE_MAX (kecuali yang masih dalam masa tenggang)."""
+    files = []
+    for p in glob.glob(os.path.join(export_dir, "*.csv")):
+        try:
+            files.append((os.path.getmtime(p), p))
+        except OSError:
+            pass  # dihapus sesi lain di tengah jalan
+    cutoff = time.time() - EXPORT_GRACE_S
+    for mtime, old in sorted(files)[:max(len(files) - EXPORT_CACHE_MAX, 0)]:
+        if mtime < cutoff:
+            try:
+                os.remove(old)
+            except OSError:
+                pass
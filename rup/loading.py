@@ -0,0 +1,697 @@
+"""Load RUP.db → frame ter-enrich: snapshot Parquet, enrichment inkremental, worker paralel."""
+
+import streamlit as st
+import pandas as pd
+import numpy as np
+import sqlite3
+import re
+import os
+import glob
+import shutil
+import threading
+import time
+import contextvars
+import multiprocessing as mp
+import queue
+from collections import OrderedDict
+from pandas.api.types import union_categoricals
+
+from . import classification
+from .profiling import phase, profile_records, record_phase, start_profile, timed_iter
+from .classification import IctMemo, classify_ict_series
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# LOAD DATA
+# ═══════════════════════════════════════════════════════════════════════════
+
+# Naikkan jika logika enrichment berubah → snapshot lama otomatis tidak dipakai
+SNAPSHOT_FORMAT = 5
+RUP_CACHE_DIR = os.environ.get("RUP_CACHE_DIR", "")
+SNAPSHOT_ROW_GROUP = 128_000
+# Refresh harian: enrichment hanya untuk paket baru/berubah — DB sumber tetap dibaca &
+# di-hash penuh (SiRUP tanpa penanda perubahan); RUP_INCREMENTAL=0 untuk full
+RUP_INCREMENTAL = os.environ.get("RUP_INCREMENTAL", "1") != "0"
+# Proses worker untuk enrichment per chunk (1 = serial, 0 = semua core)
+RUP_WORKERS = int(os.environ.get("RUP_WORKERS", "1"))
+
+
+def db_version(db_path):
+    """Versi data: ukuran + mtime RUP.db (berubah setiap kali DB ditulis) + hash rule ICT."""
+    stat = os.stat(db_path)
+    return f"v{SNAPSHOT_FORMAT}-{stat.st_size}-{stat.st_mtime_ns}-{classification.ICT_RULE_HASH}"
+
+
+def cache_dir(db_path):
+    """Folder cache di samping RUP.db (atau RUP_CACHE_DIR jika di-set)."""
+    return RUP_CACHE_DIR or os.path.join(os.path.dirname(os.path.abspath(db_path)), ".rup_cache")
+
+
+def snapshot_path(db_path, version):
+    base = os.path.splitext(os.path.basename(db_path))[0]
+    return os.path.join(cache_dir(db_path), f"{base}.{version}.parquet")
+
+
+def ict_store_path(db_path):
+    return os.path.join(cache_dir(db_path), "ict_results.sqlite")
+
+
+def write_snapshot(df, db_path, version):
+    """Simpan frame hasil enrichment ke Parquet, hapus snapshot versi lama."""
+    path = snapshot_path(db_path, version)
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = path + ".tmp"
+        # Row group kecil → scan paralel per row group (mis. engine duckdb)
+        df.to_parquet(tmp, index=False, row_group_size=SNAPSHOT_ROW_GROUP)
+        os.replace(tmp, path)
+    except (ImportError, OSError, ValueError, TypeError):
+        # Snapshot hanya akselerasi — tanpa pyarrow / disk read-only tetap jalan
+        return
+    base = os.path.splitext(os.path.basename(db_path))[0]
+    for old in glob.glob(os.path.join(os.path.dirname(path), f"{base}.*.parquet")):
+        if old != path:
+            try:
+                os.remove(old)
+            except OSError:
+                pass
+    remove_old_bundles(db_path, version)
+
+
+def bundle_path(db_path, version):
+    base = os.path.splitext(os.path.basename(db_path))[0]
+    return os.path.join(cache_dir(db_path), f"{base}.{version}.bundle")
+
+
+def remove_old_bundles(db_path, version):
+    """Hapus bundle versi lain untuk DB ini."""
+    base = os.path.splitext(os.path.basename(db_path))[0]
+    current = bundle_path(db_path, version)
+    for old in glob.glob(os.path.join(cache_dir(db_path), f"{base}.*.bundle")):
+        if old != current:
+            shutil.rmtree(old, ignore_errors=True)
+
+
+@st.cache_resource(max_entries=2, show_spinner=False)
+def load_rup_data(db_path, version):
+    """
+    Load RUP data. Pakai snapshot Parquet jika versi DB sama,
+    selain itu baca ulang SQLite + enrichment lalu tulis snapshot baru.
+    `version` = db_version(db_path), sekaligus key cache Streamlit.
+    Frame dipakai bersama semua sesi (cache_resource, tanpa salinan) → read-only.
+    """
+    path = snapshot_path(db_path, version)
+    if os.path.exists(path):
+        try:
+            with phase("load.snapshot_read"):
+                return pd.read_parquet(path)
+        except (ImportError, OSError, ValueError):
+            pass
+    return build_rup_frame(db_path, version)
+
+
+def build_rup_frame(db_path, version):
+    """Baca SQLite per chunk + enrichment (incremental jika bisa), tulis snapshot."""
+    prev = previous_snapshot(db_path, version) if RUP_INCREMENTAL else None
+    workers = enrich_workers()
+    parts = list(enrich_chunks(rup_chunk_sources(db_path, workers), prev=prev, workers=workers,
+                               ict_store=ict_store_path(db_path)))
+    if not parts:
+        return pd.DataFrame()
+
+    with phase("load.concat"):
+        df = concat_rup_parts(parts)
+    del parts
+    if df.empty:
+        return df
+    with phase("load.snapshot_write", len(df)):
+        write_snapshot(df, db_path, version)
+    return df
+
+
+def enrich_chunk(raw, prev=None, ict_memo=None, hash_rows=True):
+    """Satu chunk mentah → Row_Hash + enrichment (incremental jika ada `prev`) + compact."""
+    if hash_rows:
+        with phase("load.row_hash", len(raw)):
+            raw["Row_Hash"] = row_hash(raw)
+    if prev is not None:
+        part = enrich_incremental(raw, prev, ict_memo)
+    else:
+        part = enrich_rup_frame(raw, ict_memo)
+    with phase("load.compact", len(part)):
+        return compact_rup_frame(part)
+
+
+def enrich_workers():
+    """Jumlah worker efektif (RUP_WORKERS; 0 = semua core)."""
+    n = RUP_WORKERS if RUP_WORKERS > 0 else (os.cpu_count() or 1)
+    return max(n, 1)
+
+
+def worker_context():
+    """
+    Konteks multiprocessing untuk worker enrichment: forkserver jika ada,
+    selain itu spawn — jangan fork langsung dari proses server Streamlit yang
+    multithread (lock logging / cache / koneksi SQLite milik thread lain bisa
+    ikut tersalin dalam keadaan terkunci → deadlock). Worker cukup mengimpor
+    rup.loading; forkserver mem-preload modul itu sekali, worker berikutnya
+    di-fork dari proses server yang bersih (single-thread).
+    """
+    if "forkserver" in mp.get_all_start_methods():
+        ctx = mp.get_context("forkserver")
+        ctx.set_forkserver_preload(["rup.loading"])
+        return ctx
+    return mp.get_context("spawn")
+
+
+def enrich_chunks(chunks, prev=None, workers=1, hash_rows=True, ict_store=None):
+    """
+    enrich_chunk untuk setiap chunk (DataFrame atau query dari
+    rup_chunk_queries), di-yield sesuai urutan input. `ict_store` = path store
+    hasil klasifikasi (ict_store_path), None = klasifikasi tanpa store.
+    workers > 1: chunk dikerjakan proses worker (_enrich_worker, lihat
+    worker_context) — yang lewat pipe hanya query chunk, `prev` (di-pickle
+    sebagai path) dan hasil enrichment; nomor chunk menjaga urutan output
+    tetap sama dengan serial.
+    """
+    if workers <= 1:
+        ict_memo = ict_memo_for(ict_store)
+        for raw in chunks:
+            yield enrich_chunk(raw, prev, ict_memo, hash_rows)
+        return
+
+    ctx = worker_context()
+    tasks, results = ctx.Queue(maxsize=workers), ctx.Queue()
+    procs = [ctx.Process(target=_enrich_worker, daemon=True,
+                         args=(tasks, results, prev, hash_rows, ict_store, profile_records() is not None,
+                               classification.ICT_RULE_HASH))
+             for _ in range(workers)]
+    for proc in procs:
+        proc.start()
+
+    def feed():
+        # Thread: baca SQLite sambil worker bekerja; tasks terbatas → memori terkendali
+        n = 0
+        try:
+            for raw in chunks:
+                tasks.put((n, raw))
+                n += 1
+            results.put(("count", n, None, None))
+        except BaseException as e:
+            results.put(("error", n, f"{type(e).__name__}: {e}", None))
+        finally:
+            for _ in procs:
+                tasks.put(None)
+
+    # Konteks rerun ikut ke thread → fase load.read tercatat di list rerun ini
+    feeder = threading.Thread(target=contextvars.copy_context().run, args=(feed,), daemon=True)
+    feeder.start()
+    pending, total, i = {}, None, 0
+    try:
+        while total is None or i < total:
+            try:
+                kind, k, payload, records = results.get(timeout=1)
+            except queue.Empty:
+                # Worker mati tanpa sempat melapor (mis. gagal impor / di-kill)
+                dead = [p.exitcode for p in procs if p.exitcode not in (None, 0)]
+                if dead:
+                    raise RuntimeError(f"Worker enrichment berhenti (exit code {dead[0]})") from None
+                continue
+            if kind == "error":
+                raise RuntimeError(f"Enrichment chunk {k} gagal: {payload}")
+            if kind == "count":
+                total = k
+                continue
+            if records and profile_records() is not None:
+                profile_records().extend(records)
+            pending[k] = payload
+            while i in pending:
+                yield pending.pop(i)
+                i += 1
+    finally:
+        for proc in procs:
+            proc.join(timeout=5)
+            if proc.is_alive():
+                proc.terminate()
+        feeder.join(timeout=5)
+
+
+def _enrich_worker(tasks, results, prev, hash_rows, ict_store, profile, rule_hash):
+    """Loop proses worker: (nomor, chunk / query chunk) → ("part", nomor, hasil, catatan fase)."""
+    # Modul di-preload forkserver bisa memegang rule lama → cek ulang file rule
+    classification.reload_ict_rules()
+    if classification.ICT_RULE_HASH != rule_hash:
+        results.put(("error", "-", f"rule ICT worker ({classification.ICT_RULE_HASH}) "
+                                   f"beda dengan proses utama ({rule_hash})", None))
+        return
+    ict_memo = ict_memo_for(ict_store)
+    while True:
+        item = tasks.get()
+        if item is None:
+            return
+        k, raw = item
+        records = start_profile(profile)
+        try:
+            if not isinstance(raw, pd.DataFrame):  # query rowid → baca sendiri
+                t0 = time.perf_counter()
+                raw = read_rup_chunk(*raw)
+                record_phase("load.read", time.perf_counter() - t0, len(raw))
+            part = enrich_chunk(raw, prev, ict_memo, hash_rows)
+        except BaseException as e:
+            results.put(("error", k, f"{type(e).__name__}: {e}", None))
+            return
+        results.put(("part", k, part, records))
+
+
+def ict_memo_for(ict_store):
+    """Memo Nama_Paket antar chunk (nama yang sama cukup di-scan sekali), lewat store jika ada."""
+    return IctMemo(ict_store) if ict_store else {}
+
+
+def row_hash(raw):
+    """Hash per baris atas semua kolom sumber — deteksi paket yang berubah."""
+    return pd.util.hash_pandas_object(raw, index=False).astype("uint64")
+
+
+def previous_snapshot(db_path, version):
+    """
+    Snapshot terbaru dari versi DB sebelumnya (format sama; Parquet biasa atau
+    frame di bundle precompute) sebagai PreviousSnapshot — isinya belum dibaca.
+    None jika tidak ada / tidak punya ID_RUP + Row_Hash.
+    """
+    base = os.path.splitext(os.path.basename(db_path))[0]
+    pattern = os.path.join(cache_dir(db_path), f"{base}.v{SNAPSHOT_FORMAT}-*")
+    current = (snapshot_path(db_path, version), os.path.join(bundle_path(db_path, version), "frame.parquet"))
+    olds = [p for p in glob.glob(pattern + ".parquet") + glob.glob(os.path.join(pattern + ".bundle", "frame.parquet"))
+            if p not in current]
+    for path in sorted(olds, key=os.path.getmtime, reverse=True):
+        try:
+            import pyarrow.parquet as pq
+            names = pq.read_schema(path).names
+        except (ImportError, OSError, ValueError):
+            continue
+        if "ID_RUP" not in names or "Row_Hash" not in names:
+            return None
+        stem = os.path.dirname(path) if path.endswith(".bundle" + os.sep + "frame.parquet") else path
+        # Rule ICT berubah: baris lama yang dipakai ulang diklasifikasi ulang
+        # (lewat store → hanya nama yang tersentuh pattern berubah di-scan)
+        reclassify = (not os.path.splitext(stem)[0].endswith(f"-{classification.ICT_RULE_HASH}")
+                      and "Nama_Paket" in names)
+        return PreviousSnapshot(path, reclassify)
+    return None
+
+
+class PreviousSnapshot:
+    """
+    Snapshot versi sebelumnya untuk enrichment inkremental, tanpa dimuat utuh
+    di samping frame baru: di depan hanya ID_RUP + Row_Hash (indeks ID → hash,
+    posisi baris); baris yang tidak berubah dibaca per row group Parquet saat
+    diminta. Urutan baris DB jarang berubah antar tarikan, jadi tiap row group
+    praktis dibaca sekali. Di-pickle sebagai path → worker memuat indeksnya sendiri.
+    """
+
+    GROUPS_KEPT = 1  # row group terakhir disimpan — chunk berikutnya biasanya mulai di sana
+
+    def __init__(self, path, reclassify=False):
+        self.path = path
+        self.reclassify = reclassify
+        self._file = None
+        self._groups = OrderedDict()
+
+    def __getstate__(self):
+        return {"path": self.path, "reclassify": self.reclassify}
+
+    def __setstate__(self, state):
+        self.__init__(**state)
+
+    def _load_index(self):
+        import pyarrow.parquet as pq
+        with phase("load.prev_index"):
+            self._file = pq.ParquetFile(self.path)
+            meta = self._file.metadata
+            self._starts = np.cumsum([0] + [meta.row_group(i).num_rows for i in range(meta.num_row_groups)])
+            cols = self._file.read(columns=["ID_RUP", "Row_Hash"]).to_pandas()
+            # ID ganda: baris pertama yang dipakai (hash sama → hasil enrichment sama)
+            first = ~cols["ID_RUP"].duplicated().to_numpy()
+            self._pos = np.flatnonzero(first)
+            self._ids = pd.Index(cols["ID_RUP"].to_numpy()[first])
+            self._hashes = cols["Row_Hash"].to_numpy()[first]
+
+    def match(self, raw):
+        """Posisi baris snapshot untuk tiap baris `raw` dengan ID_RUP & Row_Hash sama; -1 jika baru / berubah."""
+        if self._file is None:
+            self._load_index()
+        k = self._ids.get_indexer(raw["ID_RUP"])
+        found = k >= 0
+        same = np.zeros(len(raw), dtype=bool)
+        same[found] = self._hashes[k[found]] == raw["Row_Hash"].to_numpy()[found]
+        return np.where(same, self._pos[np.where(same, k, 0)], -1)
+
+    def rows(self, pos):
+        """Baris snapshot di posisi `pos` (urutan `pos` dipertahankan), dibaca per row group."""
+        groups = np.searchsorted(self._starts, pos, side="right") - 1
+        parts = [self._group(g).take(pos[groups == g] - self._starts[g]) for g in np.unique(groups)]
+        return take_order(concat_rup_parts(parts), np.argsort(groups, kind="stable"))
+
+    def _group(self, g):
+        df = self._groups.pop(g, None)
+        if df is None:
+            with phase("load.prev_read", int(self._starts[g + 1] - self._starts[g])):
+                df = self._file.read_row_group(int(g)).to_pandas()
+        self._groups[g] = df
+        while len(self._groups) > self.GROUPS_KEPT:
+            self._groups.popitem(last=False)
+        return df
+
+
+def enrich_incremental(raw, prev, ict_memo=None):
+    """
+    Enrichment hanya untuk delta: ID_RUP baru atau Row_Hash berubah.
+    Baris yang sama diambil dari `prev` (PreviousSnapshot); ID yang hilang
+    dari DB otomatis tidak ikut.
+    """
+    if "ID_RUP" not in raw.columns:
+        return enrich_rup_frame(raw, ict_memo)
+
+    pos = prev.match(raw)
+    same = pos >= 0
+    if not same.any():
+        return enrich_rup_frame(raw, ict_memo)
+
+    delta = compact_rup_frame(enrich_rup_frame(raw[~same].copy(), ict_memo))
+    kept = prev.rows(pos[same])
+    if prev.reclassify:
+        with phase("load.reclassify", len(kept)):
+            kept["Is_ICT"], kept["Kategori_ICT"] = classify_ict_series(kept["Nama_Paket"], ict_memo)
+            kept["Sektor"] = kept["Is_ICT"].map({True: "ICT", False: "Non-ICT"})
+            kept = compact_rup_frame(kept)
+    cols = delta.columns if len(delta) else kept.columns
+    # Gabung tanpa turun ke object (kategori di-union), lalu kembali ke urutan DB
+    df = concat_rup_parts([kept[cols], delta[cols]])
+    df = take_order(df, np.concatenate([np.flatnonzero(same), np.flatnonzero(~same)]))
+    for col in df.columns:
+        if isinstance(df[col].dtype, pd.CategoricalDtype):
+            # Kategori sama dengan enrichment penuh chunk ini: hanya nilai yang ada, terurut
+            cat = df[col].cat.remove_unused_categories()
+            df[col] = cat.cat.reorder_categories(cat.cat.categories.sort_values())
+    df.index = raw.index
+    return df
+
+
+def take_order(df, order):
+    """Baris ke-i `df` berasal dari posisi order[i] → susun ulang ke urutan posisi."""
+    inverse = np.empty_like(order)
+    inverse[order] = np.arange(len(order))
+    return df.take(inverse)
+
+
+# Kolom dimensi (kardinalitas rendah) → dtype category
+RUP_CATEGORY_COLS = ["Provinsi", "Daerah", "Tipe_Daerah", "KLPD", "Satuan_Kerja",
+                     "Jenis_Pengadaan", "Metode", "Pemilihan", "Sektor", "Kategori_ICT",
+                     "Lokasi", "Usaha_Kecil", "Produk_DN"]
+
+
+def compact_rup_frame(df):
+    """
+    Dtype hemat memori: dimensi → category, Nama_Paket → string[pyarrow],
+    Pagu_Rp → int64 (lihat compact_pagu), Is_ICT → bool.
+    """
+    for col in RUP_CATEGORY_COLS:
+        if col in df.columns:
+            df[col] = df[col].astype("category")
+    if "Nama_Paket" in df.columns:
+        try:
+            df["Nama_Paket"] = df["Nama_Paket"].astype("string[pyarrow]")
+        except ImportError:
+            pass
+    if "Pagu_Rp" in df.columns:
+        df["Pagu_Rp"] = compact_pagu(df["Pagu_Rp"])
+    df["Is_ICT"] = df["Is_ICT"].astype(bool)
+    return df
+
+
+def compact_pagu(pagu):
+    """
+    Pagu_Rp → int64 hanya jika semua nilai bilangan bulat berhingga dalam
+    rentang int64 (rupiah bulat, kasus umum); selain itu tetap float64 supaya
+    pagu pecahan / sangat besar dijumlah persis seperti sebelumnya.
+    """
+    kind = pagu.dtype.kind
+    if kind == "i" or (kind == "u" and (pagu.empty or pagu.max() < 2**63)):
+        return pagu.astype("int64")
+    if kind != "f":
+        return pagu
+    v = pagu.to_numpy()
+    with np.errstate(invalid="ignore"):
+        exact = bool(np.isfinite(v).all() and (np.abs(v) < 2.0**63).all() and (np.mod(v, 1) == 0).all())
+    return pagu.astype("int64" if exact else "float64")
+
+
+def concat_rup_parts(parts):
+    """Gabung chunk hasil compact_rup_frame — kategori di-union supaya tetap category."""
+    if len(parts) == 1:
+        return parts[0].reset_index(drop=True)
+    cols = {}
+    for col in parts[0].columns:
+        if isinstance(parts[0][col].dtype, pd.CategoricalDtype):
+            try:
+                cols[col] = pd.Series(union_categoricals([p[col] for p in parts]), name=col)
+            except TypeError:
+                # Tipe kategori beda antar chunk (mis. chunk yang kolomnya NULL semua)
+                cols[col] = pd.concat([p[col].astype(object) for p in parts],
+                                      ignore_index=True).astype("category")
+        else:
+            cols[col] = pd.concat([p[col] for p in parts], ignore_index=True)
+    return pd.DataFrame(cols)
+
+
+# Ukuran chunk baca SQLite — membatasi peak memory saat load
+RUP_CHUNK_ROWS = int(os.environ.get("RUP_CHUNK_ROWS", "200000"))
+
+def _q(name):
+    """Quote identifier SQLite."""
+    return '"' + str(name).replace('"', '""') + '"'
+
+
+def find_rup_table(conn):
+    """Nama tabel RUP: yang mengandung 'rup', atau tabel pertama. None jika DB kosong."""
+    tables = [r[0] for r in conn.execute("SELECT name FROM sqlite_master WHERE type='table'")]
+    if not tables:
+        return None
+    for t in tables:
+        if "rup" in t.lower():
+            return t
+    return tables[0]
+
+
+def map_rup_columns(cols):
+    """Mapping {kolom sumber: nama standar} — auto-detect dari nama kolom."""
+    col_lower = {c.lower().replace(" ", "_").replace("(", "").replace(")", ""): c for c in cols}
+
+    # Mapping kolom — flexible
+    def find_col(*candidates):
+        for c in candidates:
+            cl = c.lower().replace(" ", "_")
+            if cl in col_lower:
+                return col_lower[cl]
+            for k, v in col_lower.items():
+                if cl in k or k in cl:
+                    return v
+        return None
+
+    # Identifikasi kolom-kolom penting
+    col_paket = find_col("Paket", "Nama_Paket", "nama_paket", "paket")
+    col_pagu = find_col("Pagu_Rp", "Pagu", "pagu_rp", "pagu")
+    col_jenis = find_col("Jenis_Pengadaan", "Jenis Pengadaan", "jenis_pengadaan")
+    col_metode = find_col("Metode", "Metode_Pemilihan", "metode")
+    col_klpd = find_col("K/L/PD", "KLPD", "klpd", "Instansi", "K_L_PD")
+    col_satker = find_col("Satuan_Kerja", "Satuan Kerja", "satuan_kerja")
+    col_lokasi = find_col("Lokasi", "lokasi")
+    col_pemilihan = find_col("Pemilihan", "pemilihan", "Waktu_Pemilihan")
+    col_id = find_col("ID", "id", "ID_RUP", "No")
+    col_uk = find_col("Usaha_Kecil", "Usaha Kecil/Koperasi", "usaha_kecil")
+    col_pdn = find_col("Produk_Dalam_Negeri", "Produk Dalam Negeri", "produk_dalam_negeri")
+
+    # Standardize column names
+    rename_map = {}
+    if col_paket: rename_map[col_paket] = "Nama_Paket"
+    if col_pagu: rename_map[col_pagu] = "Pagu_Rp"
+    if col_jenis: rename_map[col_jenis] = "Jenis_Pengadaan"
+    if col_metode: rename_map[col_metode] = "Metode"
+    if col_klpd: rename_map[col_klpd] = "KLPD"
+    if col_satker: rename_map[col_satker] = "Satuan_Kerja"
+    if col_lokasi: rename_map[col_lokasi] = "Lokasi"
+    if col_pemilihan: rename_map[col_pemilihan] = "Pemilihan"
+    if col_id: rename_map[col_id] = "ID_RUP"
+    if col_uk: rename_map[col_uk] = "Usaha_Kecil"
+    if col_pdn: rename_map[col_pdn] = "Produk_DN"
+    return rename_map
+
+
+def read_rup_chunks(db_path, chunksize=None):
+    """
+    Baca RUP data mentah dari SQLite per chunk. Kolom di-resolve dulu dari
+    PRAGMA table_info, lalu hanya kolom yang dipakai dashboard yang di-SELECT
+    (langsung dengan nama standar). Yield DataFrame per chunk.
+    """
+    conn = sqlite3.connect(db_path)
+    try:
+        src = rup_source(conn)
+        if src is None:
+            return
+        tbl, select = src
+        yield from pd.read_sql(f"SELECT {select} FROM {_q(tbl)}", conn,
+                               chunksize=chunksize or RUP_CHUNK_ROWS)
+    finally:
+        conn.close()
+
+
+def rup_source(conn):
+    """(tabel RUP, daftar SELECT kolom dengan nama standar); None jika kosong / tidak dikenali."""
+    tbl = find_rup_table(conn)
+    if tbl is None:
+        return None
+    cols = [r[1] for r in conn.execute(f"PRAGMA table_info({_q(tbl)})")]
+    rename_map = map_rup_columns(cols)
+    if not rename_map:
+        return None
+    return tbl, ", ".join(f"{_q(src)} AS {_q(dst)}" for src, dst in rename_map.items())
+
+
+def rup_chunk_queries(db_path, chunksize=None):
+    """
+    Query per chunk berupa rentang rowid — batas chunk sama persis dengan
+    read_rup_chunks, tapi setiap chunk bisa dibaca oleh proses worker sendiri.
+    None jika tabel tanpa rowid (pakai read_rup_chunks).
+    """
+    chunksize = chunksize or RUP_CHUNK_ROWS
+    conn = sqlite3.connect(db_path)
+    try:
+        src = rup_source(conn)
+        if src is None:
+            return []
+        tbl, select = src
+        lo, hi, n = conn.execute(f"SELECT MIN(rowid), MAX(rowid), COUNT(*) FROM {_q(tbl)}").fetchone()
+        if not n:
+            return []
+        if hi - lo + 1 == n:  # rowid rapat (tanpa delete) → batas dihitung langsung
+            bounds = list(range(lo, hi + 1, chunksize))
+        else:
+            rowids = conn.execute(f"SELECT rowid FROM {_q(tbl)} ORDER BY rowid")
+            bounds = [r[0] for i, r in enumerate(rowids) if i % chunksize == 0]
+    except sqlite3.OperationalError:
+        return None  # mis. WITHOUT ROWID
+    finally:
+        conn.close()
+    sql = f"SELECT {select} FROM {_q(tbl)} WHERE rowid >= ? AND rowid < ? ORDER BY rowid"
+    return [(db_path, sql, (a, b)) for a, b in zip(bounds, bounds[1:] + [hi + 1])]
+
+
+def read_rup_chunk(db_path, sql, params):
+    """Satu chunk dari rup_chunk_queries."""
+    conn = sqlite3.connect(db_path)
+    try:
+        return pd.read_sql(sql, conn, params=params)
+    finally:
+        conn.close()
+
+
+def rup_chunk_sources(db_path, workers):
+    """
+    Sumber chunk untuk enrich_chunks: serial → DataFrame dari read_rup_chunks;
+    paralel → query rentang rowid sehingga pembacaan SQLite ikut terbagi ke worker.
+    """
+    queries = rup_chunk_queries(db_path) if workers > 1 else None
+    if queries is not None:
+        return queries
+    return timed_iter("load.read", read_rup_chunks(db_path))
+
+
+def parse_lokasi(lokasi_str):
+    """
+    Parse 'Lampung, Way Kanan (Kab.)' → (Provinsi, Daerah, Tipe)
+    Parse 'DKI Jakarta, Jakarta Pusat (Kota)' → (DKI Jakarta, Jakarta Pusat, Kota)
+    Handle multi-lokasi: 'A | B' → take first
+    """
+    if pd.isna(lokasi_str):
+        return "Lainnya", "Lainnya", "Lainnya"
+    # Ambil lokasi pertama jika ada multi
+    text = str(lokasi_str).split("|")[0].strip()
+    # Parse: "Provinsi, Daerah (Tipe)"
+    m = re.match(r'^(.+?),\s*(.+?)\s*\((Kab\.|Kota)\)\s*$', text)
+    if m:
+        prov = m.group(1).strip()
+        daerah = m.group(2).strip()
+        tipe_raw = m.group(3).strip()
+        tipe = "Kabupaten" if tipe_raw == "Kab." else "Kota"
+        return prov, daerah, tipe
+    # Fallback: coba parse tanpa tipe
+    m2 = re.match(r'^(.+?),\s*(.+)$', text)
+    if m2:
+        return m2.group(1).strip(), m2.group(2).strip(), "Lainnya"
+    return text, text, "Lainnya"
+
+
+def parse_lokasi_series(lokasi):
+    """
+    Versi vektor dari parse_lokasi untuk satu kolom Lokasi.
+    Parse hanya nilai unik (ratusan) lalu map balik ke jutaan baris.
+    Return DataFrame [Provinsi, Daerah, Tipe_Daerah] dengan index yang sama.
+    """
+    uniq = pd.Series(lokasi.dropna().unique(), dtype=object)
+    text = uniq.astype(str).str.split("|", regex=False).str[0].str.strip()
+
+    m = text.str.extract(r'^(.+?),\s*(.+?)\s*\((Kab\.|Kota)\)\s*$')
+    m2 = text.str.extract(r'^(.+?),\s*(.+)$')
+    has_tipe = m[0].notna()
+    has_koma = ~has_tipe & m2[0].notna()
+
+    prov = text.copy()
+    daerah = text.copy()
+    tipe = pd.Series("Lainnya", index=text.index, dtype=object)
+    prov[has_tipe] = m.loc[has_tipe, 0].str.strip()
+    daerah[has_tipe] = m.loc[has_tipe, 1].str.strip()
+    tipe[has_tipe] = m.loc[has_tipe, 2].map({"Kab.": "Kabupaten", "Kota": "Kota"})
+    prov[has_koma] = m2.loc[has_koma, 0].str.strip()
+    daerah[has_koma] = m2.loc[has_koma, 1].str.strip()
+
+    out = pd.DataFrame(index=lokasi.index)
+    for col, vals in (("Provinsi", prov), ("Daerah", daerah), ("Tipe_Daerah", tipe)):
+        lookup = pd.Series(vals.values, index=uniq.values, dtype=object)
+        out[col] = lokasi.map(lookup).fillna("Lainnya")
+    return out
+
+
+def enrich_rup_frame(df, ict_memo=None):
+    """Tambah kolom turunan (in-place): Pagu numerik, Provinsi/Daerah/Tipe_Daerah, Is_ICT, Kategori_ICT, Sektor."""
+    # Parse Pagu
+    if "Pagu_Rp" in df.columns:
+        with phase("enrich.pagu", len(df)):
+            df["Pagu_Rp"] = (df["Pagu_Rp"].astype(str)
+                             .str.replace(r'[^\d.]', '', regex=True))
+            df["Pagu_Rp"] = pd.to_numeric(df["Pagu_Rp"], errors="coerce").fillna(0)
+
+    # Parse Lokasi → Provinsi, Daerah, Tipe_Daerah
+    if "Lokasi" in df.columns:
+        with phase("enrich.lokasi", len(df)):
+            parsed = parse_lokasi_series(df["Lokasi"])
+            df["Provinsi"] = parsed["Provinsi"]
+            df["Daerah"] = parsed["Daerah"]
+            df["Tipe_Daerah"] = parsed["Tipe_Daerah"]
+    else:
+        df["Provinsi"] = "Tidak Diketahui"
+        df["Daerah"] = "Tidak Diketahui"
+        df["Tipe_Daerah"] = "Lainnya"
+
+    # ICT classification
+    if "Nama_Paket" in df.columns:
+        with phase("enrich.ict", len(df)):
+            df["Is_ICT"], df["Kategori_ICT"] = classify_ict_series(df["Nama_Paket"], ict_memo)
+    else:
+        df["Is_ICT"] = False
+        df["Kategori_ICT"] = None
+
+    # Sektor label
+    df["Sektor"] = df["Is_ICT"].map({True: "ICT", False: "Non-ICT"})
+
+    return df
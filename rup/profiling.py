@@ -0,0 +1,107 @@
+"""Catatan fase (wall time + baris) untuk panel profiling, log JSON, dan tools/bench.py."""
+
+import streamlit as st
+import contextvars
+import os
+import json
+import time
+from collections import OrderedDict, deque
+from contextlib import contextmanager
+from datetime import datetime
+
+# ═══════════════════════════════════════════════════════════════════════════
+# PROFILING FASE — wall time + jumlah baris per fase bernama
+# ═══════════════════════════════════════════════════════════════════════════
+
+# List penampung catatan fase (diisi benchmark / panel profiling); None = nonaktif.
+# ContextVar, bukan global modul: sesi-sesi rerun di thread script masing-masing,
+# jadi setiap rerun memegang list-nya sendiri. Set lewat start_profile() /
+# stop_profile(), baca lewat profile_records().
+_profile = contextvars.ContextVar("rup_profile", default=None)
+# Panel profiling di sidebar hanya untuk URL ?admin=<token> (kosong = panel nonaktif)
+RUP_ADMIN_TOKEN = os.environ.get("RUP_ADMIN_TOKEN", "")
+# Jika di-set: setiap rerun ditulis sebagai satu baris JSON ke file ini
+RUP_PROFILE_LOG = os.environ.get("RUP_PROFILE_LOG", "")
+
+
+def start_profile(enabled=True):
+    """Mulai catatan fase baru untuk konteks (rerun / langkah) ini; enabled=False → nonaktif. Return list-nya."""
+    records = [] if enabled else None
+    _profile.set(records)
+    return records
+
+
+def stop_profile():
+    _profile.set(None)
+
+
+def profile_records():
+    """List catatan fase konteks ini, None jika profiling nonaktif."""
+    return _profile.get()
+
+
+def record_phase(name, seconds, rows=None):
+    records = _profile.get()
+    if records is not None:
+        records.append({"phase": name, "seconds": seconds, "rows": rows})
+
+
+@contextmanager
+def phase(name, rows=None):
+    """Catat wall time blok sebagai fase `name` (no-op jika profiling nonaktif)."""
+    if _profile.get() is None:
+        yield
+        return
+    t0 = time.perf_counter()
+    try:
+        yield
+    finally:
+        record_phase(name, time.perf_counter() - t0, rows)
+
+
+def timed_iter(name, iterable):
+    """Iterasi dengan waktu tiap next() dicatat sebagai fase `name` (rows = len(item))."""
+    it = iter(iterable)
+    while True:
+        t0 = time.perf_counter()
+        try:
+            item = next(it)
+        except StopIteration:
+            return
+        record_phase(name, time.perf_counter() - t0, len(item))
+        yield item
+
+
+def summarize_phases(records):
+    """Catatan fase → {fase: {seconds, rows, calls}} (urutan kemunculan pertama)."""
+    out = OrderedDict()
+    for r in records:
+        s = out.setdefault(r["phase"], {"seconds": 0.0, "rows": 0, "calls": 0})
+        s["seconds"] += r["seconds"]
+        s["rows"] += r["rows"] or 0
+        s["calls"] += 1
+    for s in out.values():
+        s["seconds"] = round(s["seconds"], 4)
+    return out
+
+
+def write_profile_log(path, records, total, context):
+    """Tambahkan satu baris JSON (satu rerun) ke log profiling."""
+    line = json.dumps({"ts": datetime.now().isoformat(timespec="milliseconds"),
+                       "total_seconds": round(total, 4), **context,
+                       "phases": [{**r, "seconds": round(r["seconds"], 5)} for r in records]},
+                      ensure_ascii=False, default=str)
+    try:
+        with open(path, "a", encoding="utf-8") as f:
+            f.write(line + "\n")
+    except OSError:
+        pass  # log hanya alat bantu — jangan ganggu dashboard
+
+
+def export_timings():
+    """
+    Catatan to_csv terakhir dari tombol download sesi ini (lintas rerun).
+    Disimpan di session_state → panel admin tidak memperlihatkan export sesi
+    lain. Ambil saat rerun (callable download jalan di luar konteks sesi).
+    """
+    return st.session_state.setdefault("_rup_export_timings", deque(maxlen=20))
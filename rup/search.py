@@ -0,0 +1,154 @@
+"""Pencarian paket: indeks FTS5 per versi data, digabung dengan filter sidebar."""
+
+import streamlit as st
+import pandas as pd
+import numpy as np
+import sqlite3
+import re
+import os
+import glob
+import tempfile
+
+from .profiling import phase
+from .helpers import is_sql_view, profile_rows
+from .loading import cache_dir
+from .aggregation import filter_positions
+
+# ═══════════════════════════════════════════════════════════════════════════
+# PENCARIAN PAKET — INDEKS FTS5
+# Nama_Paket + Satuan_Kerja + KLPD di-index FTS5 dalam file pendamping
+# (.rup_cache/<db>.<versi>.fts), dibangun sekali per versi data bersama load.
+# rowid FTS = posisi baris frame / view, jadi hasil bisa langsung
+# digabung dengan posisi dari filter sidebar.
+# ═══════════════════════════════════════════════════════════════════════════
+
+SEARCH_COLS = ["Nama_Paket", "Satuan_Kerja", "KLPD"]
+# Bobot bm25 per kolom: kecocokan di nama paket paling menentukan
+SEARCH_WEIGHTS = (10.0, 2.0, 2.0)
+SEARCH_LIMIT = int(os.environ.get("RUP_SEARCH_LIMIT", "200"))
+SEARCH_RESULT_COLS = ["Nama_Paket", "Pagu_Rp", "Satuan_Kerja", "KLPD", "Provinsi",
+                      "Jenis_Pengadaan", "Metode", "Sektor"]
+
+
+def search_index_path(db_path, version):
+    base = os.path.splitext(os.path.basename(db_path))[0]
+    return os.path.join(cache_dir(db_path), f"{base}.{version}.fts")
+
+
+def search_text_batches(frame, chunk_rows=100_000):
+    """Batch tuple (posisi, Nama_Paket, Satuan_Kerja, KLPD); kolom yang tidak ada → NULL."""
+    cols = [c for c in SEARCH_COLS if c in frame.columns]
+    if is_sql_view(frame):
+        batches = frame.iter_columns(cols, chunk_rows)
+    else:
+        def text(col, i):
+            part = frame[col].iloc[i:i + chunk_rows]
+            return part.astype(object).where(part.notna(), None).tolist()
+        batches = (zip(range(i, i + chunk_rows), *(text(c, i) for c in cols))
+                   for i in range(0, len(frame), chunk_rows))
+    for batch in batches:
+        if len(cols) == len(SEARCH_COLS):
+            yield batch
+        else:
+            yield [(r[0], *(r[1 + cols.index(c)] if c in cols else None for c in SEARCH_COLS))
+                   for r in batch]
+
+
+def build_search_index(batches, db_path, version):
+    """Tulis tabel FTS5 paket_fts (tmp + rename), hapus indeks versi lama."""
+    path = search_index_path(db_path, version)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    os.close(fd)
+    conn = sqlite3.connect(tmp)
+    try:
+        conn.execute("PRAGMA journal_mode=OFF")
+        # Contentless: teks tidak disimpan ulang (hasil diambil dari frame lewat posisi)
+        conn.execute(f"CREATE VIRTUAL TABLE paket_fts USING fts5("
+                     f"{', '.join(SEARCH_COLS)}, content='', "
+                     f"tokenize='unicode61 remove_diacritics 2')")
+        insert = (f"INSERT INTO paket_fts(rowid, {', '.join(SEARCH_COLS)}) "
+                  f"VALUES (?{', ?' * len(SEARCH_COLS)})")
+        for batch in batches:
+            conn.executemany(insert, batch)
+        conn.execute("INSERT INTO paket_fts(paket_fts) VALUES ('optimize')")
+        conn.commit()
+    except sqlite3.Error:
+        conn.close()
+        os.remove(tmp)
+        raise
+    conn.close()
+    os.replace(tmp, path)
+    base = os.path.splitext(os.path.basename(db_path))[0]
+    for old in glob.glob(os.path.join(os.path.dirname(path), f"{base}.*.fts")):
+        if old != path:
+            try:
+                os.remove(old)
+            except OSError:
+                pass
+
+
+@st.cache_resource(max_entries=2, show_spinner=False)
+def load_search_index(_frame, db_path, version):
+    """Path indeks FTS5 versi ini (dibangun jika belum ada); None jika SQLite tanpa FTS5."""
+    path = search_index_path(db_path, version)
+    if not os.path.exists(path):
+        try:
+            with phase("search.index", profile_rows(_frame)):
+                build_search_index(search_text_batches(_frame), db_path, version)
+        except (sqlite3.Error, OSError):
+            return None
+    return path
+
+
+def fts_query(text):
+    """
+    Teks bebas → query FTS5 yang aman: tiap kata jadi frasa ("SD-WAN" → sd wan
+    berurutan), semua kata wajib (AND), kata terakhir prefix (ketik sambil cari).
+    None jika tidak ada kata.
+    """
+    terms = [t.replace('"', '""') for t in text.split() if re.search(r"\w", t)]
+    if not terms:
+        return None
+    return " ".join(f'"{t}"' for t in terms[:-1]) + (" " if len(terms) > 1 else "") + f'"{terms[-1]}"*'
+
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def search_ranked(path, query):
+    """Posisi baris yang cocok dengan `query`, terurut bm25 (paling relevan dulu)."""
+    conn = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+    try:
+        rows = conn.execute(f"SELECT rowid FROM paket_fts WHERE paket_fts MATCH ? "
+                            f"ORDER BY bm25(paket_fts, {', '.join(map(str, SEARCH_WEIGHTS))})",
+                            (query,)).fetchall()
+    finally:
+        conn.close()
+    return np.fromiter((r[0] for r in rows), dtype=np.int64, count=len(rows))
+
+
+def search_paket(frame, index, filters, path, text, limit=SEARCH_LIMIT):
+    """
+    Cari paket + filter sidebar → (top-`limit` baris terurut relevansi, jumlah
+    total yang cocok). Indeks FTS memberi kandidat terurut; filter hanya
+    menyaring posisi, tanpa scan teks.
+    """
+    query = fts_query(text)
+    if query is None:
+        return pd.DataFrame(columns=SEARCH_RESULT_COLS), 0
+    ranked = search_ranked(path, query)
+    if is_sql_view(frame):
+        view = frame.where_filters(*filters)
+        allowed = view.positions() if view.where else None
+    else:
+        allowed = filter_positions(index, len(frame), *filters)
+    if allowed is not None:
+        mask = np.zeros(len(frame), dtype=bool)
+        mask[allowed] = True
+        ranked = ranked[mask[ranked]]
+    cols = [c for c in SEARCH_RESULT_COLS if c in frame.columns]
+    top = ranked[:limit]
+    if is_sql_view(frame):
+        rows = frame.rows_at(top, cols)
+    else:
+        rows = frame.iloc[top, [frame.columns.get_loc(c) for c in cols]].reset_index(drop=True)
+    return rows, len(ranked)
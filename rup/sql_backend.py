@@ -0,0 +1,353 @@
+"""Backend sqlite / duckdb: SqlView di atas store SQL (RUP_BACKEND), bukan frame di memori."""
+
+import streamlit as st
+import pandas as pd
+import sqlite3
+import os
+import glob
+import tempfile
+
+from .loading import (_q, build_rup_frame, cache_dir, enrich_chunks, enrich_workers, ict_store_path,
+                      rup_chunk_sources, snapshot_path)
+from .aggregation import CUBE_DIMS, FILTER_DIMS
+
+# ═══════════════════════════════════════════════════════════════════════════
+# BACKEND SQL — FILTER & AGREGASI DI DALAM ENGINE QUERY
+# RUP_BACKEND=sqlite: tabel tidak dimuat ke memori. Hasil enrichment ditulis
+# per chunk ke DB pendamping (.rup_cache/<db>.<versi>.sqlite, tabel
+# rup_enriched + indeks), filter & agregasi jadi query GROUP BY berparameter.
+# RUP_BACKEND=duckdb: query yang sama dijalankan DuckDB (kolumnar, multi-thread)
+# langsung atas snapshot Parquet. Tanpa paket duckdb → otomatis backend pandas.
+# ═══════════════════════════════════════════════════════════════════════════
+
+RUP_BACKEND = os.environ.get("RUP_BACKEND", "pandas").lower()
+SQL_TABLE = "rup_enriched"
+SQL_CUBE_TABLE = "rup_cube"
+SQL_INDEX_COLS = ["Provinsi", "KLPD", "Satuan_Kerja", "Sektor"]
+
+
+def sql_store_path(db_path, version):
+    base = os.path.splitext(os.path.basename(db_path))[0]
+    return os.path.join(cache_dir(db_path), f"{base}.{version}.sqlite")
+
+
+def build_sql_store(db_path, path):
+    """
+    Enrich RUP.db per chunk dan append ke rup_enriched di `path`, lalu bangun
+    rup_cube (GROUP BY CUBE_DIMS, padanan build_rup_cube) + indeks di kedua
+    tabel. RUP.db sendiri tidak ditulis (mtime = versi data).
+    Return False jika tidak ada data.
+    """
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    os.close(fd)
+    written = False
+    conn = sqlite3.connect(tmp)
+    try:
+        workers = enrich_workers()
+        for part in enrich_chunks(rup_chunk_sources(db_path, workers), workers=workers,
+                                  hash_rows=False, ict_store=ict_store_path(db_path)):
+            part.to_sql(SQL_TABLE, conn, if_exists="append", index=False)
+            written = True
+            del part
+        if written:
+            cols = [r[1] for r in conn.execute(f"PRAGMA table_info({_q(SQL_TABLE)})")]
+            keys = ", ".join(_q(c) for c in CUBE_DIMS if c in cols)
+            conn.execute(f'CREATE TABLE {_q(SQL_CUBE_TABLE)} AS SELECT {keys}, '
+                         f'SUM("Pagu_Rp") AS Total_Pagu, COUNT(*) AS Jumlah_Paket '
+                         f'FROM {_q(SQL_TABLE)} GROUP BY {keys}')
+            for table in (SQL_TABLE, SQL_CUBE_TABLE):
+                for col in SQL_INDEX_COLS:
+                    if col in cols:
+                        conn.execute(f"CREATE INDEX {_q(f'ix_{table}_{col}')} "
+                                     f"ON {_q(table)} ({_q(col)})")
+            conn.execute("ANALYZE")
+        conn.commit()
+    finally:
+        conn.close()
+    if not written:
+        os.remove(tmp)
+        return False
+    os.replace(tmp, path)
+    base = os.path.splitext(os.path.basename(db_path))[0]
+    for old in glob.glob(os.path.join(os.path.dirname(path), f"{base}.*.sqlite")):
+        if old != path:
+            try:
+                os.remove(old)
+            except OSError:
+                pass
+    return True
+
+
+@st.cache_resource(max_entries=2, show_spinner=False)
+def load_rup_view(db_path, version):
+    """
+    Padanan load_rup_data untuk backend sqlite: siapkan DB pendamping sekali
+    per versi, kembalikan SqlView baris tanpa filter (`.cube` = view rup_cube).
+    DataFrame kosong jika DB kosong.
+    """
+    path = sql_store_path(db_path, version)
+    if not os.path.exists(path) and not build_sql_store(db_path, path):
+        return pd.DataFrame()
+    return SqlView.open(path, "sqlite")
+
+
+@st.cache_resource(max_entries=2, show_spinner=False)
+def load_rup_duckdb(db_path, version):
+    """
+    Backend duckdb: SqlView atas snapshot Parquet (snapshot dibuat dulu jika
+    belum ada). None jika duckdb / snapshot tidak tersedia → pakai pandas.
+    """
+    try:
+        import duckdb  # noqa: F401
+    except ImportError:
+        return None
+    path = snapshot_path(db_path, version)
+    if not os.path.exists(path):
+        build_rup_frame(db_path, version)
+        if not os.path.exists(path):
+            return None
+    return SqlView.open(path, "duckdb")
+
+
+@st.cache_resource(show_spinner=False)
+def duckdb_database():
+    """Satu DuckDB in-memory per proses; metadata Parquet di-cache antar query."""
+    import duckdb
+    conn = duckdb.connect()
+    conn.execute("SET enable_object_cache = true")
+    return conn
+
+
+def sql_connect(engine, path):
+    """Koneksi read-only: DB pendamping SQLite, atau cursor DuckDB (Parquet dibaca di query)."""
+    if engine == "duckdb":
+        return duckdb_database().cursor()
+    return sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+
+
+@st.cache_data(max_entries=1024, show_spinner=False)
+def sql_read(engine, path, sql, params):
+    """
+    Hasil query (kecil: agregat / top-n). File sumber tidak berubah selama
+    versinya sama (versi ada di path) → aman di-cache lintas rerun.
+    """
+    conn = sql_connect(engine, path)
+    try:
+        if engine == "duckdb":
+            return conn.execute(sql, list(params)).df()
+        return pd.read_sql(sql, conn, params=params)
+    finally:
+        conn.close()
+
+
+class SqlView:
+    """
+    Subset tabel engine SQL + kondisi WHERE berparameter. Dipakai di tempat
+    DataFrame baris / cube; fungsi agregasi (cube_top, cube_totals, ...)
+    mengeksekusinya sebagai query. sqlite: rup_enriched (baris) + rup_cube;
+    duckdb: snapshot Parquet (baris) yang sekaligus melayani agregasi.
+    """
+
+    def __init__(self, path, engine, source, is_cube, columns, domains,
+                 n_rows=None, where=(), params=(), int_pagu=False):
+        self.path = path
+        self.engine = engine
+        self.source = source  # ekspresi FROM
+        self.is_cube = is_cube
+        self.columns = columns
+        self.domains = domains  # {dimensi filter: (set nilai non-null, ada NULL?)}
+        self.n_rows = n_rows
+        self.where = where
+        self.params = params
+        # duckdb: SUM kolom bilangan bulat → HUGEINT (ke pandas jadi float) → CAST BIGINT.
+        # Hanya jika Pagu_Rp memang integer; pecahan dijumlah apa adanya (seperti pandas).
+        self.int_pagu = int_pagu
+        self.cube = None
+
+    @classmethod
+    def open(cls, path, engine="sqlite"):
+        conn = sql_connect(engine, path)
+        try:
+            if engine == "duckdb":
+                rows = "read_parquet('{}', file_row_number = true)".format(path.replace("'", "''"))
+                cube = rows
+                types = {r[0]: r[1] for r in conn.execute(f"DESCRIBE SELECT * FROM {rows}").fetchall()
+                         if r[0] != "file_row_number"}
+                cols = list(types)
+                cube_cols = cols
+                int_pagu = "INT" in types.get("Pagu_Rp", "").upper()
+            else:
+                rows, cube = _q(SQL_TABLE), _q(SQL_CUBE_TABLE)
+                cols = [r[1] for r in conn.execute(f"PRAGMA table_info({rows})").fetchall()]
+                cube_cols = [r[1] for r in conn.execute(f"PRAGMA table_info({cube})").fetchall()]
+                # SUM SQLite sudah integer jika semua nilai integer, REAL jika ada pecahan
+                # (per nilai, bukan tipe kolom: chunk ber-pecahan bisa masuk kolom INTEGER)
+                int_pagu = False
+            domains = {}
+            for col in FILTER_DIMS:
+                if col in cube_cols:
+                    vals = [r[0] for r in conn.execute(f"SELECT DISTINCT {_q(col)} FROM {cube}").fetchall()]
+                    domains[col] = ({v for v in vals if v is not None}, None in vals)
+            n_rows = conn.execute(f"SELECT COUNT(*) FROM {rows}").fetchone()[0]
+        finally:
+            conn.close()
+        view = cls(path, engine, rows, False, cols, domains, n_rows, int_pagu=int_pagu)
+        view.cube = (view if engine == "duckdb"
+                     else cls(path, engine, cube, True, cube_cols, domains, int_pagu=int_pagu))
+        return view
+
+    def __len__(self):
+        if self.n_rows is None:
+            self.n_rows = int(self.read("COUNT(*) AS n")["n"].iloc[0])
+        return self.n_rows
+
+    @property
+    def empty(self):
+        return len(self) == 0
+
+    @property
+    def measures(self):
+        """Ekspresi SQL (pagu, jumlah paket): tabel baris → SUM/COUNT, cube → SUM agregat."""
+        pagu = 'SUM("Total_Pagu")' if self.is_cube else 'SUM("Pagu_Rp")'
+        if self.int_pagu:
+            pagu = f"CAST({pagu} AS BIGINT)"
+        if self.is_cube:
+            return pagu, 'CAST(SUM("Jumlah_Paket") AS BIGINT)'
+        return pagu, "COUNT(*)"
+
+    @property
+    def rowid(self):
+        """Urutan baris asli (penentu seri pada top-n paket & urutan export)."""
+        return "file_row_number" if self.engine == "duckdb" else "rowid"
+
+    def narrow(self, col, values):
+        """View baru dengan kondisi tambahan `col IN (values)`."""
+        values = tuple(dict.fromkeys(values))
+        cond = f"{_q(col)} IN ({', '.join('?' * len(values))})" if values else "FALSE"
+        return SqlView(self.path, self.engine, self.source, self.is_cube, self.columns,
+                       self.domains, None, self.where + (cond,), self.params + values, self.int_pagu)
+
+    def where_filters(self, prov, tipe, jenis, metode, satker, sektor=None):
+        """Filter sidebar (+ sektor) — semantik sama dengan filter_positions."""
+        sel = [("Provinsi", prov), ("Tipe_Daerah", tipe)]
+        if jenis:
+            sel.append(("Jenis_Pengadaan", jenis))
+        if metode:
+            sel.append(("Metode", metode))
+        if satker:
+            sel.append(("Satuan_Kerja", satker))
+        if sektor:
+            sel.append(("Sektor", [sektor]))
+        view = self
+        for col, values in sel:
+            if col not in self.columns:
+                continue
+            dom, has_null = self.domains[col]
+            if not has_null and dom <= set(values):
+                continue  # semua baris lolos → tanpa kondisi
+            view = view.narrow(col, values)
+        return view
+
+    def sql(self, select, extra=(), group=None, order=None, limit=None):
+        conds = list(self.where) + list(extra)
+        q = f"SELECT {select} FROM {self.source}"
+        if conds:
+            q += " WHERE " + " AND ".join(conds)
+        if group:
+            q += f" GROUP BY {group}"
+        if order:
+            q += f" ORDER BY {order}"
+        if limit:
+            q += f" LIMIT {int(limit)}"
+        return q
+
+    def read(self, select, extra=(), group=None, order=None, limit=None):
+        return sql_read(self.engine, self.path,
+                        self.sql(select, extra, group, order, limit), self.params)
+
+    def group(self, by, n=None, satker=False, order=None):
+        """GROUP BY `by` → Total_Pagu, Jumlah_Paket (+ Jumlah_Satker); NULL key dibuang."""
+        by = [by] if isinstance(by, str) else list(by)
+        keys = ", ".join(_q(c) for c in by)
+        pagu, paket = self.measures
+        select = f"{keys}, {pagu} AS Total_Pagu, {paket} AS Jumlah_Paket"
+        if satker:
+            select += ', COUNT(DISTINCT "Satuan_Kerja") AS Jumlah_Satker'
+        return self.read(select, [f"{_q(c)} IS NOT NULL" for c in by], group=keys,
+                         order=order or keys, limit=n)
+
+    def totals(self):
+        """Padanan cube_totals dalam satu query."""
+        pagu, paket = self.measures
+        distinct = {k: f"COUNT(DISTINCT {_q(c)})" if c in self.columns else "0"
+                    for k, c in [("satker", "Satuan_Kerja"), ("klpd", "KLPD"), ("provinsi", "Provinsi")]}
+        res = self.read(f"COALESCE({pagu}, 0) AS pagu, COALESCE({paket}, 0) AS paket, "
+                        + ", ".join(f"{v} AS {k}" for k, v in distinct.items()))
+        out = {k: int(res[k].iloc[0]) for k in ["paket", "satker", "klpd", "provinsi"]}
+        # Pagu per kolom (bukan .iloc[0] baris campuran → float): int tetap int, pecahan tetap float
+        pagu = res["pagu"].iloc[0]
+        return {"pagu": pagu.item() if hasattr(pagu, "item") else pagu, **out}
+
+    def top_rows(self, by, cols, n):
+        """n baris Pagu terbesar per nilai `by` (window ROW_NUMBER, urutan asli untuk seri)."""
+        inner = self.sql(f'{", ".join(_q(c) for c in [by] + cols)}, ROW_NUMBER() OVER '
+                         f'(PARTITION BY {_q(by)} ORDER BY "Pagu_Rp" DESC, {self.rowid}) AS rn')
+        return sql_read(self.engine, self.path,
+                        f"SELECT * FROM ({inner}) WHERE rn <= {int(n)} ORDER BY rn",
+                        self.params).drop(columns="rn")
+
+    def iter_rows(self, chunk_rows):
+        """Semua baris view per chunk (untuk export CSV), kolom & dtype seperti frame pandas."""
+        select = ", ".join(_q(c) for c in self.columns if c != "Row_Hash")
+        sql = self.sql(select, order=self.rowid)
+        conn = sql_connect(self.engine, self.path)
+        try:
+            if self.engine == "duckdb":
+                reader = conn.execute(sql, list(self.params)).fetch_record_batch(chunk_rows)
+                chunks = (batch.to_pandas() for batch in reader)
+            else:
+                chunks = pd.read_sql(sql, conn, params=self.params, chunksize=chunk_rows)
+            for chunk in chunks:
+                if "Is_ICT" in chunk.columns:
+                    chunk["Is_ICT"] = chunk["Is_ICT"].astype(bool)
+                yield chunk
+        finally:
+            conn.close()
+
+    @property
+    def row_offset(self):
+        """rowid SQLite mulai dari 1; posisi baris (seperti iloc pandas) mulai dari 0."""
+        return 0 if self.engine == "duckdb" else 1
+
+    def positions(self):
+        """Posisi baris (0-based, urutan asli) yang lolos kondisi view ini."""
+        return self.read(f"{self.rowid} - {self.row_offset} AS pos")["pos"].to_numpy()
+
+    def rows_at(self, pos, cols):
+        """Baris pada posisi `pos` (urutan mengikuti `pos`), kolom `cols`."""
+        keys = tuple(int(p) + self.row_offset for p in pos)
+        if not keys:
+            return pd.DataFrame(columns=cols)
+        cond = f"{self.rowid} IN ({', '.join('?' * len(keys))})"
+        rows = sql_read(self.engine, self.path,
+                        self.sql(f'{self.rowid} AS "_pos", {", ".join(_q(c) for c in cols)}', [cond]),
+                        self.params + keys)
+        order = {k: i for i, k in enumerate(keys)}
+        return (rows.sort_values("_pos", key=lambda c: c.map(order))
+                .drop(columns="_pos").reset_index(drop=True))
+
+    def iter_columns(self, cols, chunk_rows):
+        """Tuple (posisi, *cols) per batch, urutan asli — sumber indeks pencarian."""
+        sql = self.sql(f"{self.rowid} - {self.row_offset}, {', '.join(_q(c) for c in cols)}",
+                       order=self.rowid)
+        conn = sql_connect(self.engine, self.path)
+        try:
+            cur = conn.execute(sql, list(self.params))
+            while True:
+                batch = cur.fetchmany(chunk_rows)
+                if not batch:
+                    return
+                yield batch
+        finally:
+            conn.close()
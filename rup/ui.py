@@ -0,0 +1,797 @@
+"""Halaman dashboard Streamlit: CSS, panel profiling, render ringkasan / deep dive, main()."""
+
+import streamlit as st
+import pandas as pd
+import os
+import hmac
+import time
+from datetime import datetime
+
+from . import classification
+from .profiling import (RUP_ADMIN_TOKEN, RUP_PROFILE_LOG, export_timings, phase, profile_records,
+                        start_profile, stop_profile, summarize_phases, write_profile_log)
+from .helpers import csv_export, fmt_n, fmt_rp, is_sql_view, mc_html, profile_rows
+from .classification import RUP_ICT_RULES
+from .charts import chart_cache, show_hbar
+from .loading import cache_dir, db_version, load_rup_data
+from .sql_backend import RUP_BACKEND, load_rup_duckdb, load_rup_view
+from .aggregation import (PAKET_COLS, agg_cache, agg_context, apply_filters, build_filter_index,
+                          build_rup_cube, cached_agg, cube_group, cube_nunique, cube_top, cube_top_by,
+                          cube_totals, distinct_values, rows_isin, top_paket_by)
+from .search import load_search_index, search_paket
+from .bundle import load_rup_bundle
+
+# ═══════════════════════════════════════════════════════════════════════════
+# CSS — BACKGROUND PUTIH, TEKS HITAM TEBAL KONTRAS
+# ═══════════════════════════════════════════════════════════════════════════
+CSS = """
+<style>
+    /* === GLOBAL — TEKS HITAM JELAS DI BACKGROUND PUTIH === */
+    .stApp { background-color: #FFFFFF; }
+    .stApp, .stApp p, .stApp span, .stApp div, .stApp label, .stApp li,
+    .stApp h1, .stApp h2, .stApp h3, .stApp h4, .stApp h5 {
+        color: #111111 !important;
+    }
+
+    /* === SIDEBAR === */
+    section[data-testid="stSidebar"] {
+        background-color: #F5F5F5;
+        border-right: 3px solid #DDD;
+    }
+    section[data-testid="stSidebar"] * { color: #111 !important; }
+
+    /* === HEADER MERAH TELKOMSEL === */
+    .main-header {
+        background: linear-gradient(135deg, #ED1C24 0%, #9B1B1F 100%);
+        padding: 30px 40px; border-radius: 16px; margin-bottom: 30px;
+        box-shadow: 0 6px 24px rgba(237,28,36,0.2);
+    }
+    .main-header h1 { color:#FFF!important;font-size:34px!important;font-weight:800!important;margin:0!important; }
+    .main-header p { color:#FFCCCC!important;font-size:16px!important;margin:6px 0 0!important; }
+
+    /* === METRIC CARDS === */
+    .mc {
+        background:#FFF; border:2px solid #DDD; border-radius:14px;
+        padding:20px 16px; text-align:center; box-shadow:0 3px 12px rgba(0,0,0,0.05);
+    }
+    .mc .lb { color:#444!important;font-size:11px;font-weight:700;text-transform:uppercase;letter-spacing:1px;margin-bottom:8px; }
+    .mc .vl { color:#111!important;font-size:26px;font-weight:800;line-height:1.1; }
+    .mc .sb { color:#666!important;font-size:11px;margin-top:6px; }
+
+    /* === SECTION HEADERS === */
+    .sh {
+        background:#F5F5F5; border-left:6px solid #ED1C24;
+        padding:16px 24px; margin:32px 0 20px; border-radius:0 10px 10px 0;
+    }
+    .sh h2 { color:#111!important;font-size:24px!important;font-weight:800!important;margin:0!important; }
+    .sh p { color:#555!important;font-size:14px!important;margin:6px 0 0!important; }
+
+    /* === INFO BOX === */
+    .ib {
+        background:#E8F0FE; border:2px solid #4285F4; border-radius:10px;
+        padding:16px 20px; margin:14px 0; font-size:15px; color:#1A3A5C!important; font-weight:500;
+    }
+
+    /* === EXPANDER === */
+    .streamlit-expanderHeader { font-size:16px!important;font-weight:700!important;color:#111!important; }
+
+    /* === TABS === */
+    .stTabs [data-baseweb="tab"] { font-weight:700;font-size:15px;padding:12px 24px;color:#111!important; }
+
+    /* === NAVIGASI SEKTOR (radio horizontal) === */
+    .stRadio [role="radiogroup"] label p { font-weight:700!important;font-size:15px!important; }
+
+    /* === LABELS === */
+    .stSelectbox label, .stMultiSelect label, .stRadio label,
+    .stTextInput label, .stFileUploader label {
+        color:#111!important; font-weight:700!important; font-size:14px!important;
+    }
+
+    /* === DOWNLOAD === */
+    .stDownloadButton>button {
+        background:#1A1A2E!important;color:#FFF!important;font-weight:700!important;
+        border-radius:10px!important;border:none!important;
+    }
+    .stDownloadButton>button:hover { background:#ED1C24!important; }
+
+    /* === HIDE BRANDING === */
+    #MainMenu {visibility:hidden;} footer {visibility:hidden;} header {visibility:hidden;}
+</style>
+"""
+
+
+def is_admin():
+    """True jika URL memuat ?admin=<RUP_ADMIN_TOKEN>."""
+    token = st.query_params.get("admin", "")
+    return bool(RUP_ADMIN_TOKEN) and hmac.compare_digest(token, RUP_ADMIN_TOKEN)
+
+
+def cache_stats():
+    """Statistik cache lintas sesi (agregasi + PNG chart) untuk panel admin & log profiling."""
+    return {"agregasi": agg_cache().stats(), "chart": chart_cache().stats()}
+
+
+def render_profile_panel(records, total):
+    """Panel sidebar: wall time & baris per fase untuk rerun ini."""
+    summary = summarize_phases(records)
+    table = pd.DataFrame({"Fase": list(summary),
+                          "Detik": [v["seconds"] for v in summary.values()],
+                          "Baris": pd.array([v["rows"] or None for v in summary.values()], dtype="Int64"),
+                          "Panggilan": [v["calls"] for v in summary.values()]})
+    with st.sidebar.expander("⏱️ Profiling Rerun (admin)", expanded=True):
+        st.markdown(f"**Total rerun: {total:.3f} s**")
+        st.caption("Fase bertingkat (mis. hbar di dalam ringkasan.*) ikut terhitung di fase induknya.")
+        if len(table) > 0:
+            st.dataframe(table, use_container_width=True, hide_index=True)
+        exports = list(export_timings())
+        if exports:
+            st.markdown("**Export CSV terakhir** (sesi ini)")
+            st.dataframe(pd.DataFrame([{"Fase": r["phase"], "Detik": round(r["seconds"], 4),
+                                        "Baris": r["rows"]} for r in reversed(exports)]),
+                         use_container_width=True, hide_index=True)
+        st.markdown("**Cache lintas sesi** (sejak proses mulai)")
+        st.dataframe(pd.DataFrame([
+            {"Cache": name, "Entri": c["entries"], "MB": round(c["bytes"] / 2**20, 2),
+             "Batas MB": round(c["max_bytes"] / 2**20, 1) if c["max_bytes"] else None,
+             "Hit": c["hits"], "Miss": c["misses"], "Eviction": c["evictions"],
+             "Hit rate": f"{c['hits'] / (c['hits'] + c['misses']):.0%}" if c["hits"] + c["misses"] else "-"}
+            for name, c in cache_stats().items()]), use_container_width=True, hide_index=True)
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# REUSABLE RENDER FUNCTIONS
+# ═══════════════════════════════════════════════════════════════════════════
+
+def render_ringkasan(df_sect, cube_sect, total_pagu_sect, label, key_prefix, export_ctx):
+    """
+    Render Ringkasan Nasional: Top Provinsi, Top KLPD, Top Satker, Distribusi.
+    Agregat dari `cube_sect` (lewat cache agregasi lintas sesi); baris mentah
+    `df_sect` hanya untuk detail paket & CSV.
+    """
+    agg_ctx = agg_context(export_ctx, key_prefix)
+
+    # ── A. TOP 10 PROVINSI ──
+    with phase("ringkasan.provinsi", profile_rows(cube_sect)):
+        st.markdown(f"""
+        <div class="sh">
+            <h2>🗺️ Top 10 Provinsi — Nilai Pagu Terbesar ({label})</h2>
+            <p>Total Pagu per Provinsi — peluang pengadaan terbesar</p>
+        </div>""", unsafe_allow_html=True)
+
+        def provinsi():
+            top = cube_top(cube_sect, "Provinsi", 10, satker=True)
+            if len(top) == 0:
+                return top, 0, {}
+            return (top, cube_nunique(cube_sect, "Provinsi"),
+                    cube_top_by(cube_sect, "Provinsi", "KLPD", top["Provinsi"], 5)
+                    if "KLPD" in cube_sect.columns else {})
+        df_prov, n_prov, klpd_per_prov = cached_agg(agg_ctx, "ringkasan.provinsi", provinsi)
+
+        if len(df_prov) > 0:
+            cp = df_prov.copy()
+            cp["Label"] = cp["Provinsi"].apply(lambda x: str(x)[:42])
+            show_hbar(cp, "Total_Pagu", "Label",
+                      f"Top 10 Provinsi — {label}",
+                      f"Dari {fmt_n(n_prov)} provinsi",
+                      ("Reds_r", 10), total_pagu_sect)
+
+            # Expander detail
+            st.markdown("#### 📋 Detail: Top 5 K/L/PD per Provinsi")
+            for _, row in df_prov.iterrows():
+                prov = row["Provinsi"]
+                with st.expander(f"🗺️ **{prov}** — {fmt_rp(row['Total_Pagu'])} ({fmt_n(row['Jumlah_Paket'])} paket)"):
+                    detail = klpd_per_prov.get(prov)
+                    if detail is not None and len(detail) > 0:
+                        detail = detail.assign(Total_Pagu=detail["Total_Pagu"].apply(fmt_rp))
+                        detail.columns = ["K/L/PD", "Total Pagu (Rp)", "Jumlah Paket"]
+                        st.dataframe(detail, use_container_width=True, hide_index=True)
+
+            top_prov = df_prov["Provinsi"].tolist()
+            st.download_button(f"📥 CSV Top 10 Provinsi ({label})",
+                               csv_export(export_ctx, f"prov_{key_prefix}",
+                                          lambda: rows_isin(df_sect, "Provinsi", top_prov)),
+                               f"Top10_Provinsi_{label}_{datetime.now():%Y%m%d}.csv",
+                               "text/csv", key=f"dl_prov_{key_prefix}", on_click="ignore")
+
+    st.markdown("<br>", unsafe_allow_html=True)
+
+    # ── B. TOP 10 K/L/PD ──
+    with phase("ringkasan.klpd", profile_rows(cube_sect)):
+        st.markdown(f"""
+        <div class="sh">
+            <h2>🏛️ Top 10 K/L/PD — Nilai Pagu Terbesar ({label})</h2>
+            <p>Kementerian / Lembaga / Pemerintah Daerah dengan rencana pengadaan terbesar</p>
+        </div>""", unsafe_allow_html=True)
+
+        if "KLPD" in cube_sect.columns:
+            def klpd():
+                top = cube_top(cube_sect, "KLPD", 10, satker=True)
+                if len(top) == 0:
+                    return top, 0, {}
+                return (top, cube_nunique(cube_sect, "KLPD"),
+                        cube_top_by(cube_sect, "KLPD", "Satuan_Kerja", top["KLPD"], 5))
+            df_klpd, n_klpd, satker_per_klpd = cached_agg(agg_ctx, "ringkasan.klpd", klpd)
+
+            if len(df_klpd) > 0:
+                ck = df_klpd.copy()
+                ck["Label"] = ck["KLPD"].apply(lambda x: str(x)[:38])
+                show_hbar(ck, "Total_Pagu", "Label",
+                          f"Top 10 K/L/PD — {label}",
+                          f"Dari {fmt_n(n_klpd)} K/L/PD",
+                          ("Blues_r", 10), total_pagu_sect)
+
+                st.markdown("""
+                <div class="ib">
+                    💡 <strong>Insight:</strong> K/L/PD dengan banyak satuan kerja (≥5 satker) 
+                    menunjukkan potensi engagement yang luas untuk penawaran solusi Telkomsel.
+                </div>""", unsafe_allow_html=True)
+
+                st.markdown("#### 📋 Detail: Top 5 Satuan Kerja per K/L/PD")
+                for _, row in df_klpd.iterrows():
+                    klpd = row["KLPD"]
+                    badge = "🌟" if row["Jumlah_Satker"] >= 5 else "🔹"
+                    with st.expander(f"{badge} **{klpd}** — {fmt_rp(row['Total_Pagu'])} ({fmt_n(row['Jumlah_Satker'])} satker)"):
+                        detail = satker_per_klpd.get(klpd)
+                        if detail is not None and len(detail) > 0:
+                            detail = detail.assign(Total_Pagu=detail["Total_Pagu"].apply(fmt_rp))
+                            detail.columns = ["Satuan Kerja", "Total Pagu (Rp)", "Jumlah Paket"]
+                            st.dataframe(detail, use_container_width=True, hide_index=True)
+
+                top_klpd = df_klpd["KLPD"].tolist()
+                st.download_button(f"📥 CSV Top 10 K/L/PD ({label})",
+                                   csv_export(export_ctx, f"klpd_{key_prefix}",
+                                              lambda: rows_isin(df_sect, "KLPD", top_klpd)),
+                                   f"Top10_KLPD_{label}_{datetime.now():%Y%m%d}.csv",
+                                   "text/csv", key=f"dl_klpd_{key_prefix}", on_click="ignore")
+
+    st.markdown("<br>", unsafe_allow_html=True)
+
+    # ── C. TOP 10 SATUAN KERJA ──
+    with phase("ringkasan.satker", profile_rows(cube_sect)):
+        st.markdown(f"""
+        <div class="sh">
+            <h2>🏢 Top 10 Satuan Kerja — Nilai Pagu Terbesar ({label})</h2>
+            <p>Satker dengan rencana anggaran pengadaan terbesar</p>
+        </div>""", unsafe_allow_html=True)
+
+        if "Satuan_Kerja" in cube_sect.columns:
+            def satker():
+                top = cube_top(cube_sect, "Satuan_Kerja", 10)
+                if len(top) == 0:
+                    return top, 0, {}
+                return (top, cube_nunique(cube_sect, "Satuan_Kerja"),
+                        top_paket_by(df_sect, "Satuan_Kerja", top["Satuan_Kerja"], 10))
+            df_sk, n_sk, paket_per_sk = cached_agg(agg_ctx, "ringkasan.satker", satker)
+
+            if len(df_sk) > 0:
+                cs = df_sk.copy()
+                cs["Label"] = cs["Satuan_Kerja"].apply(lambda x: str(x)[:42])
+                show_hbar(cs, "Total_Pagu", "Label",
+                          f"Top 10 Satuan Kerja — {label}",
+                          f"Dari {fmt_n(n_sk)} satker",
+                          ("Oranges_r", 10), total_pagu_sect)
+
+                st.markdown("#### 📋 Detail Paket per Satker")
+                for _, row in df_sk.iterrows():
+                    sk = row["Satuan_Kerja"]
+                    with st.expander(f"🏢 **{sk}** — {fmt_rp(row['Total_Pagu'])} ({fmt_n(row['Jumlah_Paket'])} paket)"):
+                        detail = paket_per_sk.get(sk, pd.DataFrame(columns=PAKET_COLS))
+                        detail_show = detail.copy()
+                        detail_show["Pagu_Rp"] = detail_show["Pagu_Rp"].apply(fmt_rp)
+                        detail_show.columns = ["Nama Paket", "Pagu (Rp)", "Jenis", "Metode"]
+                        st.dataframe(detail_show, use_container_width=True, hide_index=True)
+
+    st.markdown("<br>", unsafe_allow_html=True)
+
+    # ── D. DISTRIBUSI ──
+    with phase("ringkasan.distribusi", profile_rows(cube_sect)):
+        st.markdown(f"""
+        <div class="sh">
+            <h2>📊 Distribusi ({label})</h2>
+            <p>Per jenis pengadaan, metode, dan timeline pemilihan</p>
+        </div>""", unsafe_allow_html=True)
+
+        def distribusi():
+            dj = cube_top(cube_sect, "Jenis_Pengadaan", 8) if "Jenis_Pengadaan" in cube_sect.columns else None
+            dm = cube_top(cube_sect, "Metode", 8) if "Metode" in cube_sect.columns else None
+            dt = None
+            if "Pemilihan" in cube_sect.columns:
+                dt = cube_group(cube_sect, "Pemilihan")
+                # Sort by month order
+                month_order = {
+                    'January': 1, 'February': 2, 'March': 3, 'April': 4,
+                    'May': 5, 'June': 6, 'July': 7, 'August': 8,
+                    'September': 9, 'October': 10, 'November': 11, 'December': 12
+                }
+                dt["sort_key"] = dt["Pemilihan"].astype(str).apply(
+                    lambda x: next((v * 100 + (int(str(x).split()[-1]) if str(x).split()[-1].isdigit() else 0)
+                                   for k, v in month_order.items() if k in str(x)), 999))
+                dt = dt.sort_values("sort_key").head(15)
+            return dj, dm, dt
+        dj, dm, dt = cached_agg(agg_ctx, "ringkasan.distribusi", distribusi)
+
+        col_a, col_b = st.columns(2)
+
+        with col_a:
+            if dj is not None and len(dj) > 0:
+                show_hbar(dj, "Total_Pagu", "Jenis_Pengadaan",
+                          "Per Jenis Pengadaan", "",
+                          ("Greens_r", len(dj)),
+                          total_pagu_sect, figsize=(8, 4))
+
+        with col_b:
+            if dm is not None and len(dm) > 0:
+                show_hbar(dm, "Total_Pagu", "Metode",
+                          "Per Metode Pemilihan", "",
+                          ("Purples_r", len(dm)),
+                          total_pagu_sect, figsize=(8, 4))
+
+        # Timeline Pemilihan
+        if dt is not None and len(dt) > 0:
+            st.markdown(f'<div class="sh"><h2>📅 Timeline Pemilihan ({label})</h2><p>Rencana waktu pelaksanaan pengadaan</p></div>', unsafe_allow_html=True)
+            show_hbar(dt, "Total_Pagu", "Pemilihan",
+                      f"Pagu per Waktu Pemilihan — {label}",
+                      f"Total: {fmt_rp(total_pagu_sect)}",
+                      ("YlOrRd_r", len(dt)),
+                      total_pagu_sect, figsize=(14, 6))
+
+
+def render_deepdive(df_sect, cube_sect, total_pagu_sect, label, key_prefix, export_ctx):
+    """
+    Deep Dive: pilih Provinsi → lihat detail Kab/Kota, Satker, Paket.
+    Agregat dari `cube_sect` (lewat cache agregasi lintas sesi); baris mentah
+    `df_sect` hanya untuk detail paket & CSV.
+    """
+    agg_ctx = agg_context(export_ctx, key_prefix)
+
+    st.markdown(f"""
+    <div class="sh">
+        <h2>🔎 Deep Dive per Wilayah — {label}</h2>
+        <p>Pilih provinsi untuk melihat detail per kabupaten/kota dan satuan kerja</p>
+    </div>""", unsafe_allow_html=True)
+
+    # Selector
+    col1, col2 = st.columns([1, 2])
+
+    prov_ranked = cached_agg(agg_ctx, "deepdive.provinsi", lambda: cube_top(cube_sect, "Provinsi"))
+    prov_opts = prov_ranked["Provinsi"].tolist() if len(prov_ranked) > 0 else ["Tidak ada data"]
+
+    with col1:
+        tipe_f = st.selectbox("📍 Filter Tipe Daerah",
+                              ["Semua", "Kabupaten", "Kota", "Lainnya"],
+                              key=f"tf_{key_prefix}")
+    with col2:
+        sel_prov = st.selectbox("🗺️ Pilih Provinsi", prov_opts,
+                                key=f"sp_{key_prefix}")
+
+    if sel_prov and sel_prov != "Tidak ada data":
+        def wilayah(frame):
+            """Subset provinsi (+ tipe daerah) terpilih — RowView / SqlView, tanpa salinan."""
+            frame = rows_isin(frame, "Provinsi", [sel_prov])
+            return rows_isin(frame, "Tipe_Daerah", [tipe_f]) if tipe_f != "Semua" else frame
+
+        def wilayah_agg():
+            cube_wil = wilayah(cube_sect)
+            out = {"tot": cube_totals(cube_wil), "rows": profile_rows(cube_wil),
+                   "dd": None, "satker_per_daerah": {}, "dsk": None, "paket_per_sk": {},
+                   "dj": None, "dm": None}
+            if "Daerah" in cube_sect.columns:
+                dd = out["dd"] = cube_top(cube_wil, ["Daerah", "Tipe_Daerah"], 10)
+                dd["Label"] = dd.apply(lambda r: f"{r['Daerah']} ({r['Tipe_Daerah'][:3]}.)", axis=1)
+                if len(dd) > 0:
+                    out["satker_per_daerah"] = cube_top_by(cube_wil, "Daerah", "Satuan_Kerja", dd["Daerah"], 5)
+            if "Satuan_Kerja" in cube_sect.columns:
+                dsk = out["dsk"] = cube_top(cube_wil, "Satuan_Kerja", 10)
+                if len(dsk) > 0:
+                    out["paket_per_sk"] = top_paket_by(wilayah(df_sect), "Satuan_Kerja", dsk["Satuan_Kerja"], 10)
+            if "Jenis_Pengadaan" in cube_sect.columns:
+                out["dj"] = cube_top(cube_wil, "Jenis_Pengadaan", 6)
+            if "Metode" in cube_sect.columns:
+                out["dm"] = cube_top(cube_wil, "Metode", 6)
+            return out
+        w = cached_agg(agg_ctx, ("deepdive.wilayah", sel_prov, tipe_f), wilayah_agg)
+
+        tot = w["tot"]
+        wp, wk, ws, wl = tot["pagu"], tot["paket"], tot["satker"], tot["klpd"]
+
+        st.markdown(f'<div style="background:#FFF3F3;border:3px solid #ED1C24;border-radius:14px;padding:20px 28px;margin:16px 0"><h3 style="color:#B71C1C!important;margin:0;font-size:24px;font-weight:800">📍 {sel_prov} — {label}</h3></div>', unsafe_allow_html=True)
+
+        c1, c2, c3, c4 = st.columns(4)
+        pct = f"{(wp/total_pagu_sect*100):.2f}% dari semesta" if total_pagu_sect > 0 else ""
+        with c1: st.markdown(mc_html("Total Pagu", fmt_rp(wp), pct), unsafe_allow_html=True)
+        with c2: st.markdown(mc_html("Jumlah Paket", fmt_n(wk)), unsafe_allow_html=True)
+        with c3: st.markdown(mc_html("K/L/PD", fmt_n(wl)), unsafe_allow_html=True)
+        with c4: st.markdown(mc_html("Satuan Kerja", fmt_n(ws)), unsafe_allow_html=True)
+        st.markdown("<br>", unsafe_allow_html=True)
+
+        # Top 10 Kab/Kota
+        with phase("deepdive.kabkota", w["rows"]):
+            st.markdown(f'<div class="sh"><h2>🏘️ Top 10 Kab/Kota — {sel_prov}</h2><p>Berdasarkan total Pagu per daerah | {label}</p></div>', unsafe_allow_html=True)
+
+            dd = w["dd"]
+            if dd is not None and len(dd) > 0:
+                show_hbar(dd, "Total_Pagu", "Label",
+                          f"Top 10 Kab/Kota — {sel_prov}",
+                          f"Total pagu provinsi: {fmt_rp(wp)}",
+                          ("RdYlGn_r", 10), wp)
+
+                st.markdown("#### 📋 Detail per Kab/Kota")
+                satker_per_daerah = w["satker_per_daerah"]
+                for _, row in dd.iterrows():
+                    dr = row["Daerah"]
+                    with st.expander(f"🏘️ **{row['Label']}** — {fmt_rp(row['Total_Pagu'])} ({fmt_n(row['Jumlah_Paket'])} paket)"):
+                        detail = satker_per_daerah.get(dr)
+                        if detail is not None and len(detail) > 0:
+                            detail = detail.assign(Total_Pagu=detail["Total_Pagu"].apply(fmt_rp))
+                            detail.columns = ["Satuan Kerja", "Total Pagu (Rp)", "Jumlah Paket"]
+                            st.dataframe(detail, use_container_width=True, hide_index=True)
+
+        st.markdown("<br>", unsafe_allow_html=True)
+
+        # Top 10 Satker di Wilayah
+        with phase("deepdive.satker", w["rows"]):
+            st.markdown(f'<div class="sh"><h2>🏢 Top 10 Satuan Kerja — {sel_prov}</h2><p>Satker dengan anggaran terbesar | {label}</p></div>', unsafe_allow_html=True)
+
+            dsk = w["dsk"]
+            if dsk is not None and len(dsk) > 0:
+                cs = dsk.copy()
+                cs["Label"] = cs["Satuan_Kerja"].apply(lambda x: str(x)[:42])
+                show_hbar(cs, "Total_Pagu", "Label",
+                          f"Top 10 Satker — {sel_prov}",
+                          f"Dari {fmt_n(ws)} satker",
+                          ("Oranges_r", 10), wp)
+
+                st.markdown("#### 📋 Detail Paket per Satker")
+                paket_per_sk = w["paket_per_sk"]
+                for _, row in dsk.iterrows():
+                    sk = row["Satuan_Kerja"]
+                    with st.expander(f"🏢 **{sk}** — {fmt_rp(row['Total_Pagu'])} ({fmt_n(row['Jumlah_Paket'])} paket)"):
+                        pkts = paket_per_sk.get(sk, pd.DataFrame(columns=PAKET_COLS))
+                        ps = pkts.copy()
+                        ps["Pagu_Rp"] = ps["Pagu_Rp"].apply(fmt_rp)
+                        ps.columns = ["Nama Paket", "Pagu (Rp)", "Jenis", "Metode"]
+                        st.dataframe(ps, use_container_width=True, hide_index=True)
+
+                st.download_button(f"📥 CSV Data {sel_prov} ({label})",
+                                   csv_export(export_ctx, f"wil_{key_prefix}_{sel_prov}_{tipe_f}",
+                                              lambda: wilayah(df_sect)),
+                                   f"RUP_{sel_prov}_{label}_{datetime.now():%Y%m%d}.csv",
+                                   "text/csv", key=f"dl_wil_{key_prefix}", on_click="ignore")
+
+        st.markdown("<br>", unsafe_allow_html=True)
+
+        # Distribusi Wilayah
+        with phase("deepdive.komposisi", w["rows"]):
+            st.markdown(f'<div class="sh"><h2>📊 Komposisi — {sel_prov}</h2><p>Distribusi pagu | {label}</p></div>', unsafe_allow_html=True)
+            ca, cb = st.columns(2)
+            with ca:
+                dj = w["dj"]
+                if dj is not None and len(dj) > 0:
+                    show_hbar(dj, "Total_Pagu", "Jenis_Pengadaan", "Per Jenis Pengadaan",
+                              "", ("Greens_r", len(dj)), wp, figsize=(8, 4))
+            with cb:
+                dm = w["dm"]
+                if dm is not None and len(dm) > 0:
+                    show_hbar(dm, "Total_Pagu", "Metode", "Per Metode",
+                              "", ("Purples_r", len(dm)), wp, figsize=(8, 4))
+
+
+def render_ict_kategori(cube_ict, total_ict_pagu, export_ctx):
+    """Breakdown pagu per Kategori_ICT (header sektor ICT)."""
+    st.markdown('<div class="sh"><h2>📊 Breakdown Kategori ICT</h2><p>Pagu per kategori (Connectivity, Cloud, Hardware, Software, dll)</p></div>', unsafe_allow_html=True)
+
+    with phase("ict.kategori", profile_rows(cube_ict)):
+        def kategori():
+            top = cube_top(cube_ict, "Kategori_ICT")
+            return top[top["Total_Pagu"] > 0]
+        df_cat = cached_agg(agg_context(export_ctx, "ict"), "ict.kategori", kategori)
+
+        if len(df_cat) > 0:
+            show_hbar(df_cat, "Total_Pagu", "Kategori_ICT",
+                      "Pagu per Kategori ICT",
+                      f"Total ICT: {fmt_rp(total_ict_pagu)}",
+                      ("coolwarm_r", len(df_cat)),
+                      total_ict_pagu, figsize=(14, 6))
+
+
+def prerender_default_views(df, cube, version, export_dir):
+    """
+    Render tampilan default ketiga sektor (tanpa filter, widget di nilai awal —
+    label & key sama dengan main()) di luar server Streamlit, sehingga
+    chart_cache() berisi persis chart yang dilihat pengunjung pertama.
+    Return [(chart_key, png)].
+    """
+    cache = chart_cache()
+    cache.clear()
+    rows_index = build_filter_index(df, version, "rows")
+    cube_index = build_filter_index(cube, version, "cube")
+    filters = tuple(distinct_values(df, c) if c in df.columns else []
+                    for c in ["Provinsi", "Tipe_Daerah", "Jenis_Pengadaan", "Metode"]) + ([],)
+    export_ctx = (export_dir, version, tuple(tuple(sorted(map(str, f))) for f in filters))
+    for sektor, label, prefix in [(None, "Semua Sektor", "all"), ("ICT", "Sektor ICT", "ict"),
+                                  ("Non-ICT", "Sektor Non-ICT", "ni")]:
+        df_sect = apply_filters(df, rows_index, filters, sektor)
+        cube_sect = apply_filters(cube, cube_index, filters, sektor)
+        total = cube_totals(cube_sect)["pagu"]
+        if sektor == "ICT":
+            render_ict_kategori(cube_sect, total, export_ctx)
+        render_ringkasan(df_sect, cube_sect, total, label, f"{prefix}_n", export_ctx)
+        render_deepdive(df_sect, cube_sect, total, label, f"{prefix}_d", export_ctx)
+    return cache.items()
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# MAIN APP
+# app.py hanya memanggil main() — modul paket rup diimpor sekali per proses,
+# jadi setiap rerun langsung mulai di sini (tanpa compile rule / impor ulang).
+# ═══════════════════════════════════════════════════════════════════════════
+
+def main():
+    admin = is_admin()
+    # Profiling per rerun hanya jika ada yang membaca (panel admin / log file)
+    start_profile(bool(admin or RUP_PROFILE_LOG))
+    t_run = time.perf_counter()
+    # Rule ICT diedit saat server jalan → compile ulang di sini (versi data ikut berubah)
+    rules_error = classification.reload_ict_rules()
+
+    st.markdown(CSS, unsafe_allow_html=True)
+
+    st.markdown("""
+    <div class="main-header">
+        <h1>📊 Dashboard Rencana Umum Pengadaan (RUP) 2026</h1>
+        <p>Analisis SI Channel • ICT & Non-ICT • Peluang Pengadaan Pemerintah • Telkomsel Enterprise</p>
+    </div>
+    """, unsafe_allow_html=True)
+
+
+    # ═══════════════════════════════════════════════════════════════════════════
+    # SIDEBAR — KONFIGURASI & FILTERS
+    # ═══════════════════════════════════════════════════════════════════════════
+
+    with st.sidebar:
+        st.markdown("## ⚙️ Konfigurasi Database")
+        st.markdown("---")
+
+        DB_DEFAULT = "RUP.db"
+        db_path = st.text_input("📁 Path Database SQLite", value=DB_DEFAULT,
+                                help="Lokasi file RUP.db")
+
+        if not os.path.exists(db_path):
+            st.error(f"⚠️ File `{db_path}` tidak ditemukan.\n\n"
+                     f"Letakkan file RUP.db di folder yang sama dengan script ini.")
+            st.stop()
+
+        with st.spinner("⏳ Memuat data RUP 2026..."), phase("load"):
+            data_version = db_version(db_path)
+            df = bundle = None
+            if RUP_BACKEND == "sqlite":
+                df = load_rup_view(db_path, data_version)
+            elif RUP_BACKEND == "duckdb":
+                df = load_rup_duckdb(db_path, data_version)  # None → fallback pandas
+            if df is None:
+                bundle = load_rup_bundle(db_path, data_version)  # hasil tools/precompute.py
+                df = bundle[0] if bundle is not None else load_rup_data(db_path, data_version)
+
+        if df.empty:
+            st.error("❌ Database kosong atau tidak dapat dibaca.")
+            st.stop()
+
+        with phase("cube"):
+            if bundle is not None:
+                cube = bundle[1]
+            else:
+                cube = df.cube if is_sql_view(df) else build_rup_cube(df, data_version)
+        with st.spinner("⏳ Menyiapkan indeks pencarian..."):
+            search_path = load_search_index(df, db_path, data_version)
+        st.success(f"✅ **{fmt_n(len(df))}** record dimuat")
+        st.caption(f"Rule ICT `{classification.ICT_RULE_HASH}` · {os.path.basename(RUP_ICT_RULES)}")
+        if rules_error:
+            st.warning(f"⚠️ Rule ICT baru tidak dipakai: {rules_error}")
+        st.markdown("---")
+
+        # ── FILTER PROVINSI ──
+        st.markdown("### 🗺️ Filter Provinsi")
+        prov_all = distinct_values(df, "Provinsi")
+        sel_prov_filter = st.multiselect("Provinsi", prov_all, prov_all, key="f_prov")
+
+        # ── FILTER TIPE DAERAH ──
+        st.markdown("### 🏘️ Filter Tipe Daerah")
+        tipe_all = distinct_values(df, "Tipe_Daerah")
+        sel_tipe = st.multiselect("Tipe", tipe_all, tipe_all, key="f_tipe")
+
+        # ── FILTER JENIS PENGADAAN ──
+        st.markdown("### 📋 Filter Jenis Pengadaan")
+        jenis_all = distinct_values(df, "Jenis_Pengadaan") if "Jenis_Pengadaan" in df.columns else []
+        sel_jenis = st.multiselect("Jenis Pengadaan", jenis_all, jenis_all, key="f_jenis")
+
+        # ── FILTER METODE ──
+        st.markdown("### 🔍 Filter Metode")
+        metode_all = distinct_values(df, "Metode") if "Metode" in df.columns else []
+        sel_metode = st.multiselect("Metode", metode_all, metode_all, key="f_metode")
+
+        # ── FILTER SATUAN KERJA ──
+        st.markdown("### 🏢 Filter Satuan Kerja")
+        if "Satuan_Kerja" in df.columns:
+            satker_all = distinct_values(df, "Satuan_Kerja")
+            # Searchable selectbox karena bisa ribuan
+            st.caption(f"Total: {fmt_n(len(satker_all))} satker")
+            sel_satker = st.multiselect(
+                "Satuan Kerja",
+                satker_all,
+                default=[],  # Default kosong = semua
+                key="f_satker",
+                help="Kosongkan = tampilkan semua. Pilih satker spesifik untuk filter."
+            )
+        else:
+            sel_satker = []
+
+        st.markdown("---")
+        st.caption(f"Telkomsel Enterprise | Bid Management\n{datetime.now():%d %B %Y}")
+
+
+    # ═══════════════════════════════════════════════════════════════════════════
+    # APPLY FILTERS
+    # ═══════════════════════════════════════════════════════════════════════════
+
+    filters = (sel_prov_filter, sel_tipe, sel_jenis, sel_metode, sel_satker)
+    export_ctx = (os.path.join(cache_dir(db_path), "exports"), data_version,
+                  tuple(tuple(sorted(map(str, f))) for f in filters))
+    with phase("filter", profile_rows(df)):
+        if is_sql_view(df):
+            rows_index = cube_index = None
+        elif bundle is not None:
+            rows_index, cube_index = bundle[2]["rows"], bundle[2]["cube"]
+        else:
+            rows_index = build_filter_index(df, data_version, "rows")
+            cube_index = build_filter_index(cube, data_version, "cube")
+        df_filtered = apply_filters(df, rows_index, filters)
+        cube_filtered = apply_filters(cube, cube_index, filters)
+
+        # Sector splits (baris mentah per sektor dibuat hanya untuk sektor yang dibuka)
+        cube_ict = apply_filters(cube, cube_index, filters, "ICT")
+        cube_non = apply_filters(cube, cube_index, filters, "Non-ICT")
+
+
+    # ═══════════════════════════════════════════════════════════════════════════
+    # METRIC CARDS UTAMA
+    # ═══════════════════════════════════════════════════════════════════════════
+
+    with phase("metric_cards"):
+        tot_all, tot_ict, tot_non = cached_agg(
+            agg_context(export_ctx, "main"), "metric_cards",
+            lambda: (cube_totals(cube_filtered), cube_totals(cube_ict), cube_totals(cube_non)))
+        total_pagu = tot_all["pagu"]
+        total_paket = tot_all["paket"]
+        total_ict_pagu = tot_ict["pagu"]
+        total_non_pagu = tot_non["pagu"]
+        total_satker = tot_all["satker"]
+        total_klpd = tot_all["klpd"]
+
+        c1, c2, c3, c4, c5 = st.columns(5)
+        with c1:
+            st.markdown(mc_html("Total Pagu RUP", fmt_rp(total_pagu), f"{fmt_n(total_paket)} paket"), unsafe_allow_html=True)
+        with c2:
+            pct_ict = f"{total_ict_pagu/total_pagu*100:.1f}%" if total_pagu > 0 else "0%"
+            st.markdown(mc_html("Pagu ICT", fmt_rp(total_ict_pagu), f"{fmt_n(tot_ict['paket'])} paket ({pct_ict})"), unsafe_allow_html=True)
+        with c3:
+            pct_non = f"{total_non_pagu/total_pagu*100:.1f}%" if total_pagu > 0 else "0%"
+            st.markdown(mc_html("Pagu Non-ICT", fmt_rp(total_non_pagu), f"{fmt_n(tot_non['paket'])} paket ({pct_non})"), unsafe_allow_html=True)
+        with c4:
+            st.markdown(mc_html("K/L/PD", fmt_n(total_klpd), f"{fmt_n(tot_all['provinsi'])} provinsi"), unsafe_allow_html=True)
+        with c5:
+            st.markdown(mc_html("Satuan Kerja", fmt_n(total_satker)), unsafe_allow_html=True)
+
+    st.markdown("<br>", unsafe_allow_html=True)
+
+    # Info filter satker aktif
+    if sel_satker:
+        st.markdown(f'<div class="ib">🏢 <strong>Filter Satuan Kerja Aktif:</strong> {len(sel_satker)} satker dipilih — '
+                    f'{fmt_n(total_paket)} paket ({fmt_rp(total_pagu)})</div>', unsafe_allow_html=True)
+
+
+    # ═══════════════════════════════════════════════════════════════════════════
+    # PENCARIAN PAKET (FTS5)
+    # ═══════════════════════════════════════════════════════════════════════════
+
+    st.markdown('<div class="sh"><h2>🔍 Cari Paket</h2><p>Nama paket, satuan kerja, atau K/L/PD — mengikuti filter sidebar, terurut relevansi</p></div>', unsafe_allow_html=True)
+    q_paket = st.text_input("Cari paket", key="q_paket", label_visibility="collapsed",
+                            placeholder="mis. SD-WAN, data center, radio trunking")
+    if q_paket.strip():
+        if search_path is None:
+            st.warning("⚠️ Pencarian tidak tersedia: SQLite di server ini tidak mendukung FTS5.")
+        else:
+            with phase("search", profile_rows(df)):
+                t0 = time.perf_counter()
+                hits, n_hits = search_paket(df, rows_index, filters, search_path, q_paket)
+                ms = (time.perf_counter() - t0) * 1000
+                st.caption(f"{fmt_n(n_hits)} paket cocok ({ms:.0f} ms)"
+                           + (f" — menampilkan {fmt_n(len(hits))} teratas" if n_hits > len(hits) else ""))
+                if len(hits) > 0:
+                    hits = hits.assign(Pagu_Rp=hits["Pagu_Rp"].apply(fmt_rp)).rename(columns={
+                        "Nama_Paket": "Nama Paket", "Pagu_Rp": "Pagu (Rp)", "Satuan_Kerja": "Satuan Kerja",
+                        "KLPD": "K/L/PD", "Jenis_Pengadaan": "Jenis"})
+                    st.dataframe(hits, use_container_width=True, hide_index=True)
+
+    st.markdown("---")
+
+    # ═══════════════════════════════════════════════════════════════════════════
+    # NAVIGASI SEKTOR — SEMUA / ICT / NON-ICT
+    # Lazy: hanya sektor + sub-view yang dipilih yang dihitung dan di-render
+    # (st.tabs mengeksekusi semua isi tab di setiap rerun).
+    # ═══════════════════════════════════════════════════════════════════════════
+
+    SEKTOR_NAV = ["📊  SEMUA SEKTOR", "💻  SEKTOR ICT", "📦  SEKTOR NON-ICT"]
+    sektor_nav = st.radio("Sektor", SEKTOR_NAV, horizontal=True,
+                          label_visibility="collapsed", key="nav_sektor")
+    st.markdown("---")
+
+    # ─── SEMUA SEKTOR ───
+    if sektor_nav == SEKTOR_NAV[0]:
+        view = st.radio("Tampilan", ["🏠 Ringkasan Nasional", "🔎 Deep Dive per Wilayah"],
+                        horizontal=True, label_visibility="collapsed", key="nav_all")
+        if view.startswith("🏠"):
+            render_ringkasan(df_filtered, cube_filtered, total_pagu, "Semua Sektor", "all_n", export_ctx)
+        else:
+            render_deepdive(df_filtered, cube_filtered, total_pagu, "Semua Sektor", "all_d", export_ctx)
+
+    # ─── SEKTOR ICT ───
+    elif sektor_nav == SEKTOR_NAV[1]:
+        st.markdown("""
+        <div class="ib">
+            💻 <strong>SEKTOR ICT</strong> — Paket mengandung keyword: Internet, Bandwidth, 
+            Fiber Optic, Cloud, Server, CCTV, Software, Laptop, Router, dll.<br>
+            <em>False positive difilter: Obat, Vaksin, Konstruksi, Makanan, ATK, Kendaraan, dll.</em>
+        </div>""", unsafe_allow_html=True)
+
+        render_ict_kategori(cube_ict, total_ict_pagu, export_ctx)
+
+        df_ict = apply_filters(df, rows_index, filters, "ICT")
+        view = st.radio("Tampilan", ["🏠 Ringkasan Nasional ICT", "🔎 Deep Dive per Wilayah ICT"],
+                        horizontal=True, label_visibility="collapsed", key="nav_ict")
+        if view.startswith("🏠"):
+            render_ringkasan(df_ict, cube_ict, total_ict_pagu, "Sektor ICT", "ict_n", export_ctx)
+        else:
+            render_deepdive(df_ict, cube_ict, total_ict_pagu, "Sektor ICT", "ict_d", export_ctx)
+
+    # ─── SEKTOR NON-ICT ───
+    else:
+        st.markdown("""
+        <div class="ib">
+            📦 <strong>SEKTOR NON-ICT</strong> — Semua paket yang <em>tidak</em> terklasifikasi ICT.<br>
+            <em>Berguna untuk cross-selling: vendor non-ICT yang punya relasi kuat dengan pemerintah 
+            bisa ditawari solusi Telkomsel.</em>
+        </div>""", unsafe_allow_html=True)
+
+        df_non = apply_filters(df, rows_index, filters, "Non-ICT")
+        view = st.radio("Tampilan", ["🏠 Ringkasan Nasional Non-ICT", "🔎 Deep Dive per Wilayah Non-ICT"],
+                        horizontal=True, label_visibility="collapsed", key="nav_ni")
+        if view.startswith("🏠"):
+            render_ringkasan(df_non, cube_non, total_non_pagu, "Sektor Non-ICT", "ni_n", export_ctx)
+        else:
+            render_deepdive(df_non, cube_non, total_non_pagu, "Sektor Non-ICT", "ni_d", export_ctx)
+
+
+    # ═══════════════════════════════════════════════════════════════════════════
+    # FOOTER
+    # ═══════════════════════════════════════════════════════════════════════════
+    st.markdown("---")
+    st.markdown(f"""
+    <div style="text-align:center;padding:20px 0;color:#999!important;font-size:12px;">
+        Dashboard Rencana Umum Pengadaan (RUP) 2026<br>
+        Telkomsel Enterprise | Bid Management — Data Science<br>
+        ICT/Non-ICT Classification • Seaborn + Streamlit | {datetime.now():%Y}
+    </div>
+    """, unsafe_allow_html=True)
+
+    records = profile_records()
+    if records is not None:
+        total = time.perf_counter() - t_run
+        if admin:
+            render_profile_panel(records, total)
+        if RUP_PROFILE_LOG:
+            write_profile_log(RUP_PROFILE_LOG, records, total,
+                              {"backend": RUP_BACKEND, "rows": len(df),
+                               "sektor": sektor_nav, "view": view,
+                               "filters": [len(f) for f in filters],
+                               "cache": cache_stats()})
+        stop_profile()
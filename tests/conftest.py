@@ -0,0 +1,27 @@
+import os
+import shutil
+import subprocess
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# Paket rup/ dan tools/ diimpor dari root repo (sama seperti tools/*.py)
+sys.path.insert(0, ROOT)
+
+
+@pytest.fixture(scope="session")
+def rup_db_template(tmp_path_factory):
+    """RUP.db sintetis 20k baris (tools/gen_rup_db.py, seed tetap) — dibuat sekali per sesi tes."""
+    db = str(tmp_path_factory.mktemp("template") / "RUP.db")
+    subprocess.run([sys.executable, os.path.join(ROOT, "tools", "gen_rup_db.py"), db, "--rows", "20k"],
+                   check=True, capture_output=True)
+    return db
+
+
+@pytest.fixture
+def rup_db(rup_db_template, tmp_path):
+    """Salinan RUP.db sintetis yang boleh diubah tes."""
+    db = str(tmp_path / "RUP.db")
+    shutil.copy(rup_db_template, db)
+    return db
@@ -0,0 +1,71 @@
+"""Bundle precompute: tulis → baca kembali identik (frame, cube, indeks filter + tipe key), bundle baru langsung terpakai."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from rup import aggregation, bundle, loading
+from rup.charts import chart_cache
+
+
+@pytest.fixture
+def built(rup_db, monkeypatch, tmp_path):
+    monkeypatch.setattr(loading, "RUP_CACHE_DIR", str(tmp_path / "cache"))
+    version = loading.db_version(rup_db)
+    df = loading.build_rup_frame(rup_db, version)
+    key = f"{rup_db}-{version}"
+    cube = aggregation.build_rup_cube(df, key)
+    # Key numerik (mis. kode satker / tipe daerah berupa angka) harus kembali dengan dtype-nya
+    codes = df.assign(Satuan_Kerja=df["Satuan_Kerja"].cat.codes.astype("int64") + 10_000,
+                      Tipe_Daerah=df["Tipe_Daerah"].cat.codes.astype("float64") / 2)
+    indexes = {"rows": aggregation.build_filter_index(df, key, "rows"),
+               "cube": aggregation.build_filter_index(cube, key, "cube"),
+               "kode": aggregation.build_filter_index(codes, key, "kode")}
+    return rup_db, version, df, cube, indexes
+
+
+def test_bundle_round_trip(built):
+    db, version, df, cube, indexes = built
+    assert bundle.load_rup_bundle(db, version) is None  # belum ada → tidak di-cache
+
+    chart = ("test-bundle-chart", b"\x89PNG test")
+    bundle.write_rup_bundle(db, version, df, cube, indexes, [chart])
+    loaded = bundle.load_rup_bundle(db, version)
+    assert loaded is not None  # bundle yang muncul setelah panggilan pertama langsung terbaca
+    df2, cube2, indexes2 = loaded
+    pd.testing.assert_frame_equal(df2, df)
+    pd.testing.assert_frame_equal(cube2, cube)
+    assert chart_cache().get(chart[0]) == chart[1]
+
+    assert indexes2.keys() == indexes.keys()
+    for name, index in indexes.items():
+        assert list(indexes2[name]) == list(index)
+        for dim, groups in index.items():
+            groups2 = indexes2[name][dim]
+            assert list(groups2) == list(groups), (name, dim)
+            assert pd.Index(list(groups2)).dtype == pd.Index(list(groups)).dtype, (name, dim)
+            for value, pos in groups.items():
+                np.testing.assert_array_equal(groups2[value], pos)
+
+    kode = indexes["kode"]
+    satker, tipe = list(kode["Satuan_Kerja"])[:3], list(kode["Tipe_Daerah"])[:2]
+    assert isinstance(satker[0], (int, np.integer)) and isinstance(tipe[0], (float, np.floating))
+    provs, tipes = aggregation.distinct_values(df, "Provinsi")[:5], aggregation.distinct_values(df, "Tipe_Daerah")
+    for name, n_rows, filters in [("rows", len(df), [provs, tipes, [], ["Tender"], []]),
+                                  ("cube", len(cube), [provs, tipes, [], ["Tender"], []]),
+                                  ("kode", len(df), [provs, tipe, [], [], satker])]:
+        for sektor in (None, "ICT"):
+            np.testing.assert_array_equal(
+                aggregation.filter_positions(indexes2[name], n_rows, *filters, sektor=sektor),
+                aggregation.filter_positions(indexes[name], n_rows, *filters, sektor=sektor))
+
+
+def test_rewritten_bundle_is_read_again(built):
+    db, version, df, cube, indexes = built
+    bundle.write_rup_bundle(db, version, df, cube, indexes, [])
+    first = bundle.load_rup_bundle(db, version)
+    assert bundle.load_rup_bundle(db, version) is first  # cache_resource: tanpa salinan
+
+    smaller = df.iloc[:100].reset_index(drop=True)
+    bundle.write_rup_bundle(db, version, smaller, cube, indexes, [])
+    pd.testing.assert_frame_equal(bundle.load_rup_bundle(db, version)[0], smaller)
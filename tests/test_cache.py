@@ -0,0 +1,70 @@
+"""LRUCache (batas byte / entri, urutan eviction, statistik) dan cache agregasi lintas sesi (cached_agg)."""
+
+import pandas as pd
+
+from rup import aggregation
+from rup.helpers import LRUCache
+from rup.profiling import profile_records, start_profile, stop_profile
+
+
+def test_byte_cap_evicts_least_recently_used():
+    cache = LRUCache(max_bytes=100, sizeof=len)
+    cache.put("a", b"x" * 40)
+    cache.put("b", b"x" * 40)
+    assert cache.get("a") == b"x" * 40  # a jadi paling baru dipakai
+    assert cache.get("zz") is None
+    cache.put("c", b"x" * 40)  # 120 > 100 → b (paling lama tidak dipakai) dibuang
+    assert [k for k, _ in cache.items()] == ["a", "c"]
+    cache.put("d", b"x" * 70)  # 150 → a lalu c dibuang (urutan LRU) sampai muat
+    assert [k for k, _ in cache.items()] == ["d"]
+    assert cache.get("b") is None and cache.get("c") is None
+    assert cache.stats() == {"entries": 1, "bytes": 70, "max_bytes": 100,
+                             "hits": 1, "misses": 3, "evictions": 3}
+
+
+def test_oversized_and_replaced_values():
+    cache = LRUCache(max_bytes=100, sizeof=len)
+    cache.put("a", b"x" * 60)
+    cache.put("big", b"x" * 101)  # lebih besar dari batas → tidak disimpan, tidak mengusir a
+    cache.put("a", b"x" * 30)  # ganti nilai → ukuran lama dikurangkan
+    assert cache.get("big") is None
+    assert cache.stats() == {"entries": 1, "bytes": 30, "max_bytes": 100,
+                             "hits": 0, "misses": 1, "evictions": 0}
+
+
+def test_entry_cap():
+    cache = LRUCache(max_entries=2)
+    for k in "abc":
+        cache.put(k, k)
+    assert [k for k, _ in cache.items()] == ["b", "c"]
+    assert cache.stats()["evictions"] == 1 and cache.stats()["max_bytes"] is None
+
+
+def test_cached_agg_computes_once_per_key_within_cap(monkeypatch):
+    frame = pd.DataFrame({"Provinsi": ["Aceh", "Bali"], "Total_Pagu": [1, 2]})
+    size = aggregation.agg_nbytes(frame)
+    cache = LRUCache(max_bytes=2 * size, sizeof=aggregation.agg_nbytes)
+    monkeypatch.setattr(aggregation, "agg_cache", lambda: cache)
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return frame.copy()
+
+    ctx_a = aggregation.agg_context(("exports", "v1", ("semua",)), "ICT")
+    ctx_b = aggregation.agg_context(("exports", "v1", ("DKI",)), "ICT")
+    start_profile()
+    try:
+        first = aggregation.cached_agg(ctx_a, "top_prov", compute)
+        assert aggregation.cached_agg(ctx_a, "top_prov", compute) is first  # hit: objek yang sama
+        aggregation.cached_agg(ctx_b, "top_prov", compute)
+        aggregation.cached_agg(ctx_a, "distribusi", compute)  # entri ketiga → ctx_a/top_prov dibuang
+        aggregation.cached_agg(ctx_a, "top_prov", compute)
+        phases = [r["phase"] for r in profile_records()]
+    finally:
+        stop_profile()
+    assert len(calls) == 4
+    assert phases == ["agg.compute", "agg.cached", "agg.compute", "agg.compute", "agg.compute"]
+    stats = cache.stats()
+    assert (stats["entries"], stats["hits"], stats["misses"], stats["evictions"]) == (2, 1, 4, 2)
+    assert stats["bytes"] <= stats["max_bytes"]
@@ -0,0 +1,117 @@
+"""Engine klasifikasi ICT (regex satu pass & automaton token) identik dengan classify_ict + get_ict_category."""
+
+import itertools
+import re
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from rup import classification
+from rup.classification import classify_ict_series, classify_ict_text, classify_ict_tokens
+
+
+def reference(whitelist, blacklist):
+    """Padanan skalar classify_ict / get_ict_category versi awal (per baris, regex per kategori)."""
+    ict_re = re.compile("|".join(p for pats in whitelist.values() for p in pats), re.IGNORECASE)
+    bl_re = re.compile("|".join(blacklist), re.IGNORECASE)
+    cat_re = {cat: re.compile("|".join(pats), re.IGNORECASE) for cat, pats in whitelist.items()}
+
+    def classify(nama):
+        if pd.isna(nama):
+            return False, None
+        text = str(nama)
+        is_ict = bool(ict_re.search(text) and not bl_re.search(text))
+        if bl_re.search(text):
+            return is_ict, None
+        return is_ict, next((cat for cat, regex in cat_re.items() if regex.search(text)), None)
+    return classify
+
+
+# Korpus tetap (disalin dari tools/gen_rup_db.py, sengaja tidak diimpor: generator benchmark
+# boleh berubah tanpa menggeser cakupan tes ini)
+PAKET_ICT = [
+    "Belanja Langganan Internet", "Pengadaan Laptop", "Pengadaan Komputer Desktop", "Sewa Cloud Server",
+    "Pengadaan CCTV dan NVR", "Pengembangan Aplikasi E-Office", "Pemeliharaan Sistem Informasi Kepegawaian",
+    "Langganan Bandwidth Metro Ethernet", "Pengadaan Router dan Switch", "Belanja Pulsa dan Paket Data",
+    "Lisensi Software Antivirus", "Pengadaan Server dan Storage", "Jasa Colocation Data Center",
+    "Pengadaan Perangkat Video Conference", "Pembangunan Jaringan Fiber Optic", "Pengadaan Firewall",
+    "Maintenance Jaringan LAN", "Pengadaan Access Point Wi-Fi", "Pengadaan GPS Tracker Kendaraan Operasional",
+    "Pengembangan Website Resmi", "Smart City Command Center",
+]
+PAKET_BLACKLIST = [
+    "Pengadaan Obat dan Vaksin", "Belanja Makanan dan Minuman Rapat", "Pembangunan Gedung Kantor (Konstruksi)",
+    "Belanja ATK", "Pengadaan Kendaraan Dinas", "Pengadaan Alat Kesehatan", "Belanja Tinta dan Toner Printer",
+    "Pengadaan Seragam Dinas", "Pengadaan Buku Perpustakaan", "Pengadaan Printer dan Laptop",
+    "Belanja Server Makanan Katering", "Pengadaan Mobil Ambulans", "Rehabilitasi Bangunan Sekolah",
+]
+PAKET_LAIN = [
+    "Jasa Kebersihan Kantor", "Belanja Perjalanan Dinas", "Honorarium Narasumber", "Jasa Keamanan Gedung",
+    "Pemeliharaan Jalan Lingkungan", "Belanja Bahan Bakar Minyak", "Jasa Konsultansi Perencanaan",
+    "Pengadaan Bibit Tanaman", "Belanja Sewa Gedung Pertemuan", "Pengadaan Meubelair",
+    "Jasa Tenaga Pendukung Administrasi", "Belanja Listrik dan Air", "Aplikasi Lamaran Kerja Manual",
+    "Zoom In Kamera Dokumentasi Kegiatan", "Pelatihan Peningkatan Kapasitas Aparatur",
+]
+SUFFIXES = ["", "Tahun Anggaran 2026", "Paket 17", "Dinas Pendidikan", "Dinas Kesehatan", "Dinas Pekerjaan Umum"]
+
+EDGE_CASES = [
+    None, np.nan, pd.NA, "", " ", "\t", "123", 2026,
+    # blacklist menang atas whitelist
+    "Pengadaan Printer dan Laptop", "Belanja Server Makanan Katering", "Lisensi Software Alat Kesehatan",
+    "Mobil Operasional CCTV", "Mobil App Internet", "CCTV untuk Gedung Konstruksi",
+    # lookahead negatif
+    "Fiber Glass Kolam", "Fiber Optic Backbone", "Cloud Nine Hotel", "Zoom In Kamera", "Zoom Meeting",
+    "Switch On Genset", "Switch Managed 24 Port", "UPS Delivery", "UPS 3 kVA", "Storage Box Arsip",
+    "Storage Rack Besi", "DVR Player", "Aplikasi Lamaran Kerja", "Aplikasi E-Kinerja",
+    # beberapa kategori sekaligus: kategori pertama di rule yang menang
+    "Maintenance Network Security", "Maintenance Jaringan dan Router", "Laptop dan Internet",
+    "Router Wifi Hotspot", "Server Cloud Hosting", "CCTV IP Camera dengan Aplikasi",
+    "Pengadaan Komputer, Server, Switch dan Lisensi Software",
+    # variasi spasi / tanda baca / huruf
+    "ip   phone", "IP\tPHONE", "IP-PHONE", "wi-fi", "WI FI", "WiFi", "Fiber    Optik", "FIBEROPTIC",
+    "gps tracking", "GPS Tracker", "Telematic", "TELEMATICS", "DataCenter", "Data  Center",
+    "Laptop/Notebook", "(CCTV)", "Komputer_Kantor", "CCTV2", "E-Office Website", "Sistem\nInformasi",
+    # non-ASCII (engine token jatuh ke regex)
+    "Café Internet", "Pengadaan Komputer – Dinas", "İnternet", "ＣＣＴＶ", "Laptop für Büro",
+]
+
+
+def corpus():
+    """Nama paket korpus tetap × sufiks + keyword rule + kasus tepi."""
+    names = [f"{base} {suffix}".strip()
+             for base, suffix in itertools.product(PAKET_ICT + PAKET_BLACKLIST + PAKET_LAIN, SUFFIXES)]
+    # setiap keyword rule muncul sendirian, di tengah kalimat, dan huruf kecil
+    for pats in list(classification.ICT_WHITELIST.values()) + [classification.BLACKLIST_PATTERNS]:
+        for pat in pats:
+            word = re.sub(r"\(\?!.*?\)|\\b|[\[\]?()|]", "", pat).replace(r"\s*", " ").replace(r"\s+", " ")
+            names += [word, f"Belanja {word} Kantor", word.lower()]
+    return names + EDGE_CASES
+
+
+@pytest.fixture(scope="module")
+def expected():
+    ref = reference(classification.ICT_WHITELIST, classification.BLACKLIST_PATTERNS)
+    return [ref(v) for v in corpus()]
+
+
+@pytest.mark.parametrize("engine", ["regex", "automaton"])
+@pytest.mark.parametrize("memo", [None, "dict"])
+def test_series_matches_reference(monkeypatch, engine, memo, expected):
+    monkeypatch.setattr(classification, "RUP_ICT_ENGINE", engine)
+    names = pd.Series(corpus() * 2, dtype=object)  # duplikat → broadcast dari nilai unik
+    is_ict, kat = classify_ict_series(names, {} if memo else None)
+    assert is_ict.dtype == bool
+    assert list(zip(is_ict, kat.where(kat.notna(), None))) == expected * 2
+
+
+@pytest.mark.parametrize("fn", [classify_ict_text, classify_ict_tokens])
+def test_scalar_engines_match_reference(fn, expected):
+    for name, exp in zip(corpus(), expected):
+        if pd.isna(name):
+            continue  # engine skalar hanya menerima str (NaN ditangani classify_ict_series)
+        assert fn(str(name)) == exp, name
+
+
+def test_reference_flag_and_category_agree(expected):
+    """Kategori ada ⇔ Is_ICT — syarat engine gabungan mengembalikan keduanya dari satu pass."""
+    assert all(bool(is_ict) == (kat is not None) for is_ict, kat in expected)
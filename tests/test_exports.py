@@ -0,0 +1,38 @@
+"""Export CSV: file ditulis per chunk, di-cache di disk, dan tidak meninggalkan *.tmp saat gagal."""
+
+import os
+
+import pandas as pd
+import pytest
+
+from rup.helpers import csv_export, write_csv
+
+
+class FailingRows:
+    """Frame ber-iter_rows yang gagal setelah chunk pertama (mis. SQLite terkunci di tengah stream)."""
+
+    def iter_rows(self, chunk_rows):
+        yield pd.DataFrame({"a": [1, 2]})
+        raise RuntimeError("stream putus")
+
+
+def test_failed_write_leaves_no_temp_file(tmp_path):
+    with pytest.raises(RuntimeError):
+        write_csv(FailingRows(), str(tmp_path / "out.csv"))
+    assert os.listdir(tmp_path) == []
+
+
+def test_export_is_built_once_and_reused(tmp_path):
+    df = pd.DataFrame({"Nama": ["a", "b", "c"], "Pagu": [1.5, 2.0, 3.0], "Row_Hash": [1, 2, 3]})
+    calls = []
+
+    def make_frame():
+        calls.append(1)
+        return df
+
+    build = csv_export((str(tmp_path), "v1", ("semua",)), "rows", make_frame)
+    data = build()
+    assert data == df.drop(columns="Row_Hash").to_csv(index=False).encode("utf-8")
+    assert build() == data
+    assert len(calls) == 1
+    assert [p.suffix for p in tmp_path.iterdir()] == [".csv"]
@@ -0,0 +1,93 @@
+"""Filter sidebar lewat indeks posisi (build_filter_index / filter_positions) identik dengan mask isin lama."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from rup import aggregation, loading
+from rup.aggregation import apply_filters, build_filter_index, filter_positions
+
+DIMS = ["Provinsi", "Tipe_Daerah", "Jenis_Pengadaan", "Metode", "Satuan_Kerja"]
+
+
+def filter_mask(frame, prov, tipe, jenis, metode, satker, sektor=None):
+    """Mask filter sidebar versi awal (app.py sebelum indeks posisi) + pemilahan sektor."""
+    mask = frame["Provinsi"].isin(prov) & frame["Tipe_Daerah"].isin(tipe)
+    if "Jenis_Pengadaan" in frame.columns and jenis:
+        mask = mask & frame["Jenis_Pengadaan"].isin(jenis)
+    if "Metode" in frame.columns and metode:
+        mask = mask & frame["Metode"].isin(metode)
+    if satker:
+        mask = mask & frame["Satuan_Kerja"].isin(satker)
+    if sektor:
+        mask = mask & (frame["Sektor"] == sektor)
+    return mask.to_numpy()
+
+
+@pytest.fixture(scope="module")
+def frames(rup_db_template, tmp_path_factory):
+    mp = pytest.MonkeyPatch()
+    mp.setattr(loading, "RUP_CACHE_DIR", str(tmp_path_factory.mktemp("cache")))
+    try:
+        df = loading.build_rup_frame(rup_db_template, loading.db_version(rup_db_template))
+    finally:
+        mp.undo()
+    # Kategori NaN di setiap dimensi filter (Lokasi kosong sudah → Provinsi NaN)
+    df = df.copy()
+    for i, col in enumerate(DIMS):
+        df.loc[df.index[i::97], col] = np.nan
+    assert all(df[c].isna().any() for c in DIMS)
+    cube = aggregation.build_rup_cube(df, "test-filters")
+    return {"rows": df, "cube": cube}
+
+
+def random_filters(rng, frame):
+    """Pilihan sidebar acak: kosong, semua nilai, atau subset (kadang dengan nilai yang tidak ada)."""
+    out = []
+    for col in DIMS:
+        values = aggregation.distinct_values(frame, col)
+        r = rng.random()
+        if r < 0.2:
+            out.append([])
+        elif r < 0.45:
+            out.append(list(values))
+        else:
+            pick = list(rng.choice(values, size=int(rng.integers(1, min(len(values), 6) + 1)), replace=False))
+            if rng.random() < 0.2:
+                pick.append("Tidak Ada di Data")
+            out.append(pick)
+    return out
+
+
+@pytest.mark.parametrize("name", ["rows", "cube"])
+def test_filter_positions_match_isin_masks(frames, name):
+    frame = frames[name]
+    index = build_filter_index(frame, f"test-filters-{name}", name)
+    rng = np.random.default_rng(2026)
+    for _ in range(150):
+        filters = random_filters(rng, frame)
+        sektor = rng.choice([None, "ICT", "Non-ICT"])
+        expected = np.flatnonzero(filter_mask(frame, *filters, sektor=sektor))
+
+        pos = filter_positions(index, len(frame), *filters, sektor=sektor)
+        got = np.arange(len(frame)) if pos is None else pos
+        np.testing.assert_array_equal(got, expected, err_msg=repr((filters, sektor)))
+
+        sub = apply_filters(frame, index, filters, sektor)
+        assert len(sub) == len(expected)
+        pd.testing.assert_series_equal(sub["Provinsi"].reset_index(drop=True),
+                                       frame["Provinsi"].iloc[expected].reset_index(drop=True))
+
+
+def test_default_filter_returns_base_frame(frames):
+    frame = frames["rows"]
+    index = build_filter_index(frame, "test-filters-rows", "rows")
+    full = [aggregation.distinct_values(frame, c) for c in DIMS[:4]] + [[]]
+    # Baris ber-Provinsi NaN tidak lolos isin → dimensi tidak boleh dilewati
+    expected = np.flatnonzero(filter_mask(frame, *full))
+    np.testing.assert_array_equal(filter_positions(index, len(frame), *full), expected)
+
+    clean = frame.dropna(subset=DIMS[:4]).reset_index(drop=True)
+    clean_index = build_filter_index(clean, "test-filters-clean", "rows")
+    full = [aggregation.distinct_values(clean, c) for c in DIMS[:4]] + [[]]
+    assert apply_filters(clean, clean_index, full) is clean
@@ -0,0 +1,101 @@
+"""Store hasil ICT lintas edit rule: hasil lama hanya dipakai ulang jika pasti sama dengan klasifikasi baru."""
+
+import copy
+import json
+import sqlite3
+
+import pandas as pd
+import pytest
+
+from rup import classification
+from rup.classification import IctMemo, changed_ict_patterns, classify_ict_series
+from test_classification import corpus
+
+
+@pytest.fixture
+def rules(tmp_path):
+    """Salinan ict_rules.json yang boleh diedit; rule asli dimuat lagi setelah tes."""
+    with open(classification.RUP_ICT_RULES, encoding="utf-8") as f:
+        base = json.load(f)
+    orig = classification.RUP_ICT_RULES
+    path = str(tmp_path / "ict_rules.json")
+
+    def write(whitelist, blacklist):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"whitelist": whitelist, "blacklist": blacklist}, f)
+        classification._rules_stamp = None  # edit cepat bisa punya mtime & ukuran sama
+        assert classification.reload_ict_rules() is None
+        return classification.ICT_RULE_HASH
+
+    classification.RUP_ICT_RULES = path
+    write(base["whitelist"], base["blacklist"])
+    yield base, write
+    classification.RUP_ICT_RULES = orig
+    classification._rules_stamp = None
+    classification.reload_ict_rules()
+
+
+def classify(names, memo):
+    is_ict, kat = classify_ict_series(names, memo)
+    return list(zip(is_ict, kat.where(kat.notna(), None)))
+
+
+def add_pattern(wl, bl):
+    wl["IoT & Smart City"].append(r"\bbibit\b")
+
+
+def move_pattern(wl, bl):
+    wl["Software"].append(wl["Hardware Komputer"].pop(0))
+
+
+def add_blacklist(wl, bl):
+    bl.append(r"\bkominfo\b")
+
+
+def reorder_categories(wl, bl):
+    items = list(wl.items())
+    wl.clear()
+    wl.update(reversed(items))
+
+
+@pytest.mark.parametrize("edit", [add_pattern, move_pattern, add_blacklist, reorder_categories])
+def test_reused_results_equal_fresh_classification(rules, tmp_path, edit):
+    (base, write), store = rules, str(tmp_path / "ict_results.sqlite")
+    names = pd.Series(corpus() + ["Pengadaan Bibit Tanaman Kominfo", "Sewa Server Kominfo"], dtype=object)
+    before = classify(names, IctMemo(store))
+
+    wl, bl = copy.deepcopy(base["whitelist"]), list(base["blacklist"])
+    edit(wl, bl)
+    write(wl, bl)
+    fresh = classify(names, None)
+    assert fresh != before  # edit benar-benar mengubah hasil sebagian nama
+
+    changed = changed_ict_patterns(base["whitelist"], base["blacklist"], wl, bl)
+    memo = IctMemo(store)
+    memo.load()
+    if edit is reorder_categories:
+        assert changed is None and memo.previous == {}  # prioritas berubah → klasifikasi ulang penuh
+    else:
+        assert changed and memo.previous  # sebagian besar nama dipakai ulang dari rule lama
+        assert not any(classification.classify_ict_name(t) != r for t, r in memo.previous.items())
+    assert classify(names, memo) == fresh
+    # Hasil rule baru tersimpan → memo berikutnya identik tanpa klasifikasi ulang
+    assert classify(names, IctMemo(store)) == fresh
+
+
+def test_store_keeps_only_latest_rule_sets(rules, tmp_path):
+    (base, write), store = rules, str(tmp_path / "ict_results.sqlite")
+    names = pd.Series(corpus(), dtype=object)
+    hashes = []
+    for i in range(classification.ICT_STORE_KEEP + 2):
+        hashes.append(write(base["whitelist"], base["blacklist"] + [rf"\bdummy{i}\b"]))
+        classify(names, IctMemo(store))
+
+    conn = sqlite3.connect(store)
+    try:
+        kept = [h for (h,) in conn.execute("SELECT rule_hash FROM ict_rules ORDER BY used DESC")]
+        stored = {h for (h,) in conn.execute("SELECT DISTINCT rule_hash FROM ict_result")}
+    finally:
+        conn.close()
+    assert kept == hashes[::-1][:classification.ICT_STORE_KEEP]
+    assert stored == set(kept)
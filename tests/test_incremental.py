@@ -0,0 +1,100 @@
+"""Refresh inkremental (enrich_incremental + PreviousSnapshot) identik dengan build penuh dari DB yang sama."""
+
+import os
+import sqlite3
+
+import pandas as pd
+import pytest
+
+from rup import classification, loading
+from rup.profiling import profile_records, start_profile, stop_profile
+
+TABLE = "rup_2026"
+
+
+@pytest.fixture
+def cache(monkeypatch, tmp_path):
+    """Cache snapshot terpisah; chunk & row group kecil → beberapa chunk lintas row group."""
+    monkeypatch.setattr(loading, "RUP_CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.setattr(loading, "RUP_CHUNK_ROWS", 7000)
+    monkeypatch.setattr(loading, "SNAPSHOT_ROW_GROUP", 5000)
+    return tmp_path / "cache"
+
+
+def bump_version(db):
+    """Versi DB baru (mtime maju) walau isinya tidak berubah."""
+    st = os.stat(db)
+    os.utime(db, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+
+
+def edit_db(db):
+    """UPDATE, DELETE, dan INSERT (termasuk nama ICT baru) — perubahan harian SiRUP."""
+    conn = sqlite3.connect(db)
+    conn.execute(f'UPDATE {TABLE} SET "Nama Paket" = \'Pengadaan Laptop dan Router Baru\', '
+                 f'"Pagu (Rp)" = \'Rp 12,345,000\' WHERE "ID RUP" % 97 = 0')
+    conn.execute(f'UPDATE {TABLE} SET "Lokasi" = NULL, "Metode" = \'Tender\' WHERE "ID RUP" % 89 = 1')
+    conn.execute(f'DELETE FROM {TABLE} WHERE "ID RUP" % 53 = 0')
+    cols = ", ".join(f'"{c}"' for c in [r[1] for r in conn.execute(f"PRAGMA table_info({TABLE})")][1:])
+    conn.execute(f'INSERT INTO {TABLE} SELECT "ID RUP" + 1000000, {cols} FROM {TABLE} WHERE "ID RUP" % 41 = 0')
+    conn.execute(f'INSERT INTO {TABLE} ("ID RUP", "Nama Paket", "Pagu (Rp)") '
+                 f'VALUES (99000001, \'Sewa Server Cloud Kominfo\', \'1000000\')')
+    conn.commit()
+    conn.close()
+    bump_version(db)
+
+
+def build(db, monkeypatch, workers, incremental):
+    monkeypatch.setattr(loading, "RUP_WORKERS", workers)
+    monkeypatch.setattr(loading, "RUP_INCREMENTAL", incremental)
+    start_profile()
+    try:
+        df = loading.build_rup_frame(db, loading.db_version(db))
+        phases = {r["phase"] for r in profile_records()}
+    finally:
+        stop_profile()
+    return df, phases
+
+
+def full_build(db, monkeypatch, tmp_path, workers):
+    """Build penuh di cache kosong terpisah (tanpa snapshot / store ICT lama)."""
+    monkeypatch.setattr(loading, "RUP_CACHE_DIR", str(tmp_path / "full"))
+    try:
+        return build(db, monkeypatch, workers, incremental=False)[0]
+    finally:
+        monkeypatch.setattr(loading, "RUP_CACHE_DIR", str(tmp_path / "cache"))
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+@pytest.mark.parametrize("change", ["edit", "none"])
+def test_incremental_matches_full_build(rup_db, cache, monkeypatch, tmp_path, workers, change):
+    build(rup_db, monkeypatch, workers, incremental=True)
+    if change == "edit":
+        edit_db(rup_db)
+    else:
+        bump_version(rup_db)
+
+    incr, phases = build(rup_db, monkeypatch, workers, incremental=True)
+    assert {"load.prev_index", "load.prev_read"} <= phases  # baris lama benar-benar dipakai ulang
+    pd.testing.assert_frame_equal(incr, full_build(rup_db, monkeypatch, tmp_path, workers))
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_snapshot_from_other_rule_hash_is_reclassified(rup_db, cache, monkeypatch, tmp_path, workers):
+    build(rup_db, monkeypatch, 1, incremental=True)
+    # Snapshot seolah dari rule ICT lain, dengan hasil klasifikasi yang kini salah
+    (old,) = cache.glob("RUP.*.parquet")
+    df = pd.read_parquet(old)
+    df["Is_ICT"] = ~df["Is_ICT"]
+    df["Sektor"] = df["Sektor"].cat.rename_categories({"ICT": "Non-ICT", "Non-ICT": "ICT"})
+    df["Kategori_ICT"] = df["Kategori_ICT"].cat.set_categories(["Lama"]).fillna("Lama")
+    stale = str(old).replace(f"-{classification.ICT_RULE_HASH}.parquet", "-0000stale.parquet")
+    assert stale != str(old)
+    df.to_parquet(stale, index=False, row_group_size=loading.SNAPSHOT_ROW_GROUP)
+    os.remove(old)
+    edit_db(rup_db)
+
+    prev = loading.previous_snapshot(rup_db, loading.db_version(rup_db))
+    assert prev is not None and prev.reclassify
+    incr, phases = build(rup_db, monkeypatch, workers, incremental=True)
+    assert "load.reclassify" in phases
+    pd.testing.assert_frame_equal(incr, full_build(rup_db, monkeypatch, tmp_path, workers))
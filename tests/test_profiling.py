@@ -0,0 +1,79 @@
+"""Catatan fase per rerun: sesi yang berjalan bersamaan tidak saling menimpa / mencampur."""
+
+import threading
+
+from rup import profiling
+from rup.profiling import phase, profile_records, record_phase, start_profile, stop_profile
+
+
+def test_concurrent_sessions_keep_their_own_records():
+    started, stopped = threading.Barrier(2), threading.Event()
+    seen = {}
+
+    def session_a():
+        start_profile()
+        record_phase("a.before", 0.1)
+        started.wait()
+        stopped.wait()  # sesi B sudah selesai & mematikan profiling-nya
+        with phase("a.after"):
+            pass
+        seen["a"] = [r["phase"] for r in profile_records()]
+
+    def session_b():
+        start_profile()
+        started.wait()
+        record_phase("b.only", 0.2)
+        seen["b"] = [r["phase"] for r in profile_records()]
+        stop_profile()
+        stopped.set()
+
+    threads = [threading.Thread(target=session_a), threading.Thread(target=session_b)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join(timeout=10)
+    assert seen == {"a": ["a.before", "a.after"], "b": ["b.only"]}
+
+
+def test_disabled_profile_records_nothing():
+    start_profile(False)
+    record_phase("x", 1.0)
+    with phase("y"):
+        pass
+    assert profile_records() is None
+    records = start_profile()
+    record_phase("z", 1.0)
+    stop_profile()
+    assert [r["phase"] for r in records] == ["z"] and profiling.profile_records() is None
+
+
+def export_script():
+    import tempfile
+
+    import pandas as pd
+    import streamlit as st
+
+    from rup.helpers import csv_export
+    from rup.profiling import export_timings, start_profile
+
+    start_profile()
+    build = csv_export((tempfile.mkdtemp(), "v1", (st.session_state.get("sesi"),)), "rows",
+                       lambda: pd.DataFrame({"a": [1, 2]}))
+    if st.session_state.get("klik"):
+        build()  # seperti klik tombol download: di luar rerun, setelah tombol dibuat
+    st.markdown(str(len(export_timings())))
+
+
+def test_export_timings_are_per_session():
+    from streamlit.testing.v1 import AppTest
+
+    a = AppTest.from_function(export_script)
+    a.session_state["sesi"], a.session_state["klik"] = "a", True
+    a.run()
+    a.run()
+    b = AppTest.from_function(export_script)
+    b.session_state["sesi"] = "b"
+    b.run()
+    assert not a.exception and not b.exception
+    assert a.markdown[0].value == "2"  # catatan tetap ada lintas rerun sesi yang sama
+    assert b.markdown[0].value == "0"
@@ -0,0 +1,68 @@
+"""Frame dasar + cube dipakai bersama antar sesi: tanpa salinan per rerun, memori per sesi terbatas."""
+
+import os
+import subprocess
+import sys
+import tracemalloc
+
+import pytest
+
+from rup import aggregation, loading
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ROWS = 20_000
+
+
+@pytest.fixture(scope="module")
+def rup_db(tmp_path_factory):
+    db = str(tmp_path_factory.mktemp("rup") / "RUP.db")
+    subprocess.run([sys.executable, os.path.join(ROOT, "tools", "gen_rup_db.py"), db,
+                    "--rows", str(ROWS)], check=True, capture_output=True)
+    return db, loading.db_version(db)
+
+
+def test_loaders_return_the_shared_objects(rup_db):
+    db, version = rup_db
+    df = loading.load_rup_data(db, version)
+    again = loading.load_rup_data(db, version)
+    assert len(df) == ROWS
+    assert again is df
+
+    cube = aggregation.build_rup_cube(df, version)
+    assert aggregation.build_rup_cube(again, version) is cube
+
+
+def test_memory_per_session_is_bounded(rup_db):
+    db, version = rup_db
+    df = loading.load_rup_data(db, version)
+    cube = aggregation.build_rup_cube(df, version)
+    base_bytes = int(df.memory_usage(deep=True).sum() + cube.memory_usage(deep=True).sum())
+    dims = ["Provinsi", "Tipe_Daerah", "Jenis_Pengadaan", "Metode"]
+    full = [list(df[c].cat.categories) for c in dims] + [[]]
+    prov = full[0][0]
+
+    def session():
+        # Satu rerun: ambil frame lewat loader ber-cache, pegang subset sektor + deep dive
+        rows_base = loading.load_rup_data(db, version)
+        cube_base = aggregation.build_rup_cube(rows_base, version)
+        rows_index = aggregation.build_filter_index(rows_base, version, "rows")
+        cube_index = aggregation.build_filter_index(cube_base, version, "cube")
+        views = []
+        for sektor in ("ICT", "Non-ICT"):
+            rows = aggregation.apply_filters(rows_base, rows_index, full, sektor)
+            sub = aggregation.apply_filters(cube_base, cube_index, full, sektor)
+            views += [rows, sub, aggregation.rows_isin(rows, "Provinsi", [prov]),
+                      aggregation.rows_isin(sub, "Provinsi", [prov])]
+        return views
+
+    session()  # indeks filter dibangun sekali, di luar pengukuran
+    n_sessions = 8
+    tracemalloc.start()
+    try:
+        held = [session() for _ in range(n_sessions)]
+        per_session = tracemalloc.get_traced_memory()[0] / n_sessions
+    finally:
+        tracemalloc.stop()
+    assert len(held) == n_sessions
+    # Hanya posisi baris per view (≤ 8 byte/baris per sektor), bukan salinan kolom
+    assert per_session < 0.05 * base_bytes, (per_session, base_bytes)
@@ -0,0 +1,211 @@
+"""
+Benchmark end-to-end dashboard (paket rup/) tanpa server Streamlit — hasil JSON untuk dibandingkan antar commit.
+
+Mengukur (backend pandas):
+  load     : build_rup_frame per fase (read SQLite, Pagu, Lokasi, klasifikasi ICT,
+             compact, concat, tulis snapshot) + baca ulang snapshot
+  cube     : build_rup_cube
+  filter   : build_filter_index + filter_positions/take_rows untuk beberapa skenario
+  sessions : memori yang dipegang per sesi (subset sektor + deep dive) vs frame dasar
+  render   : satu pass render_ringkasan (chart cache kosong) + hbar tunggal
+             (PNG matplotlib vs spec Vega-Lite RUP_CHART_MODE=vega)
+  ict      : klasifikasi nama unik dengan engine regex vs automaton (+ cek identik)
+  scaling  : (--scaling N) build_rup_frame dengan RUP_WORKERS = 1..N, speedup
+             terhadap serial + cek hasil identik
+
+Contoh:
+    python tools/gen_rup_db.py bench/RUP_1M.db --rows 1M
+    python tools/bench.py bench/RUP_1M.db --out bench/results.json
+    python tools/bench.py bench/RUP_10M.db --scaling 8
+"""
+
+import argparse
+import json
+import logging
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+import warnings
+from collections import OrderedDict
+from datetime import datetime
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Benchmark fase load/filter/render dashboard RUP.")
+    ap.add_argument("db", help="path RUP.db (mis. hasil tools/gen_rup_db.py)")
+    ap.add_argument("--out", help="tulis hasil JSON ke file (default: stdout saja)")
+    ap.add_argument("--repeat", type=int, default=5, help="ulangan skenario filter (median)")
+    ap.add_argument("--scaling", type=int, default=0, metavar="N",
+                    help="ukur enrichment paralel 1..N worker (0 = lewati)")
+    args = ap.parse_args()
+
+    # Cache snapshot/export ke folder sementara → setiap run mulai dari nol
+    tmp = tempfile.TemporaryDirectory(prefix="rup_bench_")
+    os.environ["RUP_CACHE_DIR"] = tmp.name
+    os.environ["RUP_INCREMENTAL"] = "0"
+    warnings.filterwarnings("ignore")
+    logging.getLogger("streamlit").setLevel(logging.ERROR)
+    sys.path.insert(0, ROOT)
+
+    t0 = time.perf_counter()
+    from rup import aggregation, charts, classification, loading, profiling, ui
+    import numpy as np
+    import pandas as pd
+    import_s = time.perf_counter() - t0
+    for name in list(logging.root.manager.loggerDict):
+        if name.startswith("streamlit"):
+            logging.getLogger(name).setLevel(logging.ERROR)
+
+    db = os.path.abspath(args.db)
+    version = loading.db_version(db)
+    steps = OrderedDict(import_app=round(import_s, 4))
+
+    def step(name, fn):
+        profiling.start_profile()
+        t = time.perf_counter()
+        result = fn()
+        steps[name] = {"seconds": round(time.perf_counter() - t, 4),
+                       "phases": profiling.summarize_phases(profiling.profile_records())}
+        profiling.stop_profile()
+        return result
+
+    step("load.build", lambda: loading.build_rup_frame(db, version))
+    df = step("load.snapshot", lambda: loading.load_rup_data(db, version))
+    cube = step("cube", lambda: aggregation.build_rup_cube(df, version))
+    rows_index = step("filter.index.rows", lambda: aggregation.build_filter_index(df, version, "rows"))
+    cube_index = step("filter.index.cube", lambda: aggregation.build_filter_index(cube, version, "cube"))
+
+    dims = {c: list(df[c].cat.categories) if hasattr(df[c], "cat") else sorted(df[c].dropna().unique())
+            for c in ["Provinsi", "Tipe_Daerah", "Jenis_Pengadaan", "Metode", "Satuan_Kerja"]}
+    full = [dims["Provinsi"], dims["Tipe_Daerah"], dims["Jenis_Pengadaan"], dims["Metode"], []]
+    scenarios = OrderedDict([
+        ("default", (full, None)),
+        ("sektor_ict", (full, "ICT")),
+        ("provinsi_3", ([dims["Provinsi"][:3]] + full[1:], None)),
+        ("provinsi_3_metode_2", ([dims["Provinsi"][:3], full[1], full[2], dims["Metode"][:2], []], None)),
+        ("satker_40", (full[:4] + [dims["Satuan_Kerja"][:40]], None)),
+    ])
+    filter_res = OrderedDict()
+    for name, (filters, sektor) in scenarios.items():
+        times = []
+        for _ in range(max(1, args.repeat)):
+            t = time.perf_counter()
+            sub = aggregation.apply_filters(df, rows_index, filters, sektor)
+            aggregation.apply_filters(cube, cube_index, filters, sektor)
+            times.append(time.perf_counter() - t)
+        filter_res[name] = {"median_seconds": round(statistics.median(times), 5), "rows": len(sub)}
+    steps["filter.apply"] = filter_res
+
+    # Memori per sesi: subset sektor ICT/Non-ICT + deep dive provinsi yang dipegang
+    # satu rerun (RowView → hanya posisi di atas frame dasar bersama)
+    prov = dims["Provinsi"][0]
+
+    def session_views():
+        # Frame + cube lewat loader ber-cache seperti rerun di app (cache_resource → objek sama)
+        rows_base = loading.load_rup_data(db, version)
+        cube_base = aggregation.build_rup_cube(rows_base, version)
+        views = []
+        for sektor in ("ICT", "Non-ICT"):
+            rows = aggregation.apply_filters(rows_base, rows_index, full, sektor)
+            sub = aggregation.apply_filters(cube_base, cube_index, full, sektor)
+            aggregation.cube_top(sub, "Provinsi", 10, satker=True)
+            views += [rows, sub, aggregation.rows_isin(rows, "Provinsi", [prov]),
+                      aggregation.rows_isin(sub, "Provinsi", [prov])]
+        return views
+
+    n_sessions = 8
+    tracemalloc.start()
+    held = [session_views() for _ in range(n_sessions)]
+    per_session = tracemalloc.get_traced_memory()[0] / n_sessions
+    tracemalloc.stop()
+    del held
+    steps["sessions"] = OrderedDict(
+        sessions=n_sessions,
+        base_bytes=int(df.memory_usage(deep=True).sum() + cube.memory_usage(deep=True).sum()),
+        bytes_per_session=int(per_session))
+
+    # Render: chart cache dikosongkan → hbar benar-benar digambar
+    cache = charts.chart_cache()
+    export_ctx = (os.path.join(tmp.name, "exports"), version, ("bench",))
+
+    def render():
+        cache.clear()
+        totals = aggregation.cube_totals(cube)
+        ui.render_ringkasan(df, cube, totals["pagu"], "Semua Sektor", "bench", export_ctx)
+    step("render_ringkasan", render)
+
+    def one_hbar():
+        cache.clear()
+        top = aggregation.cube_top(cube, "Provinsi", 10)
+        return charts.hbar_png(top, "Total_Pagu", "Provinsi", "Top 10 Provinsi", "bench",
+                               ("Blues_r", len(top)), aggregation.cube_totals(cube)["pagu"])
+    step("hbar", one_hbar)
+
+    def one_hbar_vega():
+        top = aggregation.cube_top(cube, "Provinsi", 10)
+        return charts.hbar_spec(top, "Total_Pagu", "Provinsi", "Top 10 Provinsi", "bench",
+                                ("Blues_r", len(top)), aggregation.cube_totals(cube)["pagu"])
+    step("hbar.vega", one_hbar_vega)
+
+    names = [str(v) for v in df["Nama_Paket"].dropna().unique()]
+    ict = OrderedDict(names=len(names))
+    results = {}
+    for engine, fn in [("regex", classification.classify_ict_text), ("automaton", classification.classify_ict_tokens)]:
+        t = time.perf_counter()
+        results[engine] = [fn(v) for v in names]
+        ict[engine] = round(time.perf_counter() - t, 4)
+    ict["identical"] = results["regex"] == results["automaton"]
+    steps["ict"] = ict
+
+    if args.scaling:
+        scaling = []
+        for n in range(1, args.scaling + 1):
+            loading.RUP_WORKERS = n
+            workers = loading.enrich_workers()
+            t = time.perf_counter()
+            part = loading.build_rup_frame(db, version)
+            sec = time.perf_counter() - t
+            scaling.append({"workers": workers, "seconds": round(sec, 4),
+                            "speedup": round(scaling[0]["seconds"] / sec, 3) if scaling else 1.0,
+                            "identical": bool(part.equals(df))})
+            del part
+        steps["scaling"] = scaling
+
+    result = OrderedDict(
+        commit=git_commit(),
+        timestamp=datetime.now().isoformat(timespec="seconds"),
+        db=db,
+        rows=len(df),
+        cube_rows=len(cube),
+        python=platform.python_version(),
+        pandas=pd.__version__,
+        numpy=np.__version__,
+        cpu_count=os.cpu_count(),
+        steps=steps,
+    )
+    text = json.dumps(result, indent=2, default=float)
+    if args.out:
+        os.makedirs(os.path.dirname(os.path.abspath(args.out)), exist_ok=True)
+        with open(args.out, "w") as f:
+            f.write(text + "\n")
+    print(text)
+    tmp.cleanup()
+
+
+if __name__ == "__main__":
+    main()
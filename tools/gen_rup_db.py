@@ -0,0 +1,244 @@
+"""
+Generator RUP.db sintetis untuk benchmark (1M / 5M / 10M baris).
+
+Skema & format kolom mengikuti export SiRUP yang dibaca app.py:
+  - Lokasi "Provinsi, Daerah (Kab.)" / "(Kota)", sebagian multi-lokasi "A | B",
+    sebagian hanya provinsi / kosong
+  - Nama Paket: kena whitelist ICT, kena blacklist (termasuk yang juga memuat
+    keyword ICT), dan yang tidak kena keduanya
+  - Pagu (Rp) sebagai teks dengan pemisah ribuan ("1,250,000,000", "Rp ...")
+  - Pemilihan "<Month> 2026"
+
+Contoh:
+    python tools/gen_rup_db.py bench/RUP_1M.db --rows 1M
+    python tools/gen_rup_db.py bench/RUP_10M.db --rows 10M --seed 7
+"""
+
+import argparse
+import os
+import sqlite3
+import time
+
+import numpy as np
+
+WILAYAH = {
+    "Aceh": [("Banda Aceh", "Kota"), ("Aceh Besar", "Kab."), ("Pidie", "Kab.")],
+    "Sumatera Utara": [("Medan", "Kota"), ("Deli Serdang", "Kab."), ("Simalungun", "Kab."), ("Langkat", "Kab.")],
+    "Sumatera Barat": [("Padang", "Kota"), ("Agam", "Kab."), ("Pesisir Selatan", "Kab.")],
+    "Riau": [("Pekanbaru", "Kota"), ("Kampar", "Kab."), ("Bengkalis", "Kab.")],
+    "Kepulauan Riau": [("Batam", "Kota"), ("Bintan", "Kab.")],
+    "Jambi": [("Jambi", "Kota"), ("Muaro Jambi", "Kab.")],
+    "Sumatera Selatan": [("Palembang", "Kota"), ("Ogan Komering Ilir", "Kab."), ("Musi Banyuasin", "Kab.")],
+    "Bangka Belitung": [("Pangkal Pinang", "Kota"), ("Bangka", "Kab.")],
+    "Bengkulu": [("Bengkulu", "Kota"), ("Rejang Lebong", "Kab.")],
+    "Lampung": [("Bandar Lampung", "Kota"), ("Lampung Tengah", "Kab."), ("Way Kanan", "Kab.")],
+    "DKI Jakarta": [("Jakarta Pusat", "Kota"), ("Jakarta Selatan", "Kota"), ("Jakarta Timur", "Kota"),
+                    ("Kepulauan Seribu", "Kab.")],
+    "Jawa Barat": [("Bandung", "Kota"), ("Bogor", "Kab."), ("Bekasi", "Kab."), ("Depok", "Kota"),
+                   ("Cirebon", "Kab."), ("Garut", "Kab.")],
+    "Banten": [("Tangerang", "Kota"), ("Serang", "Kab."), ("Lebak", "Kab.")],
+    "Jawa Tengah": [("Semarang", "Kota"), ("Surakarta", "Kota"), ("Banyumas", "Kab."), ("Cilacap", "Kab."),
+                    ("Kudus", "Kab.")],
+    "DI Yogyakarta": [("Yogyakarta", "Kota"), ("Sleman", "Kab."), ("Bantul", "Kab.")],
+    "Jawa Timur": [("Surabaya", "Kota"), ("Malang", "Kota"), ("Sidoarjo", "Kab."), ("Jember", "Kab."),
+                   ("Banyuwangi", "Kab.")],
+    "Bali": [("Denpasar", "Kota"), ("Badung", "Kab."), ("Gianyar", "Kab.")],
+    "Nusa Tenggara Barat": [("Mataram", "Kota"), ("Lombok Timur", "Kab.")],
+    "Nusa Tenggara Timur": [("Kupang", "Kota"), ("Manggarai", "Kab."), ("Sikka", "Kab.")],
+    "Kalimantan Barat": [("Pontianak", "Kota"), ("Kubu Raya", "Kab.")],
+    "Kalimantan Tengah": [("Palangka Raya", "Kota"), ("Kotawaringin Timur", "Kab.")],
+    "Kalimantan Selatan": [("Banjarmasin", "Kota"), ("Banjar", "Kab.")],
+    "Kalimantan Timur": [("Samarinda", "Kota"), ("Balikpapan", "Kota"), ("Kutai Kartanegara", "Kab.")],
+    "Kalimantan Utara": [("Tarakan", "Kota"), ("Bulungan", "Kab.")],
+    "Sulawesi Utara": [("Manado", "Kota"), ("Minahasa", "Kab.")],
+    "Gorontalo": [("Gorontalo", "Kota"), ("Bone Bolango", "Kab.")],
+    "Sulawesi Tengah": [("Palu", "Kota"), ("Banggai", "Kab.")],
+    "Sulawesi Barat": [("Mamuju", "Kab."), ("Polewali Mandar", "Kab.")],
+    "Sulawesi Selatan": [("Makassar", "Kota"), ("Gowa", "Kab."), ("Bone", "Kab."), ("Maros", "Kab.")],
+    "Sulawesi Tenggara": [("Kendari", "Kota"), ("Konawe", "Kab.")],
+    "Maluku": [("Ambon", "Kota"), ("Maluku Tengah", "Kab.")],
+    "Maluku Utara": [("Ternate", "Kota"), ("Halmahera Utara", "Kab.")],
+    "Papua": [("Jayapura", "Kota"), ("Keerom", "Kab.")],
+    "Papua Barat": [("Manokwari", "Kab."), ("Fakfak", "Kab.")],
+    "Papua Barat Daya": [("Sorong", "Kota"), ("Raja Ampat", "Kab.")],
+    "Papua Tengah": [("Nabire", "Kab."), ("Mimika", "Kab.")],
+    "Papua Pegunungan": [("Jayawijaya", "Kab."), ("Lanny Jaya", "Kab.")],
+    "Papua Selatan": [("Merauke", "Kab."), ("Mappi", "Kab.")],
+}
+# Bobot kasar jumlah paket per provinsi (Jawa dominan)
+BOBOT_PROV = {"DKI Jakarta": 10, "Jawa Barat": 12, "Jawa Tengah": 10, "Jawa Timur": 12, "Banten": 4,
+              "Sumatera Utara": 5, "Sulawesi Selatan": 4, "DI Yogyakarta": 2, "Bali": 2}
+
+PAKET_ICT = [
+    "Belanja Langganan Internet", "Pengadaan Laptop", "Pengadaan Komputer Desktop", "Sewa Cloud Server",
+    "Pengadaan CCTV dan NVR", "Pengembangan Aplikasi E-Office", "Pemeliharaan Sistem Informasi Kepegawaian",
+    "Langganan Bandwidth Metro Ethernet", "Pengadaan Router dan Switch", "Belanja Pulsa dan Paket Data",
+    "Lisensi Software Antivirus", "Pengadaan Server dan Storage", "Jasa Colocation Data Center",
+    "Pengadaan Perangkat Video Conference", "Pembangunan Jaringan Fiber Optic", "Pengadaan Firewall",
+    "Maintenance Jaringan LAN", "Pengadaan Access Point Wi-Fi", "Pengadaan GPS Tracker Kendaraan Operasional",
+    "Pengembangan Website Resmi", "Smart City Command Center",
+]
+PAKET_BLACKLIST = [
+    "Pengadaan Obat dan Vaksin", "Belanja Makanan dan Minuman Rapat", "Pembangunan Gedung Kantor (Konstruksi)",
+    "Belanja ATK", "Pengadaan Kendaraan Dinas", "Pengadaan Alat Kesehatan", "Belanja Tinta dan Toner Printer",
+    "Pengadaan Seragam Dinas", "Pengadaan Buku Perpustakaan", "Pengadaan Printer dan Laptop",
+    "Belanja Server Makanan Katering", "Pengadaan Mobil Ambulans", "Rehabilitasi Bangunan Sekolah",
+]
+PAKET_LAIN = [
+    "Jasa Kebersihan Kantor", "Belanja Perjalanan Dinas", "Honorarium Narasumber", "Jasa Keamanan Gedung",
+    "Pemeliharaan Jalan Lingkungan", "Belanja Bahan Bakar Minyak", "Jasa Konsultansi Perencanaan",
+    "Pengadaan Bibit Tanaman", "Belanja Sewa Gedung Pertemuan", "Pengadaan Meubelair",
+    "Jasa Tenaga Pendukung Administrasi", "Belanja Listrik dan Air", "Aplikasi Lamaran Kerja Manual",
+    "Zoom In Kamera Dokumentasi Kegiatan", "Pelatihan Peningkatan Kapasitas Aparatur",
+]
+DINAS = ["Dinas Pendidikan", "Dinas Kesehatan", "Dinas Pekerjaan Umum", "Dinas Komunikasi dan Informatika",
+         "Badan Perencanaan Pembangunan Daerah", "Sekretariat Daerah", "Dinas Perhubungan", "Dinas Sosial",
+         "Badan Pengelola Keuangan Daerah", "RSUD", "Dinas Kependudukan dan Pencatatan Sipil", "Inspektorat"]
+KEMENTERIAN = ["Kementerian Kesehatan", "Kementerian Keuangan", "Kementerian Agama",
+               "Kementerian Pekerjaan Umum", "Kementerian Pendidikan Dasar dan Menengah",
+               "Kementerian Komunikasi dan Digital", "Kepolisian Negara Republik Indonesia",
+               "Badan Pusat Statistik"]
+UNIT_PUSAT = ["Kantor Wilayah", "Balai Besar", "Kantor Pelayanan", "Satuan Kerja Perangkat", "Balai Teknik"]
+JENIS = ["Barang", "Jasa Lainnya", "Pekerjaan Konstruksi", "Jasa Konsultansi"]
+BOBOT_JENIS = [0.45, 0.35, 0.12, 0.08]
+METODE = ["E-Purchasing", "Pengadaan Langsung", "Tender", "Dikecualikan", "Seleksi", "Penunjukan Langsung",
+          "Tender Cepat"]
+BOBOT_METODE = [0.30, 0.35, 0.12, 0.12, 0.04, 0.04, 0.03]
+BULAN = ["January", "February", "March", "April", "May", "June", "July", "August", "September", "October",
+         "November", "December"]
+
+KOLOM = ["ID RUP", "Nama Paket", "Pagu (Rp)", "Jenis Pengadaan", "Metode", "K/L/PD", "Satuan Kerja",
+         "Lokasi", "Pemilihan", "Usaha Kecil/Koperasi", "Produk Dalam Negeri"]
+
+
+def parse_rows(text):
+    """'1M' / '500k' / '1000000' → int."""
+    text = text.strip().lower().replace("_", "")
+    mult = {"k": 1_000, "m": 1_000_000}.get(text[-1], 1)
+    return int(float(text[:-1] if mult > 1 else text) * mult)
+
+
+def build_wilayah():
+    """Tabel daerah: lokasi, provinsi, label daerah, K/L/PD pemda, bobot."""
+    lokasi, prov, label, klpd_pemda, bobot = [], [], [], [], []
+    for p, daerah in WILAYAH.items():
+        w = BOBOT_PROV.get(p, 1.5) / len(daerah)
+        for nama, tipe in daerah:
+            lokasi.append(f"{p}, {nama} ({tipe})")
+            prov.append(p)
+            lbl = f"{'Kabupaten' if tipe == 'Kab.' else 'Kota'} {nama}"
+            label.append(lbl)
+            klpd_pemda.append(f"Pemerintah Daerah {lbl}")
+            bobot.append(w)
+    bobot = np.array(bobot) / sum(bobot)
+    return (np.array(lokasi, dtype=object), np.array(prov, dtype=object),
+            np.array(label, dtype=object), np.array(klpd_pemda, dtype=object), bobot)
+
+
+def gen_chunk(rng, start, n, wil):
+    lokasi_w, prov_w, label_w, pemda_w, bobot_w = wil
+    d = rng.choice(len(lokasi_w), n, p=bobot_w)
+
+    # Lokasi: 4% multi-lokasi, 1% hanya provinsi, 1% kosong
+    lokasi = lokasi_w[d].copy()
+    r = rng.random(n)
+    multi = r < 0.04
+    lokasi[multi] = lokasi[multi] + " | " + lokasi_w[rng.choice(len(lokasi_w), multi.sum())]
+    only_prov = (r >= 0.04) & (r < 0.05)
+    lokasi[only_prov] = prov_w[d[only_prov]]
+    lokasi[(r >= 0.05) & (r < 0.06)] = None
+
+    # K/L/PD & Satker: 70% pemda kab/kota, 10% pemprov, 20% kementerian/lembaga
+    k = rng.random(n)
+    dinas = rng.choice(len(DINAS), n)
+    kem = rng.choice(len(KEMENTERIAN), n)
+    unit = rng.choice(len(UNIT_PUSAT), n)
+    klpd, satker = [], []
+    for i in range(n):
+        if k[i] < 0.70:
+            klpd.append(pemda_w[d[i]])
+            satker.append(f"{DINAS[dinas[i]]} {label_w[d[i]]}")
+        elif k[i] < 0.80:
+            klpd.append(f"Pemerintah Daerah Provinsi {prov_w[d[i]]}")
+            satker.append(f"{DINAS[dinas[i]]} Provinsi {prov_w[d[i]]}")
+        else:
+            klpd.append(KEMENTERIAN[kem[i]])
+            satker.append(f"{UNIT_PUSAT[unit[i]]} {KEMENTERIAN[kem[i]]} {prov_w[d[i]]}")
+
+    # Nama Paket: 25% ICT, 20% blacklist, sisanya lain; suffix → ~nama unik bervariasi
+    kind = rng.random(n)
+    t_ict = rng.choice(len(PAKET_ICT), n)
+    t_bl = rng.choice(len(PAKET_BLACKLIST), n)
+    t_lain = rng.choice(len(PAKET_LAIN), n)
+    suffix = rng.choice(4, n)
+    nomor = rng.integers(1, 500, n)
+    nama = []
+    for i in range(n):
+        if kind[i] < 0.25:
+            base = PAKET_ICT[t_ict[i]]
+        elif kind[i] < 0.45:
+            base = PAKET_BLACKLIST[t_bl[i]]
+        else:
+            base = PAKET_LAIN[t_lain[i]]
+        s = suffix[i]
+        if s == 0:
+            nama.append(base)
+        elif s == 1:
+            nama.append(f"{base} Tahun Anggaran 2026")
+        elif s == 2:
+            nama.append(f"{base} {satker[i]}")
+        else:
+            nama.append(f"{base} Paket {nomor[i]}")
+    nama = np.array(nama, dtype=object)
+    nama[rng.random(n) < 0.002] = None
+
+    # Pagu: log-normal (median ~Rp 150 Jt), dibulatkan ribuan, teks dengan pemisah
+    pagu = (np.exp(rng.normal(18.8, 1.9, n)).astype(np.int64) // 1000 + 1) * 1000
+    fmt = rng.random(n)
+    pagu_s = [f"{v:,}" if f < 0.4 else f"Rp {v:,}" if f < 0.6 else f"{v}.0" if f < 0.7 else str(v)
+              for v, f in zip(pagu.tolist(), fmt)]
+
+    jenis = np.array(JENIS, dtype=object)[rng.choice(len(JENIS), n, p=BOBOT_JENIS)]
+    metode = np.array(METODE, dtype=object)[rng.choice(len(METODE), n, p=BOBOT_METODE)]
+    bulan = np.array([f"{b} 2026" for b in BULAN], dtype=object)[rng.choice(12, n)]
+    uk = np.where(rng.random(n) < 0.6, "Ya", "Tidak").astype(object)
+    pdn = np.where(rng.random(n) < 0.8, "Ya", "Tidak").astype(object)
+    ids = range(40_000_000 + start, 40_000_000 + start + n)
+    return zip(ids, nama, pagu_s, jenis, metode, klpd, satker, lokasi, bulan, uk, pdn)
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Tulis RUP.db sintetis untuk benchmark.")
+    ap.add_argument("out", help="path SQLite output (ditimpa jika ada)")
+    ap.add_argument("--rows", default="1M", help="jumlah baris, mis. 1M / 5M / 10M / 250k")
+    ap.add_argument("--seed", type=int, default=2026)
+    ap.add_argument("--chunk", type=int, default=200_000)
+    ap.add_argument("--table", default="rup_2026")
+    args = ap.parse_args()
+
+    rows = parse_rows(args.rows)
+    if os.path.exists(args.out):
+        os.remove(args.out)
+    os.makedirs(os.path.dirname(os.path.abspath(args.out)), exist_ok=True)
+
+    rng = np.random.default_rng(args.seed)
+    wil = build_wilayah()
+    t0 = time.perf_counter()
+    conn = sqlite3.connect(args.out)
+    conn.execute("PRAGMA journal_mode=OFF")
+    conn.execute("PRAGMA synchronous=OFF")
+    cols = ", ".join(f'"{c}" {"INTEGER" if c == "ID RUP" else "TEXT"}' for c in KOLOM)
+    conn.execute(f'CREATE TABLE "{args.table}" ({cols})')
+    insert = f'INSERT INTO "{args.table}" VALUES ({", ".join("?" * len(KOLOM))})'
+    for start in range(0, rows, args.chunk):
+        n = min(args.chunk, rows - start)
+        conn.executemany(insert, gen_chunk(rng, start, n, wil))
+        conn.commit()
+        print(f"  {start + n:,} / {rows:,} baris", flush=True)
+    conn.close()
+    print(f"✅ {args.out}: {rows:,} baris, {os.path.getsize(args.out) / 2**20:.0f} MB, "
+          f"{time.perf_counter() - t0:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+Precompute headless — bangun bundle siap-saji untuk satu RUP.db tanpa server Streamlit.
+
+Jalankan setelah tarik data SiRUP (mis. cron malam). Memakai fungsi load /
+agregasi / render paket rup/ apa adanya, lalu menulis .rup_cache/<db>.<versi>.bundle:
+  frame.parquet      hasil enrichment (klasifikasi ICT, Lokasi, Pagu)
+  cube.parquet       agregat build_rup_cube
+  filter_*.npz       indeks filter (baris & cube)
+  charts/<key>.png   chart tampilan default ketiga sektor (key = chart_key)
+  manifest.json      versi data, rule hash, jumlah baris, layout indeks
+Indeks pencarian FTS5 (<db>.<versi>.fts) ikut dibangun. App yang menemukan
+bundle untuk versi data yang sama langsung memakainya saat boot.
+
+Contoh:
+    python tools/precompute.py RUP.db
+    RUP_WORKERS=0 python tools/precompute.py /data/RUP.db --force
+"""
+
+import argparse
+import json
+import logging
+import os
+import sys
+import time
+import warnings
+from collections import OrderedDict
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Bangun bundle siap-saji dashboard RUP.")
+    ap.add_argument("db", help="path RUP.db (sama dengan yang dibuka app)")
+    ap.add_argument("--force", action="store_true", help="bangun ulang walau bundle versi ini sudah ada")
+    args = ap.parse_args()
+
+    warnings.filterwarnings("ignore")
+    logging.getLogger("streamlit").setLevel(logging.ERROR)
+    sys.path.insert(0, ROOT)
+    from rup import aggregation, bundle, loading, profiling, search, ui
+    for name in list(logging.root.manager.loggerDict):
+        if name.startswith("streamlit"):
+            logging.getLogger(name).setLevel(logging.ERROR)
+
+    db = os.path.abspath(args.db)
+    if not os.path.exists(db):
+        sys.exit(f"{db}: tidak ditemukan")
+    version = loading.db_version(db)
+    path = loading.bundle_path(db, version)
+    manifest = os.path.join(path, "manifest.json")
+    if os.path.exists(manifest) and not args.force:
+        with open(manifest, encoding="utf-8") as f:
+            fmt = json.load(f).get("format")
+        if fmt == bundle.BUNDLE_FORMAT:  # format lama → dibangun ulang (app tidak memakainya)
+            print(f"Bundle {version} sudah ada: {path}")
+            return
+
+    steps = OrderedDict()
+
+    def step(name, fn):
+        profiling.start_profile()
+        t = time.perf_counter()
+        result = fn()
+        steps[name] = {"seconds": round(time.perf_counter() - t, 3),
+                       "phases": profiling.summarize_phases(profiling.profile_records())}
+        profiling.stop_profile()
+        return result
+
+    df = step("load", lambda: loading.load_rup_data(db, version))
+    if df.empty:
+        sys.exit(f"{db}: database kosong atau tidak dapat dibaca")
+    cube = step("cube", lambda: aggregation.build_rup_cube(df, version))
+    indexes = step("filter_index", lambda: {name: aggregation.build_filter_index(frame, version, name)
+                                            for name, frame in [("rows", df), ("cube", cube)]})
+    step("search_index", lambda: search.load_search_index(df, db, version))
+    charts = step("charts", lambda: ui.prerender_default_views(
+        df, cube, version, os.path.join(loading.cache_dir(db), "exports")))
+    step("write", lambda: bundle.write_rup_bundle(db, version, df, cube, indexes, charts))
+
+    print(json.dumps(OrderedDict(bundle=path, version=version, rows=len(df), cube_rows=len(cube),
+                                 charts=len(charts), steps=steps), indent=2, default=float))
+
+
+if __name__ == "__main__":
+    main()